@@ -0,0 +1,318 @@
+"""Host for many chatbot accounts in one process.
+
+Every account is a session of its own, but the sessions share a small pool of gRPC
+channels, one event loop thread, the reply engines and the quotes. Messages of all
+accounts are handled on the event loop; expensive reply engines run in the shared
+process pool as in chatbot.py.
+"""
+
+# For compatibility between python 2 and 3
+from __future__ import print_function
+
+import argparse
+import base64
+import collections
+from concurrent import futures
+import json
+import random
+import threading
+import time
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+import grpc
+
+from tinode_grpc import pb
+from tinode_grpc.session import RequestError, Session
+
+import chatbot
+
+# Stack size of the threads which read the streams of the accounts. The default of
+# several MB would make a thread cost more than the rest of the account.
+READER_STACK_SIZE = 256 * 1024
+
+class Bot(object):
+    """One account: its session and counters. Everything but connect() and login() runs
+    on the event loop, connect() only hands the new session over to it."""
+    def __init__(self, host, channel, name, schema, secret, cookie_file_name=None):
+        self.host = host
+        self.channel = channel
+        self.name = name
+        # Credentials the account was configured with, kept to log in again when the
+        # token stops working.
+        self.schema = schema
+        self.secret = secret
+        # Token received at the last login.
+        self.token = None
+        self.cookie_file_name = cookie_file_name
+        self.uid = None
+        self.session = None
+        self.subscriptions = set()
+        self.metrics = collections.Counter()
+        # Failed logins in a row and when to try again.
+        self.failures = 0
+        self.retry_at = 0
+
+    def connect(self):
+        """Open a new session and login. Called from the connecting threads: returns once
+        the event loop has replaced the old session with the new one."""
+        try:
+            session, params = self.login()
+        except Exception as err:
+            self.host.post(self, ('login_failed',))
+            print(self.name, "failed to login:", err)
+            self.failures += 1
+            self.retry_at = time.time() + min(300, 3 * 2 ** self.failures)
+            return False
+        self.failures = 0
+        # Use the token next time: it saves a password check when reconnecting.
+        self.token = base64.b64decode(json.loads(params['token'].decode('utf-8')).encode('ascii'))
+        if self.cookie_file_name != None:
+            chatbot.save_auth_cookie(self.cookie_file_name, params)
+        installed = threading.Event()
+        self.host.post(self, ('connected', session, json.loads(params['user'].decode('utf-8')), installed))
+        installed.wait()
+        return True
+
+    def new_session(self):
+        return Session(None, lambda msg: self.host.post(self, msg), self.channel)
+
+    def login(self):
+        """Login with the token from the last login if there is one, with the configured
+        credentials if there is none or the server rejects it. Returns the new session
+        and the params of the login response."""
+        app_name = chatbot.APP_NAME + '/' + chatbot.APP_VERSION
+        session = self.new_session()
+        try:
+            if self.token != None:
+                try:
+                    return session, session.login(app_name, 'token', self.token)
+                except RequestError as err:
+                    self.token = None
+                    if self.schema == 'token':
+                        raise
+                    print(self.name, "token rejected, logging in with the password:", err)
+                    session.close()
+                    session = self.new_session()
+            return session, session.login(app_name, self.schema, self.secret)
+        except Exception:
+            session.close()
+            raise
+
+    def alive(self):
+        return self.session != None and self.session.reader.is_alive()
+
+    def subscribe(self, topic):
+        session = self.session
+        session.request('sub', pb.ClientSub(topic=topic)).add_done_callback(
+            lambda f: self.host.post(self, ('subscribed', topic, f, session)))
+
+    def handle(self, event):
+        if isinstance(event, tuple):
+            getattr(self, 'on_' + event[0])(*event[1:])
+        elif event.HasField('data'):
+            self.on_data(event.data)
+        elif event.HasField('pres'):
+            self.on_pres(event.pres)
+
+    def on_data(self, data):
+        # Don't let the bots talk to each other or to themselves forever.
+        if data.from_user_id in self.host.uids:
+            return
+        self.metrics['received'] += 1
+        self.session.post(chatbot.note_read(data.topic, data.seq_id))
+        started = time.time()
+        topic = data.topic
+        self.host.replier.respond(topic, chatbot.message_text(data.content),
+            lambda reply: self.host.post(self, ('reply', topic, reply, started)), self.uid)
+
+    def on_pres(self, pres):
+        # Wait for peers to appear online and subscribe to their topics
+        if pres.topic != 'me':
+            return
+        if (pres.what == pb.ServerPres.ON or pres.what == pb.ServerPres.MSG) and pres.src not in self.subscriptions:
+            self.subscribe(pres.src)
+        elif pres.what == pb.ServerPres.OFF and pres.src in self.subscriptions:
+            self.subscriptions.discard(pres.src)
+            self.session.request('leave', pb.ClientLeave(topic=pres.src))
+            chatbot.quotes.forget((self.uid, pres.src))
+
+    def on_reply(self, topic, reply, started):
+        self.session.send(chatbot.publish(topic, reply))
+        self.metrics['replied'] += 1
+        self.metrics['reply ms'] += int((time.time() - started) * 1000)
+
+    def on_subscribed(self, topic, future, session):
+        if session is not self.session:
+            # Subscribed by the session replaced since.
+            return
+        try:
+            ctrl, _ = future.result()
+        except Exception:
+            return
+        if ctrl != None and ctrl.code < 400:
+            self.subscriptions.add(topic)
+        else:
+            self.metrics['errors'] += 1
+
+    def on_connected(self, session, uid, installed):
+        try:
+            if self.session != None:
+                self.session.close()
+                self.metrics['reconnects'] += 1
+            self.session = session
+            self.uid = uid
+            self.host.uids.add(uid)
+            self.subscriptions = set()
+            self.subscribe('me')
+        finally:
+            installed.set()
+
+    def on_login_failed(self):
+        self.metrics['login failures'] += 1
+
+class BotHost(object):
+    def __init__(self, addr, channels, replier):
+        self.channels = [grpc.insecure_channel(addr) for _ in range(channels)]
+        self.replier = replier
+        self.bots = []
+        # User IDs of all hosted accounts.
+        self.uids = set()
+        self.events = queue.Queue()
+
+    def add(self, name, schema, secret, cookie_file_name=None):
+        channel = self.channels[len(self.bots) % len(self.channels)]
+        self.bots.append(Bot(self, channel, name, schema, secret, cookie_file_name))
+
+    def post(self, bot, event):
+        self.events.put((bot, event))
+
+    def connect(self, bots, concurrency):
+        """Connect the bots, returns the number of bots connected"""
+        pool = futures.ThreadPoolExecutor(max_workers=concurrency)
+        results = pool.map(lambda bot: bot.connect(), bots)
+        connected = sum(1 for ok in results if ok)
+        pool.shutdown()
+        return connected
+
+    def run_loop(self):
+        while True:
+            bot, event = self.events.get()
+            if bot == None:
+                return
+            try:
+                bot.handle(event)
+            except Exception as err:
+                bot.metrics['errors'] += 1
+                print(bot.name, "failed to handle event:", err)
+
+    def stats(self):
+        """Counters of every account and the totals"""
+        total = collections.Counter()
+        accounts = {}
+        for bot in self.bots:
+            accounts[bot.name] = dict(bot.metrics, uid=bot.uid, online=bot.alive(), topics=len(bot.subscriptions))
+            total.update(bot.metrics)
+        total['online'] = sum(1 for bot in self.bots if bot.alive())
+        return accounts, total
+
+    def close(self):
+        self.events.put((None, None))
+        for bot in self.bots:
+            if bot.session != None:
+                bot.session.close()
+        for channel in self.channels:
+            channel.close()
+
+def load_accounts(host, args):
+    for cookie_file_name in args.cookie:
+        try:
+            schema, secret = chatbot.read_auth_cookie(cookie_file_name)
+        except Exception as err:
+            print("Failed to read authentication cookie", cookie_file_name, err)
+            continue
+        if schema == None:
+            print("Authentication scheme not defined in", cookie_file_name)
+            continue
+        host.add(cookie_file_name, schema, secret, cookie_file_name)
+    if args.tokens:
+        with open(args.tokens) as f:
+            for idx, line in enumerate(f):
+                token = line.strip()
+                if token:
+                    host.add('%s:%d' % (args.tokens, idx + 1), 'token', base64.b64decode(token.encode('ascii')))
+
+def print_stats(host, stats_file):
+    accounts, total = host.stats()
+    replied = total['replied']
+    print("Online %d/%d, received %d, replied %d, avg reply %.1f ms, reconnects %d, errors %d" % (
+        total['online'], len(host.bots), total['received'], replied,
+        total['reply ms'] / float(replied) if replied else 0, total['reconnects'],
+        total['errors'] + total['login failures']))
+    if stats_file:
+        with open(stats_file, 'w') as f:
+            json.dump(accounts, f, indent=1, sort_keys=True)
+
+def run(args):
+    print("Loaded {} quotes".format(chatbot.load_quotes(args.quotes)))
+    if args.reload_quotes > 0:
+        chatbot.watch_quotes(args.quotes, args.reload_quotes)
+    replier = chatbot.init_replier(args.engine, args.cache_size, args.cache_ttl, args.workers)
+
+    host = BotHost(args.host, args.channels, replier)
+    load_accounts(host, args)
+    if not host.bots:
+        print("Error: no accounts to run")
+        return
+
+    threading.stack_size(READER_STACK_SIZE)
+    loop = threading.Thread(target=host.run_loop)
+    loop.daemon = True
+    loop.start()
+
+    print("Connecting", len(host.bots), "accounts to", args.host, "over", args.channels, "channels")
+    print("Connected", host.connect(host.bots, args.login_concurrency))
+
+    try:
+        last_stats = time.time()
+        while True:
+            time.sleep(3)
+            # Reconnect accounts which lost the connection to the server.
+            now = time.time()
+            dead = [bot for bot in host.bots if not bot.alive() and bot.retry_at <= now]
+            if dead:
+                host.connect(dead, args.login_concurrency)
+            if args.stats_interval > 0 and time.time() - last_stats >= args.stats_interval:
+                last_stats = time.time()
+                print_stats(host, args.stats_file)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print_stats(host, args.stats_file)
+        host.close()
+
+if __name__ == '__main__':
+    random.seed()
+
+    purpose = "Host for many Tinode chatbot accounts in one process."
+    parser = argparse.ArgumentParser(description=purpose)
+    parser.add_argument('cookie', nargs='*', help='cookie files with credentials of the accounts, as used by chatbot.py --login-cookie')
+    parser.add_argument('--tokens', help='file with authentication tokens of more accounts, one per line, as saved in cookie files')
+    parser.add_argument('--host', default='localhost:6061', help='address of Tinode server gRPC endpoint')
+    parser.add_argument('--channels', type=int, default=4, help='number of gRPC channels shared by the accounts')
+    parser.add_argument('--login-concurrency', type=int, default=16, help='number of accounts to login at once')
+    parser.add_argument('--stats-interval', type=float, default=60, help='print totals every N seconds, 0 to disable')
+    parser.add_argument('--stats-file', help='write counters of every account as JSON to this file along with the totals')
+    parser.add_argument('--quotes', default='quotes.txt', help='file with messages for the chatbot to use, one message per line')
+    parser.add_argument('--reload-quotes', type=float, default=5, help='check quotes file for changes every N seconds and reload it, 0 to disable')
+    parser.add_argument('--engine', action='append', default=[], help='reply engine as module:factory, may be repeated; engines are tried in order, quotes are used last')
+    parser.add_argument('--cache-size', type=int, default=1024, help='number of replies to cache, 0 to disable caching')
+    parser.add_argument('--cache-ttl', type=float, default=600, help='seconds to keep cached replies')
+    parser.add_argument('--workers', type=int, default=2, help='size of the process pool for expensive reply engines')
+    args = parser.parse_args()
+
+    if not args.cookie and not args.tokens:
+        parser.error("no accounts: give cookie files and/or --tokens")
+    run(args)
@@ -4,19 +4,28 @@
 from __future__ import print_function
 
 import argparse
+import array
 import base64
+import collections
 from concurrent import futures
+import importlib
 import json
+import mmap
+import multiprocessing
 import os
 import pkg_resources
-import platform
 try:
     import Queue as queue
 except ImportError:
     import queue
 import random
+import re
+import shutil
 import signal
+import struct
 import sys
+import tempfile
+import threading
 import time
 
 import grpc
@@ -24,14 +33,39 @@ import grpc
 # Import generated grpc modules
 from tinode_grpc import pb
 from tinode_grpc import pbx
+from tinode_grpc import credcache
+from tinode_grpc.builder import Builder
 
 APP_NAME = "Tino-chatbot"
 APP_VERSION = "1.1"
 LIB_VERSION = pkg_resources.get_distribution("tinode_grpc").version
 
+# Client messages are built from cached prototypes.
+build = Builder(APP_NAME, APP_VERSION, LIB_VERSION)
+
 # User ID of the current user
 botUID = None
 
+# User ID the bot acts as when it's logged in as root and receives messages
+# through the Plugin API instead of subscribing to topics.
+actAs = None
+
+# Act-as mode: the server accepts {pub} and {note} on behalf of the user only in topics
+# the root session has attached to for that user. Topics attached on behalf of the user
+# with the time of their last use, and messages waiting for the {sub} to complete, by
+# the name of the topic as the user sees it.
+actAsTopics = {}
+actAsPending = {}
+actAsLock = threading.Lock()
+# Leave topics which had no replies for this many seconds.
+ACT_AS_IDLE = 600
+
+# Tokens shared with other processes which log in as the same user, the key of the
+# bot's account in it and the lock held while logging in with the password.
+credCache = None
+credKey = None
+loginLock = None
+
 # Dictionary wich contains lambdas to be executed when server response is received
 onCompletion = {}
 
@@ -49,6 +83,8 @@ def exec_future(tid, code, text, params):
             bundle.get('action')(arg, params)
         else:
             print("Error:", code, text)
+            if bundle.get('onerror') != None:
+                bundle.get('onerror')(code)
 
 # List of active subscriptions
 subscriptions = {}
@@ -57,6 +93,7 @@ def add_subscription(topic):
 
 def del_subscription(topic):
     subscriptions.pop(topic, None)
+    quotes.forget(topic)
 
 def server_version(params):
     if params == None:
@@ -64,21 +101,450 @@ def server_version(params):
     print("Server:", params['build'].decode('ascii'), params['ver'].decode('ascii'))
 
 def next_id():
-    next_id.tid += 1
-    return str(next_id.tid)
+    # Called from the message loop and from Plugin API threads.
+    with next_id.lock:
+        next_id.tid += 1
+        return str(next_id.tid)
 next_id.tid = 100
+next_id.lock = threading.Lock()
+
+# Shuffle-bag: yields every index in range(size) once, in random order, then starts over.
+# The order is a keyed Feistel permutation so the state is O(1) regardless of the size.
+class ShuffleBag(object):
+    ROUNDS = 4
+
+    def __init__(self, size):
+        self.size = size
+        # Number of bits in each half of the Feistel block.
+        self.half = max(1, ((size - 1).bit_length() + 1) // 2)
+        self.mask = (1 << self.half) - 1
+        self.last = None
+        self.reshuffle()
+
+    def reshuffle(self):
+        self.pos = 0
+        self.keys = [random.getrandbits(32) for _ in range(ShuffleBag.ROUNDS)]
+        # Don't start a new bag with the item which ended the previous one.
+        while self.size > 1 and self.permute(0) == self.last:
+            self.keys = [random.getrandbits(32) for _ in range(ShuffleBag.ROUNDS)]
+
+    def permute(self, idx):
+        # Cycle-walk until the value falls into [0, size). The block is less than 4x
+        # the size, so it takes fewer than 4 rounds on average.
+        while True:
+            left, right = idx >> self.half, idx & self.mask
+            for key in self.keys:
+                left, right = right, left ^ (((right * 0x9E3779B1) ^ key) >> 7 & self.mask)
+            idx = (left << self.half) | right
+            if idx < self.size:
+                return idx
+
+    def next(self):
+        if self.size == 0:
+            raise IndexError('shuffle-bag is empty')
+        if self.pos >= self.size:
+            self.reshuffle()
+        self.last = self.permute(self.pos)
+        self.pos += 1
+        return self.last
+
+# A file with one reply per line. Only the offsets of the lines are indexed and lines
+# are read from the file when needed. The index is saved next to the file as
+# <file_name>.idx and memory-mapped on subsequent loads, so neither startup time nor
+# memory depend on the size of the corpus. The file itself is not memory-mapped: reading
+# a mapped file which was truncated in the meantime crashes the process with SIGBUS,
+# while a read returns garbage at worst.
+class Corpus(object):
+    # Index header: magic, offset width in bytes, source size, source mtime (ns), line count.
+    IDX_HEADER = struct.Struct('<4sBQQQ')
+    IDX_MAGIC = b'TNCI'
+    # Shuffle-bags are kept for this many topics, the least recently used is dropped.
+    MAX_BAGS = 10000
+
+    def __init__(self, file_name, snapshot=False):
+        """With snapshot=True lines are read from a private copy of the file, so they stay
+        intact if the file is changed in place while the corpus is in use."""
+        self.file_name = file_name
+        self.file = None
+        self.size = 0
+        self.index = None
+        self.count = 0
+        # Shuffle-bags, one per topic, least recently used first. next() is called from
+        # the message loop, Plugin API threads and process pool callbacks.
+        self.bags = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+        f = open(file_name, 'rb')
+        stat = os.fstat(f.fileno())
+        if stat.st_size == 0:
+            f.close()
+            return
+        if snapshot:
+            with f:
+                f = _copy(f, stat)
+        self.file = f
+        self.size = stat.st_size
+        # Positioned reads don't move the file offset, so readers need no lock.
+        self.pread = getattr(os, 'pread', None)
+        self.read_lock = threading.Lock()
+
+        if not self._load_index(stat):
+            self._build_index(stat)
+
+    def _load_index(self, stat):
+        """Memory-map a previously saved index if it matches the current file"""
+        try:
+            with open(self.file_name + '.idx', 'rb') as f:
+                index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (IOError, OSError, ValueError):
+            return False
+
+        try:
+            magic, width, size, mtime, count = Corpus.IDX_HEADER.unpack_from(index, 0)
+        except struct.error:
+            # Truncated.
+            index.close()
+            return False
+        if magic != Corpus.IDX_MAGIC or size != stat.st_size or mtime != _mtime_ns(stat) or \
+                len(index) != Corpus.IDX_HEADER.size + width * count:
+            index.close()
+            return False
+
+        self._set_index(index, Corpus.IDX_HEADER.size, width, count)
+        return True
+
+    def _build_index(self, stat):
+        """Scan the file for non-blank lines and record their offsets"""
+        width = 4 if stat.st_size < 0x100000000 else 8
+        offsets = array.array('I' if width == 4 else 'Q')
+        start = 0
+        self.file.seek(0)
+        for line in self.file:
+            if line.strip():
+                offsets.append(start)
+            start += len(line)
+            if start >= self.size:
+                # The file grew: the rest is not covered by stat.
+                break
+
+        header = Corpus.IDX_HEADER.pack(Corpus.IDX_MAGIC, width, stat.st_size, _mtime_ns(stat), len(offsets))
+        # The old index may still be mapped by another Corpus: replace it, don't overwrite it.
+        temp_name = '%s.idx.%d.tmp' % (self.file_name, os.getpid())
+        try:
+            with open(temp_name, 'wb') as f:
+                f.write(header)
+                saved = offsets
+                if sys.byteorder != 'little':
+                    # The index is read as little-endian.
+                    saved = array.array(offsets.typecode, offsets)
+                    saved.byteswap()
+                saved.tofile(f)
+            os.rename(temp_name, self.file_name + '.idx')
+            if self._load_index(stat):
+                return
+        except (IOError, OSError) as err:
+            print("Failed to save corpus index", err)
+            try:
+                os.remove(temp_name)
+            except OSError:
+                pass
+
+        # Index cannot be saved, keep it in memory.
+        self._set_index(offsets, 0, width, len(offsets))
+
+    def _set_index(self, index, base, width, count):
+        self.index = index
+        self.count = count
+        if isinstance(index, array.array):
+            self.offset = index.__getitem__
+        else:
+            fmt = struct.Struct('<I' if width == 4 else '<Q')
+            self.offset = lambda i: fmt.unpack_from(index, base + width * i)[0]
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, idx):
+        if idx < 0 or idx >= self.count:
+            raise IndexError('corpus index out of range')
+        start = self.offset(idx)
+        # The line ends before the next one starts.
+        end = self.offset(idx + 1) if idx + 1 < self.count else self.size
+        line = self._read(start, end - start).split(b'\n', 1)[0]
+        return line.decode('utf-8', 'replace').strip()
+
+    def _read(self, offset, size):
+        if self.pread != None:
+            return self.pread(self.file.fileno(), size, offset)
+        with self.read_lock:
+            self.file.seek(offset)
+            return self.file.read(size)
+
+    def next(self, topic=None):
+        """Get the next line for the topic: lines are not repeated until all are used"""
+        with self.lock:
+            bag = self.bags.pop(topic, None)
+            if bag == None:
+                bag = ShuffleBag(self.count)
+            self.bags[topic] = bag
+            if len(self.bags) > Corpus.MAX_BAGS:
+                self.bags.popitem(last=False)
+            idx = bag.next()
+        return self[idx]
+
+    def forget(self, topic):
+        """Drop the state kept for the topic"""
+        with self.lock:
+            self.bags.pop(topic, None)
+
+    def close(self):
+        if isinstance(self.index, mmap.mmap):
+            self.index.close()
+        if self.file != None:
+            self.file.close()
+
+def _mtime_ns(stat):
+    return getattr(stat, 'st_mtime_ns', int(stat.st_mtime * 1e9))
+
+def _copy(f, stat):
+    """Copy the open file to a temporary file next to it and return the copy open for
+    reading. The copy is removed right away: it exists until it's closed."""
+    fd, temp_name = tempfile.mkstemp(prefix='.' + os.path.basename(f.name) + '.',
+        dir=os.path.dirname(f.name) or '.')
+    copy = os.fdopen(fd, 'w+b')
+    try:
+        shutil.copyfileobj(f, copy)
+        copy.flush()
+        changed = os.fstat(f.fileno())
+        if copy.tell() != stat.st_size or changed.st_size != stat.st_size or \
+                _mtime_ns(changed) != _mtime_ns(stat):
+            raise IOError("file changed while being copied")
+    except Exception:
+        copy.close()
+        raise
+    finally:
+        os.remove(temp_name)
+    return copy
 
 # Quotes from the fortune cookie file
-quotes = []
+quotes = None
+
+def next_quote(topic=None):
+    return quotes.next(topic)
 
-def next_quote():
-    idx = random.randrange(0, len(quotes))
-    # Make sure quotes are not repeated
-    while idx == next_quote.idx:
-        idx = random.randrange(0, len(quotes))
-    next_quote.idx = idx
-    return quotes[idx]
-next_quote.idx = 0
+def file_signature(file_name):
+    try:
+        stat = os.stat(file_name)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_size, _mtime_ns(stat))
+
+def watch_quotes(file_name, interval):
+    """Watch the quotes file, reload it in the background when it changes. A file which
+    was replaced is read as is, one which was changed in place is copied first, so later
+    edits don't garble the lines of the new corpus."""
+    def watcher(last):
+        global quotes
+        while True:
+            time.sleep(interval)
+            current = file_signature(file_name)
+            if current == None or current == last:
+                continue
+            # The file may be still being written. Wait for it to settle.
+            time.sleep(interval)
+            if file_signature(file_name) != current:
+                continue
+
+            # Same inode: edited in place rather than renamed over.
+            in_place = last != None and current[0] == last[0]
+            try:
+                corpus = Corpus(file_name, snapshot=in_place)
+            except Exception as err:
+                print("Failed to reload quotes", err)
+                continue
+            last = current
+            # Replacing the reference is atomic. The old corpus is released once
+            # the readers which may still hold it are done with it.
+            quotes = corpus
+            print("Reloaded {} quotes".format(len(corpus)))
+
+    thread = threading.Thread(target=watcher, args=(file_signature(file_name),))
+    thread.daemon = True
+    thread.start()
+    return thread
+
+# Reply engines. A reply engine is a callable engine(topic, text) which returns the reply
+# or None to let the next engine in the chain handle the message. Optional attributes:
+#   cacheable = False: replies don't depend only on the topic and the text, don't cache them.
+#   expensive = True: the engine is slow, run it in the process pool if there is one
+#     (--workers > 0), in the calling thread otherwise. The workers are spawned, so such
+#     engines must be picklable, i.e. defined at the top level of a module, and must not
+#     rely on the state of the bot process.
+#   by_account = True: the engine keeps state per topic and is called with the ID of the
+#     answering account as engine(topic, text, account=...). A process hosting many
+#     accounts sees the same topic name in different topics, e.g. usrXYZ in p2p topics
+#     of every account with user XYZ.
+def is_cacheable(engine):
+    return getattr(engine, 'cacheable', True)
+
+def is_expensive(engine):
+    return getattr(engine, 'expensive', False)
+
+def is_by_account(engine):
+    return getattr(engine, 'by_account', False)
+
+class QuoteEngine(object):
+    """Responds to everything with a random quote"""
+    cacheable = False
+    by_account = True
+
+    def __call__(self, topic, text, account=None):
+        return next_quote(topic if account == None else (account, topic))
+
+class KeywordEngine(object):
+    """Responds with a canned reply to messages which contain a keyword"""
+    def __init__(self, rules):
+        self.rules = [(keyword.lower(), answer) for keyword, answer in rules.items()]
+
+    def __call__(self, topic, text):
+        words = set(normalize(text).split())
+        for keyword, answer in self.rules:
+            if keyword in words:
+                return answer
+        return None
+
+class RegexEngine(object):
+    """Responds to messages which match a regular expression. The reply is a template
+    which may reference the groups of the match, like '\\1' or '\\g<name>'"""
+    def __init__(self, rules):
+        self.rules = [(re.compile(pattern), template) for pattern, template in rules]
+
+    def __call__(self, topic, text):
+        for pattern, template in self.rules:
+            match = pattern.search(text)
+            if match:
+                return match.expand(template)
+        return None
+
+def load_engine(spec):
+    """Instantiate engine from a 'module:factory' specification"""
+    module_name, _, factory = spec.partition(':')
+    return getattr(importlib.import_module(module_name), factory or 'engine')()
+
+def normalize(text):
+    """Reduce insignificant differences between messages: case, whitespace, trailing punctuation"""
+    return ' '.join(text.lower().split()).rstrip('.!?')
+
+# LRU cache of replies with expiration.
+class ReplyCache(object):
+    def __init__(self, size, ttl):
+        self.size = size
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries = collections.OrderedDict()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry == None or entry[0] < time.time():
+                return None
+            # Re-insert to mark as recently used.
+            self.entries[key] = entry
+            return entry[1]
+
+    def put(self, key, value):
+        if self.size <= 0:
+            return
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = (time.time() + self.ttl, value)
+            if len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+# Runs the chain of engines for incoming messages. Replies are delivered to a callback
+# which may be called from another thread if an expensive engine was used.
+class Replier(object):
+    def __init__(self, engines, cache, pool):
+        self.engines = engines
+        self.cache = cache
+        self.pool = pool
+
+    def respond(self, topic, text, callback, account=None):
+        """account: ID of the user answering, if the process answers for many users"""
+        key = (account, topic, normalize(text))
+        reply = self.cache.get(key)
+        if reply != None:
+            callback(reply)
+        else:
+            self._run(0, topic, text, account, key, callback)
+
+    def _run(self, start, topic, text, account, key, callback):
+        for idx in range(start, len(self.engines)):
+            engine = self.engines[idx]
+            kwargs = {'account': account} if account != None and is_by_account(engine) else {}
+            if is_expensive(engine) and self.pool != None:
+                future = self.pool.submit(engine, topic, text, **kwargs)
+                future.add_done_callback(
+                    lambda f, idx=idx: self._on_done(f, idx, topic, text, account, key, callback))
+                return
+
+            try:
+                reply = engine(topic, text, **kwargs)
+            except Exception as err:
+                print("Reply engine failed", err)
+                reply = None
+            if reply != None:
+                self._finish(engine, key, reply, callback)
+                return
+
+    def _on_done(self, future, idx, topic, text, account, key, callback):
+        try:
+            reply = future.result()
+        except Exception as err:
+            print("Reply engine failed", err)
+            reply = None
+        if reply != None:
+            self._finish(self.engines[idx], key, reply, callback)
+        else:
+            self._run(idx + 1, topic, text, account, key, callback)
+
+    def _finish(self, engine, key, reply, callback):
+        if is_cacheable(engine):
+            self.cache.put(key, reply)
+        callback(reply)
+
+replier = None
+
+def init_replier(engine_specs, cache_size, cache_ttl, workers):
+    global replier
+    engines = [load_engine(spec) for spec in engine_specs]
+    # Quotes are the reply of last resort.
+    engines.append(QuoteEngine())
+    pool = None
+    if workers > 0 and any(is_expensive(engine) for engine in engines):
+        pool = process_pool(workers)
+    replier = Replier(engines, ReplyCache(cache_size, cache_ttl), pool)
+    return replier
+
+def process_pool(workers):
+    """Pool for expensive engines. gRPC threads are running by the time the workers
+    start, so the workers are spawned: forking a process with them is unsafe."""
+    try:
+        return futures.ProcessPoolExecutor(max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'))
+    except (AttributeError, TypeError):
+        # python 2 can only fork.
+        return futures.ProcessPoolExecutor(max_workers=workers)
+
+def message_text(content):
+    """Extract text from message content"""
+    try:
+        content = json.loads(content.decode('utf-8'))
+    except ValueError:
+        return ''
+    if isinstance(content, dict):
+        content = content.get('txt')
+    return content if isinstance(content, type(u'')) else ''
 
 # This is the class for the server-side gRPC endpoints
 class Plugin(pbx.PluginServicer):
@@ -99,6 +565,80 @@ class Plugin(pbx.PluginServicer):
 
         return pb.Unused()
 
+    def Message(self, msg_event, context):
+        if actAs != None and msg_event.action == pb.CREATE:
+            respond_as(actAs, msg_event.msg)
+
+        return pb.Unused()
+
+def p2p_peer(topic, user_id):
+    """Get ID of the other party of a p2p topic or None if user_id is not a party"""
+    if not topic.startswith('p2p') or not user_id.startswith('usr'):
+        return None
+    try:
+        pair = base64.urlsafe_b64decode((topic[3:] + '==').encode('ascii'))
+        user = base64.urlsafe_b64decode((user_id[3:] + '=').encode('ascii'))
+    except (TypeError, ValueError):
+        return None
+    if len(pair) != 16:
+        return None
+    if pair[:8] == user:
+        peer = pair[8:]
+    elif pair[8:] == user:
+        peer = pair[:8]
+    else:
+        return None
+    return 'usr' + base64.urlsafe_b64encode(peer).decode('ascii').rstrip('=')
+
+def respond_as(user_id, data):
+    """Reply to a message reported through the Plugin API. The message is not
+    delivered to the bot, so only messages in the bot's p2p topics are answered."""
+    if data.from_user_id == user_id:
+        return
+    # The reply is published on behalf of the user. The topic is named from the user's
+    # point of view, i.e. by the ID of the peer.
+    peer = p2p_peer(data.topic, user_id)
+    if peer == None:
+        return
+    post_as(user_id, peer, note_read(peer, data.seq_id, user_id))
+    replier.respond(data.topic, message_text(data.content),
+        lambda reply: post_as(user_id, peer, publish(peer, reply, user_id)))
+
+def post_as(user_id, topic, msg):
+    """Send message to the topic on behalf of the user, attaching to the topic first"""
+    now = time.time()
+    with actAsLock:
+        pending = actAsPending.get(topic)
+        if pending != None:
+            pending.append(msg)
+            return
+        attached = topic in actAsTopics
+        if attached:
+            actAsTopics[topic] = now
+        else:
+            actAsPending[topic] = [msg]
+        idle = [name for name, used in actAsTopics.items() if now - used > ACT_AS_IDLE]
+        for name in idle:
+            del actAsTopics[name]
+    for name in idle:
+        client_post(leave_as(user_id, name))
+    client_post(msg if attached else subscribe_as(user_id, topic))
+
+def on_attached_as(topic, ok):
+    with actAsLock:
+        pending = actAsPending.pop(topic, [])
+        if ok:
+            actAsTopics[topic] = time.time()
+    if ok:
+        for msg in pending:
+            client_post(msg)
+
+def reset_act_as():
+    """Attachments don't survive the session"""
+    with actAsLock:
+        actAsTopics.clear()
+        actAsPending.clear()
+
 queue_out = queue.Queue()
 
 def client_generate():
@@ -125,15 +665,15 @@ def hello():
     add_future(tid, {
         'action': lambda unused, params: server_version(params),
     })
-    return pb.ClientMsg(hi=pb.ClientHi(id=tid, user_agent=APP_NAME + "/" + APP_VERSION + " (" +
-        platform.system() + "/" + platform.release() + "); gRPC-python/" + LIB_VERSION,
-        ver=LIB_VERSION, lang="EN"))
+    return build.hi(tid)
 
-def login(cookie_file_name, scheme, secret):
+def login(cookie_file_name, scheme, secret, password=None):
+    """password: basic secret to fall back to if the server rejects the cached token"""
     tid = next_id()
     add_future(tid, {
         'arg': cookie_file_name,
         'action': lambda fname, params: on_login(fname, params),
+        'onerror': lambda code, scheme=scheme: on_login_failed(cookie_file_name, scheme, code, password),
     })
     return pb.ClientMsg(login=pb.ClientLogin(id=tid, scheme=scheme, secret=secret))
 
@@ -153,13 +693,23 @@ def leave(topic):
     })
     return pb.ClientMsg(leave=pb.ClientLeave(id=tid, topic=topic))
 
-def publish(topic, text):
+def subscribe_as(user_id, topic):
     tid = next_id()
-    return pb.ClientMsg(pub=pb.ClientPub(id=tid, topic=topic, no_echo=True,
-		content=json.dumps(text).encode('utf-8')))
+    add_future(tid, {
+        'arg': topic,
+        'action': lambda topicName, unused: on_attached_as(topicName, True),
+        'onerror': lambda code, topic=topic: on_attached_as(topic, False),
+    })
+    return pb.ClientMsg(sub=pb.ClientSub(id=tid, topic=topic), on_behalf_of=user_id)
+
+def leave_as(user_id, topic):
+    return pb.ClientMsg(leave=pb.ClientLeave(id=next_id(), topic=topic), on_behalf_of=user_id)
+
+def publish(topic, text, on_behalf_of=None):
+    return build.pub(next_id(), topic, json.dumps(text).encode('utf-8'), on_behalf_of, no_echo=True)
 
-def note_read(topic, seq):
-    return pb.ClientMsg(note=pb.ClientNote(topic=topic, what=pb.READ, seq_id=seq))
+def note_read(topic, seq, on_behalf_of=None):
+    return build.note(topic, pb.READ, seq, on_behalf_of)
 
 def init_server(listen):
     # Launch plugin server: acception connection(s) from the Tinode server.
@@ -177,10 +727,15 @@ def init_client(addr, schema, secret, cookie_file_name):
     stub = pbx.NodeStub(channel)
     # Call the server
     stream = stub.MessageLoop(client_generate())
+    login_schema, login_secret = cached_login(schema, secret)
     # Session initialization sequence: {hi}, {login}, {sub topic='me'}
     client_post(hello())
-    client_post(login(cookie_file_name, schema, secret))
-    client_post(subscribe('me'))
+    client_post(login(cookie_file_name, login_schema, login_secret, secret if login_schema != schema else None))
+    if actAs == None:
+        client_post(subscribe('me'))
+    else:
+        # Messages are received through the Plugin API: topics are attached only to reply.
+        reset_act_as()
 
     return stream
 
@@ -203,8 +758,10 @@ def client_message_loop(stream):
                     client_post(note_read(msg.data.topic, msg.data.seq_id))
                     # Insert a small delay to prevent accidental DoS self-attack.
                     time.sleep(0.1)
-                    # Respond with a witty quote
-                    client_post(publish(msg.data.topic, next_quote()))
+                    # Respond with a witty quote or whatever reply engines come up with.
+                    topic = msg.data.topic
+                    replier.respond(topic, message_text(msg.data.content),
+                        lambda reply, topic=topic: client_post(publish(topic, reply)))
 
             elif msg.HasField("pres"):
                 # print("presence:", msg.pres.topic, msg.pres.what)
@@ -238,14 +795,58 @@ def read_auth_cookie(cookie_file_name):
         secret = params.get('secret').encode('utf-8')
     return schema, secret
 
+def cached_login(schema, secret):
+    """Login with a token from the shared cache instead of the password when possible.
+    Otherwise keep other processes from logging in with the password until this one does."""
+    global loginLock
+    if credCache == None or schema != 'basic':
+        return schema, secret
+    release_login_lock()
+    loginLock = credCache.login_lock(credKey)
+    token = credCache.get(credKey)
+    if token == None:
+        return schema, secret
+    release_login_lock()
+    print("Logging in with cached token")
+    return 'token', token
+
+def release_login_lock():
+    global loginLock
+    if loginLock != None:
+        loginLock.release()
+        loginLock = None
+
+def on_login_failed(cookie_file_name, scheme, code, password):
+    release_login_lock()
+    if credCache != None and scheme == 'token' and password != None:
+        # The cached token was revoked or the account has changed: log in with the
+        # password now, unless another process has logged in meanwhile.
+        credCache.delete(credKey)
+        schema, secret = cached_login('basic', password)
+        client_post(login(cookie_file_name, schema, secret, password if schema != 'basic' else None))
+        # The {sub} sent with the failed login failed too.
+        if actAs == None:
+            client_post(subscribe('me'))
+
 def on_login(cookie_file_name, params):
     """Save authentication token to file"""
-    if params == None or cookie_file_name == None:
+    global botUID
+    if params == None:
         return
 
     if 'user' in params:
-        botUID = params['user'].decode("ascii")
+        botUID = json.loads(params['user'].decode('utf-8'))
 
+    if credCache != None:
+        # Every login returns a new token: keep the shared one fresh.
+        credCache.put(credKey, params)
+        release_login_lock()
+
+    if cookie_file_name != None:
+        save_auth_cookie(cookie_file_name, params)
+
+def save_auth_cookie(cookie_file_name, params):
+    """Save token from params of the {ctrl} response to login to a cookie file"""
     # Protobuf map 'params' is not a python object or dictionary. Convert it.
     nice = {'schema': 'token'}
     for key_in in params:
@@ -263,10 +864,8 @@ def on_login(cookie_file_name, params):
         print("Failed to save authentication cookie", err)
 
 def load_quotes(file_name):
-    with open(file_name) as f:
-        for line in f:
-            quotes.append(line.strip())
-
+    global quotes
+    quotes = Corpus(file_name)
     return len(quotes)
 
 def run(args):
@@ -284,6 +883,10 @@ def run(args):
         schema = 'basic'
         secret = args.login_basic.encode('utf-8')
         print("Logging in with login:password", args.login_basic)
+        if args.token_cache:
+            global credCache, credKey
+            credCache = credcache.CredCache(args.token_cache)
+            credKey = credcache.account_key(args.host, args.login_basic.split(':', 1)[0])
 
     else:
         """Try reading the cookie file"""
@@ -294,8 +897,15 @@ def run(args):
             print("Failed to read authentication cookie", err)
 
     if schema:
+        global actAs
+        actAs = args.act_as
+
         # Load random quotes from file
         print("Loaded {} quotes".format(load_quotes(args.quotes)))
+        if args.reload_quotes > 0:
+            watch_quotes(args.quotes, args.reload_quotes)
+
+        init_replier(args.engine, args.cache_size, args.cache_ttl, args.workers)
 
         # Start Plugin server
         server = init_server(args.listen)
@@ -342,7 +952,14 @@ if __name__ == '__main__':
     parser.add_argument('--login-basic', help='login using basic authentication username:password')
     parser.add_argument('--login-token', help='login using token authentication')
     parser.add_argument('--login-cookie', default='.tn-cookie', help='read credentials from the provided cookie file')
+    parser.add_argument('--token-cache', default=credcache.DEFAULT_PATH, help='file with authentication tokens shared with other bots and tn-cli, used with --login-basic; empty to disable')
     parser.add_argument('--quotes', default='quotes.txt', help='file with messages for the chatbot to use, one message per line')
+    parser.add_argument('--reload-quotes', type=float, default=5, help='check quotes file for changes every N seconds and reload it, 0 to disable')
+    parser.add_argument('--act-as', help='ID of the user to act as: login as root, receive messages through Plugin.Message instead of subscribing to topics and reply on behalf of the user')
+    parser.add_argument('--engine', action='append', default=[], help='reply engine as module:factory, may be repeated; engines are tried in order, quotes are used last')
+    parser.add_argument('--cache-size', type=int, default=1024, help='number of replies to cache, 0 to disable caching')
+    parser.add_argument('--cache-ttl', type=float, default=600, help='seconds to keep cached replies')
+    parser.add_argument('--workers', type=int, default=2, help='size of the process pool for expensive reply engines')
     args = parser.parse_args()
 
     run(args)
@@ -0,0 +1,257 @@
+"""Probe of message delivery to the members of a group topic.
+
+Subscribes N sessions to a topic, publishes messages tagged with a probe ID in the
+header and measures the time from {pub} until {data} arrives at every session, rather
+than the time until the {ctrl} response. A delivery which does not arrive within the
+deadline is counted as missing.
+
+Runs a fixed number of messages as a benchmark, or indefinitely as a canary which
+reports every interval and serves the counters in Prometheus text format.
+"""
+
+from __future__ import print_function
+
+import argparse
+import binascii
+import json
+import os
+import sys
+import threading
+import time
+
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+except ImportError:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from tinode_grpc import pb
+from tinode_grpc.session import Session
+
+APP_NAME = "fanout-probe/1.0"
+
+# Monotonic clock: not available in python 2.
+clock = getattr(time, 'monotonic', time.time)
+
+def percentile(values, q):
+    """values must be sorted"""
+    if not values:
+        return 0
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+class Probe(object):
+    def __init__(self, recipients, deadline, keep_all=True):
+        """keep_all: keep latencies of the whole run, not just of the current window"""
+        self.recipients = recipients
+        self.deadline = deadline
+        self.keep_all = keep_all
+        self.lock = threading.Lock()
+        # Random ID of this run: messages of other runs are ignored.
+        self.run_id = binascii.hexlify(os.urandom(4)).decode('ascii')
+        # Messages in flight: probe number -> (time sent, set of recipients yet to receive it).
+        self.pending = {}
+        # Delivery latencies of every recipient and the time until the last recipient
+        # got the message, since the last call to window().
+        self.latencies = [[] for _ in range(recipients)]
+        self.fanout = []
+        # Totals.
+        self.published = 0
+        self.delivered = 0
+        self.missing = 0
+        self.missing_by = [0] * recipients
+        self.failed = 0
+        self.all_latencies = [[] for _ in range(recipients)]
+        self.all_fanout = []
+
+    def sent(self, n):
+        with self.lock:
+            self.pending[n] = (clock(), set(range(self.recipients)))
+            self.published += 1
+
+    def failed_pub(self, n):
+        with self.lock:
+            self.pending.pop(n, None)
+            self.failed += 1
+
+    def received(self, recipient, data):
+        probe = data.head.get('probe')
+        if probe == None:
+            return
+        run_id, _, n = json.loads(probe.decode('utf-8')).partition(':')
+        if run_id != self.run_id:
+            return
+        now = clock()
+        with self.lock:
+            entry = self.pending.get(int(n))
+            if entry == None or recipient not in entry[1]:
+                # Late or duplicate.
+                return
+            sent, waiting = entry
+            waiting.discard(recipient)
+            self.delivered += 1
+            self.latencies[recipient].append(now - sent)
+            if not waiting:
+                del self.pending[int(n)]
+                self.fanout.append(now - sent)
+
+    def expire(self):
+        """Count deliveries which didn't arrive within the deadline as missing"""
+        now = clock()
+        with self.lock:
+            for n, (sent, waiting) in list(self.pending.items()):
+                if now - sent > self.deadline:
+                    for recipient in waiting:
+                        self.missing_by[recipient] += 1
+                    self.missing += len(waiting)
+                    del self.pending[n]
+
+    def window(self):
+        """Returns latencies of all recipients and fan-out times collected since the last
+        call, sorted, and starts a new window"""
+        with self.lock:
+            latencies, self.latencies = self.latencies, [[] for _ in range(self.recipients)]
+            fanout, self.fanout = self.fanout, []
+        if self.keep_all:
+            for recipient, values in enumerate(latencies):
+                self.all_latencies[recipient].extend(values)
+            self.all_fanout.extend(fanout)
+        return sorted(x for values in latencies for x in values), sorted(fanout)
+
+    def metrics(self, latencies, fanout):
+        """Prometheus text format"""
+        lines = [
+            "# TYPE tinode_probe_published_total counter",
+            "tinode_probe_published_total %d" % self.published,
+            "# TYPE tinode_probe_publish_failed_total counter",
+            "tinode_probe_publish_failed_total %d" % self.failed,
+            "# TYPE tinode_probe_delivered_total counter",
+            "tinode_probe_delivered_total %d" % self.delivered,
+            "# TYPE tinode_probe_missing_total counter",
+            "tinode_probe_missing_total %d" % self.missing,
+            "# TYPE tinode_probe_recipients gauge",
+            "tinode_probe_recipients %d" % self.recipients,
+        ]
+        for name, values in (('delivery', latencies), ('fanout', fanout)):
+            lines.append("# TYPE tinode_probe_%s_seconds summary" % name)
+            for q in (0.5, 0.9, 0.99, 1.0):
+                lines.append('tinode_probe_%s_seconds{quantile="%g"} %.6f' % (name, q, percentile(values, q)))
+            lines.append("tinode_probe_%s_seconds_count %d" % (name, len(values)))
+        return "\n".join(lines) + "\n"
+
+def report(latencies, fanout, prefix=''):
+    print("%sdelivery ms p50 %.1f p90 %.1f p99 %.1f max %.1f; all recipients ms p50 %.1f p99 %.1f max %.1f" % (
+        prefix, percentile(latencies, 0.5) * 1000, percentile(latencies, 0.9) * 1000,
+        percentile(latencies, 0.99) * 1000, (latencies[-1] if latencies else 0) * 1000,
+        percentile(fanout, 0.5) * 1000, percentile(fanout, 0.99) * 1000,
+        (fanout[-1] if fanout else 0) * 1000))
+
+def serve_metrics(port, exported):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = exported[0].encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('', port), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+def connect(addr, secret, topic, on_message=None):
+    session = Session(addr, on_message)
+    session.login(APP_NAME, 'basic', secret.encode('utf-8'))
+    session.call('sub', pb.ClientSub(topic=topic))
+    return session
+
+def main():
+    purpose = "Probe of message delivery latency to every subscriber of a group topic."
+    parser = argparse.ArgumentParser(description=purpose)
+    parser.add_argument('--host', default='localhost:6061', help='address of Tinode server gRPC endpoint')
+    parser.add_argument('--topic', required=True, help='group topic to publish to; the users must be able to subscribe to it')
+    parser.add_argument('--publisher', required=True, help='login:password of the publishing user')
+    parser.add_argument('--subscriber', action='append', default=[], help='login:password of a subscriber, may be repeated')
+    parser.add_argument('--sessions', type=int, default=0, help='number of subscriber sessions, the subscribers are reused round-robin; default: one per subscriber')
+    parser.add_argument('--interval', type=float, default=1, help='seconds between messages')
+    parser.add_argument('--count', type=int, default=10, help='number of messages to publish, 0 to run as a canary until interrupted')
+    parser.add_argument('--deadline', type=float, default=10, help='seconds after which a delivery is counted as missing')
+    parser.add_argument('--report-interval', type=float, default=60, help='seconds between reports of the canary')
+    parser.add_argument('--metrics-port', type=int, help='serve metrics in Prometheus text format at this port')
+    args = parser.parse_args()
+
+    if not args.subscriber:
+        parser.error("no subscribers, use --subscriber")
+    count = args.sessions or len(args.subscriber)
+    # A canary runs indefinitely: it keeps only the latencies of the current window.
+    probe = Probe(count, args.deadline, args.count > 0)
+
+    print("Connecting", count, "subscriber sessions")
+    sessions = []
+    for idx in range(count):
+        sessions.append(connect(args.host, args.subscriber[idx % len(args.subscriber)], args.topic,
+            lambda msg, idx=idx: msg.HasField('data') and probe.received(idx, msg.data)))
+    publisher = connect(args.host, args.publisher, args.topic)
+
+    exported = [probe.metrics([], [])]
+    server = serve_metrics(args.metrics_port, exported) if args.metrics_port else None
+
+    def publish(n):
+        msg = pb.ClientPub(topic=args.topic, no_echo=True,
+            head={'probe': json.dumps('%s:%d' % (probe.run_id, n)).encode('utf-8'),
+                'ts': json.dumps(int(time.time() * 1000)).encode('utf-8')},
+            content=json.dumps("probe %d" % n).encode('utf-8'))
+        probe.sent(n)
+        publisher.request('pub', msg).add_done_callback(
+            lambda f: (f.exception() != None or f.result()[0].code >= 300) and probe.failed_pub(n))
+
+    print("Probe", probe.run_id, "publishing to", args.topic, "every", args.interval, "seconds")
+    started = clock()
+    last_report = started
+    n = 0
+    try:
+        while args.count == 0 or n < args.count:
+            delay = started + n * args.interval - clock()
+            if delay > 0:
+                time.sleep(delay)
+            publish(n)
+            n += 1
+            probe.expire()
+            if args.count == 0 and clock() - last_report >= args.report_interval:
+                last_report = clock()
+                latencies, fanout = probe.window()
+                exported[0] = probe.metrics(latencies, fanout)
+                report(latencies, fanout, "published %d, missing %d; " % (probe.published, probe.missing))
+        # Wait for the last deliveries.
+        while probe.pending and clock() - started < n * args.interval + args.deadline + 1:
+            time.sleep(0.1)
+            probe.expire()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for session in sessions + [publisher]:
+            session.close()
+        if server != None:
+            server.shutdown()
+
+    probe.window()
+    print("Published %d, failed %d, delivered %d, missing %d" % (probe.published, probe.failed,
+        probe.delivered, probe.missing))
+    if not probe.keep_all:
+        return 0
+    report(sorted(x for values in probe.all_latencies for x in values), sorted(probe.all_fanout))
+    # The slowest recipients.
+    worst = sorted(range(count), key=lambda idx: -percentile(sorted(probe.all_latencies[idx]), 0.99))[:5]
+    for idx in worst:
+        values = sorted(probe.all_latencies[idx])
+        print("  session %d (%s): p50 %.1f ms, p99 %.1f ms, missing %d" % (idx,
+            args.subscriber[idx % len(args.subscriber)].split(':')[0], percentile(values, 0.5) * 1000,
+            percentile(values, 0.99) * 1000, probe.missing_by[idx]))
+    return 1 if probe.missing or probe.failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""Benchmark of a Tinode plugin: calls the plugin at a fixed rate and checks that it
+responds within the timeout configured for it in tinode.conf.
+
+The load is open-loop: requests are sent on schedule whether or not earlier ones have
+completed, and latency is measured from the scheduled time, so a plugin which falls
+behind is not hidden by a slower request rate.
+"""
+
+from __future__ import print_function
+
+import argparse
+import base64
+import json
+import random
+import struct
+import sys
+import threading
+import time
+
+import grpc
+
+from tinode_grpc import pb
+from tinode_grpc import pbx
+
+# Monotonic clock: not available in python 2.
+clock = getattr(time, 'monotonic', time.time)
+
+WORDS = ("hello", "world", "meeting", "tomorrow", "lunch", "project", "deadline", "call",
+    "please", "thanks", "review", "the", "a", "is", "at", "on", "see", "you", "ok", "when")
+
+USER_AGENTS = ("TinodeWeb/0.15.5 (Chrome/70.0; MacIntel); tinodejs/0.15.5",
+    "Tindroid/0.15.5 (Android 8.1; en_US); tindroid/0.15.5",
+    "Tinodios/0.15.5 (iOS 12.1; en_US); tinodios/0.15.5")
+
+def user_id(n):
+    return 'usr' + base64.urlsafe_b64encode(struct.pack('<Q', n)).decode('ascii').rstrip('=')
+
+def topic_name(n):
+    return 'grp' + base64.urlsafe_b64encode(struct.pack('<Q', n)).decode('ascii').rstrip('=')
+
+def text(rnd):
+    return " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(2, 40)))
+
+def session(rnd, uid):
+    return pb.Session(session_id=base64.urlsafe_b64encode(struct.pack('<Q', rnd.getrandbits(64))).decode('ascii'),
+        user_id=uid, auth_level=pb.AUTH, remote_addr='10.0.%d.%d:%d' % (rnd.randint(0, 255),
+        rnd.randint(1, 254), rnd.randint(1024, 65535)), user_agent=rnd.choice(USER_AGENTS),
+        language='en')
+
+def fire_hose_request(rnd, n, users, topics):
+    uid = user_id(rnd.randint(1, users))
+    msg = pb.ClientMsg(pub=pb.ClientPub(id=str(n), topic=topic_name(rnd.randint(1, topics)),
+        no_echo=True, content=json.dumps(text(rnd)).encode('utf-8')))
+    return pb.ClientReq(msg=msg, sess=session(rnd, uid))
+
+def find_request(rnd, n, users, topics):
+    query = ",".join(rnd.choice(WORDS) for _ in range(rnd.randint(1, 3)))
+    if rnd.random() < 0.3:
+        query += " email:%s@example.com" % rnd.choice(WORDS)
+    return pb.SearchQuery(user_id=user_id(rnd.randint(1, users)), query=query)
+
+def message_request(rnd, n, users, topics):
+    return pb.MessageEvent(action=pb.CREATE, msg=pb.ServerData(topic=topic_name(rnd.randint(1, topics)),
+        from_user_id=user_id(rnd.randint(1, users)), seq_id=n + 1,
+        content=json.dumps(text(rnd)).encode('utf-8')))
+
+METHODS = {
+    'firehose': ('FireHose', fire_hose_request),
+    'find': ('Find', find_request),
+    'message': ('Message', message_request),
+}
+
+def percentile(values, q):
+    """values must be sorted"""
+    if not values:
+        return 0
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+class Bench(object):
+    def __init__(self, stub, methods, rate, duration, deadline, payloads=1000, users=10000, topics=1000):
+        self.stub = stub
+        self.rate = rate
+        self.duration = duration
+        self.deadline = deadline
+        self.lock = threading.Lock()
+        self.latencies = dict((m, []) for m in methods)
+        self.errors = dict((m, 0) for m in methods)
+        self.outstanding = 0
+        self.max_outstanding = 0
+        self.done = threading.Condition(self.lock)
+
+        # Requests are generated upfront to keep the generator out of the measurement.
+        rnd = random.Random(1)
+        self.requests = []
+        for i in range(payloads):
+            method = methods[i % len(methods)]
+            name, make = METHODS[method]
+            self.requests.append((method, getattr(stub, name), make(rnd, i, users, topics)))
+
+    def run(self):
+        total = int(self.rate * self.duration)
+        interval = 1.0 / self.rate
+        started = clock()
+        for i in range(total):
+            scheduled = started + i * interval
+            delay = scheduled - clock()
+            if delay > 0:
+                time.sleep(delay)
+            method, call, req = self.requests[i % len(self.requests)]
+            with self.lock:
+                self.outstanding += 1
+                self.max_outstanding = max(self.max_outstanding, self.outstanding)
+            future = call.future(req, timeout=self.deadline)
+            future.add_done_callback(lambda f, method=method, scheduled=scheduled: self._done(f, method, scheduled))
+        elapsed = clock() - started
+
+        with self.lock:
+            wait_until = clock() + self.deadline + 1
+            while self.outstanding > 0 and clock() < wait_until:
+                self.done.wait(0.1)
+        return total / elapsed if elapsed > 0 else 0
+
+    def _done(self, future, method, scheduled):
+        latency = clock() - scheduled
+        failed = future.exception() != None
+        with self.lock:
+            if failed:
+                self.errors[method] += 1
+            else:
+                self.latencies[method].append(latency)
+            self.outstanding -= 1
+            self.done.notify()
+
+if __name__ == '__main__':
+    purpose = "Benchmark of Tinode plugin calls at a fixed rate."
+    parser = argparse.ArgumentParser(description=purpose)
+    parser.add_argument('--plugin', default='localhost:40051', help='address of the plugin')
+    parser.add_argument('--method', default='firehose', help='plugin methods to call, comma separated: firehose, find, message')
+    parser.add_argument('--rate', type=float, default=1000, help='requests per second')
+    parser.add_argument('--duration', type=float, default=10, help='seconds to run')
+    parser.add_argument('--timeout', type=int, default=20000, help='plugin timeout in microseconds as in tinode.conf')
+    parser.add_argument('--percentile', type=float, default=99.9, help='percentile of latency which must be within the timeout')
+    parser.add_argument('--users', type=int, default=10000, help='number of distinct users in requests')
+    parser.add_argument('--topics', type=int, default=1000, help='number of distinct topics in requests')
+    args = parser.parse_args()
+
+    methods = [m.strip() for m in args.method.split(',')]
+    for m in methods:
+        if m not in METHODS:
+            parser.error("unknown method '%s'" % m)
+
+    timeout = args.timeout / 1e6
+    stub = pbx.PluginStub(grpc.insecure_channel(args.plugin))
+    bench = Bench(stub, methods, args.rate, args.duration, max(1.0, timeout * 10),
+        users=args.users, topics=args.topics)
+    achieved = bench.run()
+    print("Target rate %.0f/s, achieved %.0f/s, max in flight %d" % (args.rate, achieved, bench.max_outstanding))
+
+    passed = achieved >= args.rate * 0.95
+    for m in methods:
+        lat = sorted(bench.latencies[m])
+        over = len(lat) - sum(1 for x in lat if x <= timeout)
+        limit = percentile(lat, args.percentile / 100)
+        print("%-8s calls %d, errors %d, over timeout %d; ms p50 %.2f p99 %.2f p999 %.2f max %.2f" % (m,
+            len(lat) + bench.errors[m], bench.errors[m], over, percentile(lat, 0.5) * 1000,
+            percentile(lat, 0.99) * 1000, percentile(lat, 0.999) * 1000, (lat[-1] if lat else 0) * 1000))
+        passed = passed and bench.errors[m] == 0 and limit <= timeout
+    print("%s: p%g within %.1f ms" % ("PASS" if passed else "FAIL", args.percentile, timeout * 1000))
+    sys.exit(0 if passed else 1)
@@ -0,0 +1,437 @@
+"""Workload model for load tests of Tinode.
+
+generate writes a schedule of client actions: sessions arrive at random, last for a
+random time, and between think times publish to group and p2p topics, send typing
+notifications and read receipts, attach to and leave topics and search with 'fnd'.
+Popularity of topics and activity of users follow Zipf distributions, so a few topics
+and users get most of the traffic, as in production.
+
+The schedule is NDJSON: a header line {"workload": {parameters}} followed by events
+ordered by time, e.g.
+
+    {"t": 12.5, "s": 17, "op": "login", "user": 42}
+    {"t": 13.1, "s": 17, "op": "sub", "topic": "grp:3"}
+    {"t": 40.2, "s": 17, "op": "pub", "topic": "p2p:7", "text": "see you at lunch"}
+
+t is seconds since the start, s is the session. Topics are abstract: 'grp:N' is the
+N-th most popular group topic, 'p2p:N' is the p2p topic with user N, 'me' and 'fnd' are
+the user's own. Operations are login, logout, sub, leave, pub, kp (typing), read (read
+receipt for the latest message received in the topic) and find (search by tags with
+'fnd'). run executes a schedule against a server with tinode_grpc.session.
+
+    python workload.py generate --users=1000 --topics=200 --duration=600 > schedule.ndjson
+    python workload.py run schedule.ndjson --host=localhost:16060 --users=users.txt
+"""
+
+from __future__ import print_function
+
+import argparse
+import bisect
+import collections
+import heapq
+import itertools
+import json
+import math
+import random
+import sys
+import threading
+import time
+
+try:
+    import pkg_resources
+    from tinode_grpc import pb
+    from tinode_grpc.builder import user_agent
+    from tinode_grpc.session import Session
+except ImportError:
+    # Generating a schedule doesn't need the bindings.
+    pb = None
+
+APP_NAME = "workload"
+APP_VERSION = "1.0"
+
+# Monotonic clock: not available in python 2.
+clock = getattr(time, 'monotonic', time.time)
+
+WORDS = ("hello", "world", "meeting", "tomorrow", "lunch", "project", "deadline", "call",
+    "please", "thanks", "review", "the", "a", "is", "at", "on", "see", "you", "ok", "when")
+
+TAGS = ("travel", "music", "sports", "books", "movies", "food", "tech", "art", "games", "news")
+
+# Operations of a session between think times and their default weights.
+DEFAULT_MIX = "grp=45,p2p=30,read=15,attach=4,leave=3,find=3"
+
+class Zipf(object):
+    """Ranks 0..n-1 with probability of rank k proportional to 1/(k+1)^s"""
+    def __init__(self, n, s):
+        self.cdf = []
+        total = 0.0
+        for k in range(n):
+            total += 1.0 / (k + 1) ** s
+            self.cdf.append(total)
+        self.total = total
+
+    def sample(self, rnd):
+        return min(len(self.cdf) - 1, bisect.bisect(self.cdf, rnd.random() * self.total))
+
+def distribution(spec):
+    """Parse distribution like 'exp:30' into a function of random.Random. Supported:
+    const:X, uniform:A,B, exp:MEAN, lognormal:MEDIAN,SIGMA, pareto:MIN,ALPHA"""
+    name, _, params = spec.partition(':')
+    args = [float(x) for x in params.split(',')] if params else []
+    if name == 'const' and len(args) == 1:
+        return lambda rnd: args[0]
+    if name == 'uniform' and len(args) == 2:
+        return lambda rnd: rnd.uniform(args[0], args[1])
+    if name == 'exp' and len(args) == 1:
+        return lambda rnd: rnd.expovariate(1.0 / args[0])
+    if name == 'lognormal' and len(args) == 2:
+        return lambda rnd: rnd.lognormvariate(math.log(args[0]), args[1])
+    if name == 'pareto' and len(args) == 2:
+        return lambda rnd: args[0] * rnd.paretovariate(args[1])
+    raise ValueError("invalid distribution: " + spec)
+
+def parse_mix(spec):
+    mix = []
+    for part in spec.split(','):
+        op, _, weight = part.partition('=')
+        op = op.strip()
+        if op not in ('grp', 'p2p', 'read', 'attach', 'leave', 'find'):
+            raise ValueError("unknown operation in mix: " + op)
+        mix.append((op, float(weight)))
+    return mix
+
+class Workload(object):
+    def __init__(self, users=1000, topics=100, duration=600, arrival_rate=2, session_length='lognormal:300,1',
+            think_time='exp:20', topic_skew=1.1, user_skew=0.8, peer_skew=1.0, attach='uniform:1,4',
+            typing=0.5, mix=DEFAULT_MIX, seed=1):
+        """arrival_rate is new sessions per second; topic_skew, user_skew and peer_skew
+        are Zipf exponents of the popularity of group topics, the activity of users and
+        the choice of p2p peers; attach is the number of group topics a session
+        subscribes to at start; typing is the probability of a typing notification
+        before a message."""
+        self.params = dict(users=users, topics=topics, duration=duration, arrival_rate=arrival_rate,
+            session_length=session_length, think_time=think_time, topic_skew=topic_skew,
+            user_skew=user_skew, peer_skew=peer_skew, attach=attach, typing=typing, mix=mix, seed=seed)
+        self.duration = duration
+        self.arrival_rate = arrival_rate
+        self.session_length = distribution(session_length)
+        self.think_time = distribution(think_time)
+        self.attach = distribution(attach)
+        self.typing = typing
+        self.topic_rank = Zipf(topics, topic_skew)
+        self.user_rank = Zipf(users, user_skew)
+        self.peer_rank = Zipf(users, peer_skew)
+        self.mix = parse_mix(mix)
+        self.mix_total = sum(weight for _, weight in self.mix)
+        self.rnd = random.Random(seed)
+
+    def events(self):
+        """Generate events ordered by time. Memory is proportional to the number of
+        concurrent sessions."""
+        pending = []
+        counter = itertools.count()
+        t = 0.0
+        for sid in itertools.count():
+            t += self.rnd.expovariate(self.arrival_rate)
+            # Everything which happens before the next session starts is final.
+            while pending and (pending[0][0] <= t or t >= self.duration):
+                yield heapq.heappop(pending)[2]
+            if t >= self.duration:
+                return
+            for event in self.session(sid, t):
+                heapq.heappush(pending, (event['t'], next(counter), event))
+
+    def session(self, sid, start):
+        rnd = self.rnd
+        end = min(self.duration, start + self.session_length(rnd))
+        user = self.user_rank.sample(rnd)
+        events = []
+
+        def add(at, op, **fields):
+            fields.update(t=round(at, 3), s=sid, op=op)
+            events.append(fields)
+
+        add(start, 'login', user=user)
+        add(start, 'sub', topic='me')
+        attached = []
+        for _ in range(max(1, int(round(self.attach(rnd))))):
+            topic = 'grp:%d' % self.topic_rank.sample(rnd)
+            if topic not in attached:
+                attached.append(topic)
+                add(start, 'sub', topic=topic)
+        peers = set()
+        searching = False
+        t = start
+        while True:
+            t += self.think_time(rnd)
+            if t >= end:
+                break
+            op = self._pick(rnd)
+            if op == 'grp' and attached:
+                self._publish(add, t, end, rnd.choice(attached), rnd)
+            elif op == 'p2p':
+                peer = self.peer_rank.sample(rnd)
+                if peer == user:
+                    continue
+                topic = 'p2p:%d' % peer
+                if peer not in peers:
+                    peers.add(peer)
+                    attached.append(topic)
+                    add(t, 'sub', topic=topic)
+                self._publish(add, t, end, topic, rnd)
+            elif op == 'read' and attached:
+                add(t, 'read', topic=rnd.choice(attached))
+            elif op == 'attach':
+                topic = 'grp:%d' % self.topic_rank.sample(rnd)
+                if topic not in attached:
+                    attached.append(topic)
+                    add(t, 'sub', topic=topic)
+            elif op == 'leave' and len(attached) > 1:
+                topic = attached.pop(rnd.randrange(len(attached)))
+                if topic.startswith('p2p:'):
+                    peers.discard(int(topic[4:]))
+                add(t, 'leave', topic=topic)
+            elif op == 'find':
+                if not searching:
+                    searching = True
+                    add(t, 'sub', topic='fnd')
+                add(t, 'find', tags=rnd.sample(TAGS, rnd.randint(1, 3)))
+        add(end, 'logout')
+        return events
+
+    def _pick(self, rnd):
+        x = rnd.random() * self.mix_total
+        for op, weight in self.mix:
+            x -= weight
+            if x < 0:
+                return op
+        return self.mix[-1][0]
+
+    def _publish(self, add, t, end, topic, rnd):
+        if rnd.random() < self.typing:
+            add(t, 'kp', topic=topic)
+            # Time it takes to type the message: it's abandoned if the session ends first.
+            t += rnd.uniform(1, 5)
+            if t >= end:
+                return
+        add(t, 'pub', topic=topic, text=" ".join(rnd.choice(WORDS) for _ in range(rnd.randint(1, 20))))
+
+def read_schedule(file_name):
+    """Returns parameters of the workload and an iterator over its events"""
+    f = open(file_name) if file_name != '-' else sys.stdin
+    header = json.loads(f.readline())
+    return header.get('workload', {}), (json.loads(line) for line in f if line.strip())
+
+class Driver(object):
+    """Executes a schedule with one tinode_grpc.session.Session per scheduled session.
+    Group topic N is the N-th of topics; users are login:password pairs, user N of the
+    schedule is users[N % len(users)]."""
+    def __init__(self, addr, users, topics):
+        self.addr = addr
+        self.users = users
+        self.topics = topics
+        lib_version = pkg_resources.get_distribution("tinode_grpc").version
+        self.hi = pb.ClientHi(user_agent=user_agent(APP_NAME, APP_VERSION, lib_version), ver=lib_version)
+        self.lock = threading.Lock()
+        self.sessions = {}
+        # User IDs by index of the user, learned at login: needed to name p2p topics.
+        self.uids = {}
+        # Latest seq ID received by session and topic, for read receipts.
+        self.seq = {}
+        # p2p topics by session, as named in the schedule, which the session subscribes
+        # to once the ID of the peer is known.
+        self.unresolved = {}
+        self.stats = collections.Counter()
+
+    def count(self, name):
+        with self.lock:
+            self.stats[name] += 1
+
+    def execute(self, event):
+        op = event['op']
+        sid = event['s']
+        if op == 'login':
+            self._login(sid, event['user'])
+            return
+        session = self.sessions.get(sid)
+        if session == None:
+            self.count('skipped ' + op)
+            return
+        if op == 'logout':
+            del self.sessions[sid]
+            self.seq.pop(sid, None)
+            self.unresolved.pop(sid, None)
+            session.close()
+            self.count('sent logout')
+            return
+
+        topic = self._topic(event['topic']) if 'topic' in event else 'fnd'
+        unresolved = self.unresolved.get(sid, set())
+        if topic == None:
+            if op == 'sub':
+                unresolved.add(event['topic'])
+            elif op == 'leave':
+                unresolved.discard(event['topic'])
+            self.count('skipped ' + op)
+            return
+        if event.get('topic') in unresolved:
+            unresolved.discard(event['topic'])
+            if op == 'leave':
+                # Never subscribed.
+                self.count('skipped leave')
+                return
+            if op != 'sub':
+                # The peer has logged in since the session was to subscribe: do it now,
+                # pipelined before the request which needs it.
+                self._track(session.request('sub', pb.ClientSub(topic=topic)), 'sub')
+                self.count('sent late sub')
+        if op == 'sub':
+            self._track(session.request('sub', pb.ClientSub(topic=topic)), op)
+        elif op == 'leave':
+            self._track(session.request('leave', pb.ClientLeave(topic=topic)), op)
+        elif op == 'pub':
+            self._track(session.request('pub', pb.ClientPub(topic=topic, no_echo=True,
+                content=json.dumps(event['text']).encode('utf-8'))), op)
+        elif op == 'kp':
+            session.post(pb.ClientMsg(note=pb.ClientNote(topic=topic, what=pb.KP)))
+        elif op == 'read':
+            seq = self.seq.get(sid, {}).get(topic)
+            if seq == None:
+                self.count('skipped read')
+                return
+            session.post(pb.ClientMsg(note=pb.ClientNote(topic=topic, what=pb.READ, seq_id=seq)))
+        elif op == 'find':
+            self._track(session.request('set', pb.ClientSet(topic='fnd', query=pb.SetQuery(
+                desc=pb.SetDesc(public=json.dumps(",".join(event['tags'])).encode('utf-8'))))), op)
+            self._track(session.request('get', pb.ClientGet(topic='fnd', query=pb.GetQuery(what='sub'))), op)
+        self.count('sent ' + op)
+
+    def _topic(self, name):
+        if name in ('me', 'fnd'):
+            return name
+        kind, _, idx = name.partition(':')
+        if kind == 'grp':
+            return self.topics[int(idx) % len(self.topics)]
+        # The p2p topic is named by the ID of the peer, known once the peer has logged in.
+        return self.uids.get(int(idx) % len(self.users))
+
+    def _login(self, sid, user):
+        """{hi} and {login} are pipelined with the requests which follow them"""
+        user %= len(self.users)
+        session = Session(self.addr, lambda msg: self._on_message(sid, msg))
+        self.sessions[sid] = session
+        self.seq[sid] = {}
+        self.unresolved[sid] = set()
+        session.request('hi', self.hi)
+        future = session.request('login', pb.ClientLogin(scheme='basic', secret=self.users[user].encode('utf-8')))
+        future.add_done_callback(lambda f: self._logged_in(user, f))
+        self.count('sent login')
+
+    def _logged_in(self, user, future):
+        try:
+            ctrl, _ = future.result()
+        except Exception:
+            return
+        if ctrl.code >= 300:
+            self.count('failed login %d' % ctrl.code)
+        elif 'user' in ctrl.params:
+            self.uids[user] = json.loads(ctrl.params['user'].decode('utf-8'))
+
+    def _on_message(self, sid, msg):
+        if msg.HasField('data'):
+            seq = self.seq.get(sid)
+            if seq != None:
+                seq[msg.data.topic] = msg.data.seq_id
+            self.count('received data')
+        elif msg.HasField('pres'):
+            self.count('received pres')
+
+    def _track(self, future, op):
+        def done(f):
+            try:
+                ctrl, _ = f.result()
+                code = ctrl.code if ctrl != None else 200
+            except Exception:
+                code = 0
+            if code >= 400 or code == 0:
+                self.count('failed %s %d' % (op, code))
+        future.add_done_callback(done)
+
+    def close(self):
+        for session in list(self.sessions.values()):
+            session.close()
+        self.sessions = {}
+
+def run(file_name, addr, users, topics, speed):
+    params, events = read_schedule(file_name)
+    driver = Driver(addr, users, topics)
+    started = clock()
+    last_report = started
+    try:
+        for event in events:
+            delay = event['t'] / speed - (clock() - started)
+            if delay > 0:
+                time.sleep(delay)
+            driver.execute(event)
+            if clock() - last_report >= 10:
+                last_report = clock()
+                print("%.0fs: %d sessions, %s" % (event['t'], len(driver.sessions),
+                    ", ".join("%s %d" % item for item in sorted(driver.stats.items()))))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        driver.close()
+    return driver.stats
+
+def read_lines(file_name):
+    with open(file_name) as f:
+        return [line.strip() for line in f if line.strip()]
+
+def main():
+    parser = argparse.ArgumentParser(description="Realistic workload for Tinode load tests.")
+    commands = parser.add_subparsers(dest='cmd')
+    gen = commands.add_parser('generate', help='write a schedule to stdout')
+    gen.add_argument('--users', type=int, default=1000, help='number of users')
+    gen.add_argument('--topics', type=int, default=100, help='number of group topics')
+    gen.add_argument('--duration', type=float, default=600, help='seconds')
+    gen.add_argument('--arrival-rate', type=float, default=2, help='new sessions per second')
+    gen.add_argument('--session-length', default='lognormal:300,1', help='distribution of session length in seconds')
+    gen.add_argument('--think-time', default='exp:20', help='distribution of seconds between actions of a session')
+    gen.add_argument('--attach', default='uniform:1,4', help='distribution of the number of group topics a session subscribes to at start')
+    gen.add_argument('--topic-skew', type=float, default=1.1, help='Zipf exponent of group topic popularity')
+    gen.add_argument('--user-skew', type=float, default=0.8, help='Zipf exponent of user activity')
+    gen.add_argument('--peer-skew', type=float, default=1.0, help='Zipf exponent of the choice of p2p peers')
+    gen.add_argument('--typing', type=float, default=0.5, help='probability of a typing notification before a message')
+    gen.add_argument('--mix', default=DEFAULT_MIX, help='weights of actions: grp, p2p, read, attach, leave, find')
+    gen.add_argument('--seed', type=int, default=1, help='seed of the random generator: the same seed gives the same schedule')
+    drive = commands.add_parser('run', help='execute a schedule against a server')
+    drive.add_argument('schedule', help='schedule file, - for stdin')
+    drive.add_argument('--host', default='localhost:6061', help='address of Tinode server gRPC endpoint')
+    drive.add_argument('--users', required=True, help='file with login:password of the users, one per line')
+    drive.add_argument('--topics', required=True, help='file with names of group topics the users may subscribe to, most popular first')
+    drive.add_argument('--speed', type=float, default=1, help='run N times faster than scheduled')
+    args = parser.parse_args()
+
+    if args.cmd == 'generate':
+        try:
+            workload = Workload(args.users, args.topics, args.duration, args.arrival_rate, args.session_length,
+                args.think_time, args.topic_skew, args.user_skew, args.peer_skew, args.attach, args.typing,
+                args.mix, args.seed)
+        except ValueError as err:
+            parser.error(str(err))
+        out = sys.stdout
+        out.write(json.dumps({'workload': workload.params}) + "\n")
+        for event in workload.events():
+            out.write(json.dumps(event, sort_keys=True) + "\n")
+    elif args.cmd == 'run':
+        if pb == None:
+            parser.error("tinode_grpc is required to run a schedule")
+        for name, value in sorted(run(args.schedule, args.host, read_lines(args.users), read_lines(args.topics), args.speed).items()):
+            print(name + ":", value)
+    else:
+        parser.print_help()
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
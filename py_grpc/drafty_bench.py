@@ -0,0 +1,56 @@
+# Measures the speed of tinode_grpc.drafty.to_plain_text on the test cases of the Go
+# implementation (see tests/test_drafty.py) and on long messages.
+#
+#   python drafty_bench.py [--count=N]
+
+from __future__ import print_function
+
+import argparse
+import json
+import time
+import timeit
+
+from tinode_grpc import drafty
+
+from tests.test_drafty import VALID
+
+def make_long(words):
+    """Long message with every other word styled and nested styles"""
+    txt = []
+    fmt = []
+    at = 0
+    for i in range(words):
+        word = "word%d" % i
+        if i % 2 == 0:
+            fmt.append({"at": at, "len": len(word), "tp": ("ST", "EM", "DL", "CO")[i % 4]})
+        if i % 10 == 0:
+            fmt.append({"at": at, "len": len(word) + 6, "tp": "DL"})
+        txt.append(word)
+        at += len(word) + 1
+    return {"txt": " ".join(txt), "fmt": fmt}
+
+def bench(name, doc, count):
+    sec = min(timeit.repeat(lambda: drafty.to_plain_text(doc), number=count, repeat=3))
+    print("%-12s %10.2f us/op" % (name, sec / count * 1e6))
+
+def bench_batch(count):
+    docs = [json.dumps(src).encode('utf-8') for src in ("Plain text message", make_long(20))]
+    docs += [src.encode('utf-8') for src, _ in VALID]
+    contents = [docs[i % len(docs)] for i in range(count)]
+    start = time.time()
+    converted = sum(1 for _ in drafty.convert_batch(contents))
+    sec = time.time() - start
+    print("batch: %d messages in %.2f s, %.0f msg/s" % (converted, sec, converted / sec))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Drafty benchmark")
+    parser.add_argument('--count', type=int, default=20000, help='iterations per benchmark')
+    args = parser.parse_args()
+
+    bench("plain", "Just a string", args.count)
+    for i, (src, _) in enumerate(VALID):
+        bench("case-%d" % i, json.loads(src), args.count)
+    bench("long-100", make_long(100), args.count // 10)
+    bench("long-1000", make_long(1000), args.count // 100)
+
+    bench_batch(args.count * 10)
@@ -19,18 +19,16 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/tinode/chat",
     packages=setuptools.find_packages(),
-    install_requires=['protobuf>=3', 'grpcio>=1.9.1'],
+    install_requires=['protobuf>=3.20', 'grpcio>=1.9.1'],
+    python_requires='>=3.7',
     license="Apache 2.0",
     keywords="chat messaging messenger im tinode",
     package_data={
         "": ["GIT_VERSION"],
     },
     classifiers=(
-        "Programming Language :: Python :: 2",
-        "Programming Language :: Python :: 2.7",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.5",
-        "Programming Language :: Python :: 3.6",
+        "Programming Language :: Python :: 3.7",
         "License :: OSI Approved :: Apache Software License",
         "Operating System :: OS Independent",
         "Topic :: Communications :: Chat",
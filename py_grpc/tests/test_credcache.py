@@ -0,0 +1,121 @@
+# Tests of tinode_grpc.credcache.
+
+import base64
+import json
+import os
+import shutil
+import stat
+import tempfile
+import threading
+import time
+import unittest
+
+from tinode_grpc import credcache
+
+def rfc3339(when):
+    return time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime(when))
+
+def login_params(token, expires_in, user='usrAlice'):
+    """params of {ctrl} as in a protobuf map: JSON-encoded values"""
+    return {
+        'token': json.dumps(base64.b64encode(token).decode('ascii')).encode('utf-8'),
+        'expires': json.dumps(rfc3339(time.time() + expires_in)).encode('utf-8'),
+        'user': json.dumps(user).encode('utf-8'),
+    }
+
+class TestCredCache(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'tinode', 'credentials')
+        self.cache = credcache.CredCache(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_put_get(self):
+        key = credcache.account_key('localhost:6061', 'alice')
+        self.assertEqual(self.cache.get(key), None)
+        self.cache.put(key, login_params(b'token1', 24 * 3600))
+        self.assertEqual(self.cache.get(key), b'token1')
+        # Shared with other instances, i.e. other processes.
+        self.assertEqual(credcache.CredCache(self.path).get(key), b'token1')
+        # Readable by the owner only.
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+        # Plain dict values are accepted too.
+        self.cache.put(key, {'token': base64.b64encode(b'token2').decode('ascii'),
+            'expires': rfc3339(time.time() + 24 * 3600)})
+        self.assertEqual(self.cache.get(key), b'token2')
+
+        self.cache.delete(key)
+        self.assertEqual(self.cache.get(key), None)
+
+    def test_ignored(self):
+        self.cache.put('a', None)
+        self.cache.put('a', {'user': b'"usrAlice"'})
+        params = login_params(b'token', 24 * 3600)
+        params['expires'] = b'"never"'
+        self.cache.put('a', params)
+        self.assertEqual(self.cache.get('a'), None)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_expiry(self):
+        self.cache.put('soon', login_params(b'soon', 600))
+        self.cache.put('later', login_params(b'later', 7200))
+        # Tokens which expire within the refresh margin are not used.
+        self.assertEqual(self.cache.get('soon'), None)
+        self.assertEqual(self.cache.get('later'), b'later')
+        self.assertEqual(credcache.CredCache(self.path, refresh_margin=60).get('soon'), b'soon')
+
+        # Expired tokens are dropped when another one is saved.
+        self.cache.put('gone', login_params(b'gone', -10))
+        self.cache.put('other', login_params(b'other', 7200))
+        with open(self.path) as f:
+            self.assertEqual(sorted(json.load(f)), ['later', 'other', 'soon'])
+
+    def test_parse_time(self):
+        self.assertEqual(credcache.parse_time('1970-01-02T00:00:01.123Z'), 86401)
+
+    @unittest.skipIf(credcache.fcntl == None, "no advisory locks")
+    def test_concurrent_puts(self):
+        # Every writer reads the file, adds its entry and replaces the file: none is lost.
+        def put(i):
+            cache = credcache.CredCache(self.path)
+            for j in range(10):
+                cache.put('key%d.%d' % (i, j), login_params(b'token', 7200))
+        threads = [threading.Thread(target=put, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        with open(self.path) as f:
+            self.assertEqual(len(json.load(f)), 80)
+
+    @unittest.skipIf(credcache.fcntl == None, "no advisory locks")
+    def test_login_lock(self):
+        lock = self.cache.login_lock('alice')
+        # Another process waits until the lock is released...
+        timer = threading.Timer(0.3, lock.release)
+        timer.start()
+        started = time.time()
+        with self.cache.login_lock('alice', timeout=10):
+            waited = time.time() - started
+        timer.join()
+        self.assertGreaterEqual(waited, 0.25)
+        self.assertLess(waited, 5)
+
+        # ...or proceeds anyway after the timeout.
+        lock = self.cache.login_lock('alice')
+        started = time.time()
+        self.cache.login_lock('alice', timeout=0.3).release()
+        self.assertGreaterEqual(time.time() - started, 0.3)
+        lock.release()
+
+        # Locks of other accounts are independent.
+        with self.cache.login_lock('alice'):
+            started = time.time()
+            self.cache.login_lock('bob', timeout=10).release()
+            self.assertLess(time.time() - started, 0.25)
+
+if __name__ == '__main__':
+    unittest.main()
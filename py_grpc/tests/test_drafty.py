@@ -0,0 +1,102 @@
+# Tests of tinode_grpc.drafty. VALID and INVALID are the test cases of the Go
+# implementation (server/drafty/drafty_test.go), drafty_bench.py measures them too.
+#
+#   python -m pytest tests
+
+import json
+import unittest
+
+from tinode_grpc import drafty
+
+VALID = [
+    ('{"ent":[{"data":{"mime":"image/jpeg","name":"hello.jpg","val":"<38992, bytes: ...>"},"tp":"EX"}],'
+     '"fmt":[{"at":-1, "key":0}]}',
+     "[FILE 'hello.jpg']"),
+    ('{"ent":[{"data":{"url":"https://www.youtube.com/watch?v=dQw4w9WgXcQ"},"tp":"LN"}],'
+     '"fmt":[{"len":22}],"txt":"https://api.tinode.co/"}',
+     "[https://api.tinode.co/](https://www.youtube.com/watch?v=dQw4w9WgXcQ)"),
+    ('{"ent":[{"data":{"url":"https://api.tinode.co/"},"tp":"LN"}],'
+     '"fmt":[{"len":22}],"txt":"https://api.tinode.co/"}',
+     "https://api.tinode.co/"),
+    ('{"ent":[{"data":{"height":213,"mime":"image/jpeg","name":"roses.jpg","val":"<38992, bytes: ...>","width":638},"tp":"IM"}],'
+     '"fmt":[{"len":1}],"txt":" "}',
+     "[IMAGE 'roses.jpg']"),
+    ('{"txt":"This text is formatted and deleted too",'
+     '"fmt":[{"at":5,"len":4,"tp":"ST"},{"at":13,"len":9,"tp":"EM"},{"at":35,"len":3,"tp":"ST"},{"at":27,"len":11,"tp":"DL"}]}',
+     "This *text* is _formatted_ and ~deleted *too*~"),
+]
+
+INVALID = [
+    '{"txt":"This should fail","fmt":[{"at":50,"len":-45,"tp":"ST"}]}',
+    '{"txt":"This should fail","fmt":[{"at":0,"len":50,"tp":"ST"}]}',
+    '{"ent":[],"fmt":[{"at":0,"len":1,"tp":"ST","key":1}]}',
+    '{"ent":[{"xy": true, "tp": "XY"}],"fmt":[{"len":1,"key":-2}],"txt":" "}',
+    '{"txt":true}',
+]
+
+class TestToPlainText(unittest.TestCase):
+    def test_valid(self):
+        for src, expect in VALID:
+            self.assertEqual(drafty.to_plain_text(json.loads(src)), expect, src)
+
+    def test_invalid(self):
+        for src in INVALID:
+            with self.assertRaises(ValueError, msg=src):
+                drafty.to_plain_text(json.loads(src))
+
+    def test_plain(self):
+        self.assertEqual(drafty.to_plain_text("Just a string"), "Just a string")
+        self.assertEqual(drafty.to_plain_text(None), "")
+        self.assertEqual(drafty.to_plain_text({"txt": "no styles"}), "no styles")
+        with self.assertRaises(ValueError):
+            drafty.to_plain_text(42)
+
+    def test_line_break(self):
+        doc = {"txt": "one two", "fmt": [{"at": 3, "len": 1, "tp": "BR"}]}
+        self.assertEqual(drafty.to_plain_text(doc), "one\ntwo")
+
+    def test_overlap_clipped(self):
+        # EM starts inside ST and ends after it: it's clipped to the end of ST.
+        doc = {"txt": "abcdef", "fmt": [{"at": 0, "len": 4, "tp": "ST"}, {"at": 2, "len": 4, "tp": "EM"}]}
+        self.assertEqual(drafty.to_plain_text(doc), "*ab_cd_*ef")
+
+class TestSpans(unittest.TestCase):
+    def test_sorted_and_denormalized(self):
+        doc = json.loads(VALID[4][0])
+        self.assertEqual([(s.tp, s.at, s.end) for s in drafty.spans(doc)],
+            [("ST", 5, 9), ("EM", 13, 22), ("DL", 27, 38), ("ST", 35, 38)])
+        link = drafty.spans(json.loads(VALID[1][0]))[0]
+        self.assertEqual(link.tp, "LN")
+        self.assertEqual(link.data, {"url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ"})
+
+    def test_entities(self):
+        doc = json.loads(VALID[3][0])
+        self.assertEqual([tp for tp, _ in drafty.entities(doc)], ["IM"])
+        self.assertEqual(list(drafty.entities("plain")), [])
+
+    def test_render_formatter(self):
+        doc = json.loads(VALID[4][0])
+        html = drafty.render(doc["txt"], drafty.spans(doc),
+            lambda span, value: "<%s>%s</%s>" % (span.tp, value, span.tp))
+        self.assertEqual(html, "This <ST>text</ST> is <EM>formatted</EM> and <DL>deleted <ST>too</ST></DL>")
+
+class TestConvert(unittest.TestCase):
+    def test_parse(self):
+        self.assertEqual(drafty.parse(b'"hello"'), "hello")
+        self.assertEqual(drafty.parse(b'{"txt":"hi"}'), {"txt": "hi"})
+        self.assertEqual(drafty.parse(b''), None)
+
+    def test_convert(self):
+        self.assertEqual(drafty.convert(b'"plain"'), "plain")
+        self.assertEqual(drafty.convert(b'"esc\\"aped \\u00e9"'), 'esc"aped é')
+        self.assertEqual(drafty.convert('"été"'.encode('utf-8')), "été")
+        self.assertEqual(drafty.convert(b''), "")
+        self.assertEqual(drafty.convert(b'{not json'), None)
+
+    def test_convert_batch(self):
+        contents = [src.encode('utf-8') for src, _ in VALID] + [src.encode('utf-8') for src in INVALID]
+        self.assertEqual(list(drafty.convert_batch(contents)),
+            [expect for _, expect in VALID] + [None] * len(INVALID))
+
+if __name__ == '__main__':
+    unittest.main()
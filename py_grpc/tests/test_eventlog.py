@@ -0,0 +1,143 @@
+# Tests of tinode_grpc.eventlog.
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from tinode_grpc import eventlog
+from tinode_grpc import model_pb2 as pb
+from tinode_grpc import pluginstate
+
+def event(i):
+    return pb.AccountEvent(action=pb.CREATE, user_id='usr%04d' % i)
+
+# All events are the same size.
+RECORD_SIZE = len(pluginstate.encode_record(0, event(0)))
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+class TestEventLog(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.logs = []
+
+    def tearDown(self):
+        for log in self.logs:
+            log.close()
+        shutil.rmtree(self.dir)
+
+    def open(self, **kwargs):
+        kwargs.setdefault('sync_interval', 0.01)
+        log = eventlog.EventLog(self.dir, **kwargs)
+        self.logs.append(log)
+        return log
+
+    def reopen(self, log, **kwargs):
+        log.close()
+        self.logs.remove(log)
+        return self.open(**kwargs)
+
+    def append(self, log, start, count):
+        for i in range(start, start + count):
+            log.account(event(i))
+
+    def read_all(self, reader):
+        records = []
+        while True:
+            batch = reader.poll(max_records=7)
+            if not batch:
+                return records
+            records.extend(batch)
+
+    def test_offsets(self):
+        log = self.open(segment_size=RECORD_SIZE * 4)
+        self.append(log, 0, 10)
+        self.assertEqual(log.end, RECORD_SIZE * 10)
+        # Segments are named by the offset of their first event.
+        self.assertEqual(eventlog.segments(self.dir), [0, RECORD_SIZE * 4, RECORD_SIZE * 8])
+
+        reader = eventlog.EventLog.reader(self.dir)
+        records = self.read_all(reader)
+        self.assertEqual([offset for offset, _, _ in records], [RECORD_SIZE * (i + 1) for i in range(10)])
+        self.assertEqual([e.user_id for _, name, e in records if name == 'account'], ['usr%04d' % i for i in range(10)])
+
+        # Reading from an offset skips the events before it.
+        reader = eventlog.EventLog.reader(self.dir, offset=RECORD_SIZE * 6)
+        self.assertEqual([e.user_id for _, _, e in self.read_all(reader)], ['usr%04d' % i for i in range(6, 10)])
+        reader.close()
+
+    def test_tail(self):
+        log = self.open()
+        reader = eventlog.EventLog.reader(self.dir)
+        self.assertEqual(reader.poll(), [])
+        self.append(log, 0, 2)
+        self.assertEqual(len(reader.poll()), 2)
+        # Events appended after the segment was mapped.
+        self.append(log, 2, 3)
+        self.assertEqual([e.user_id for _, _, e in reader.poll(timeout=1)], ['usr0002', 'usr0003', 'usr0004'])
+        reader.close()
+
+    def test_consumer(self):
+        log = self.open()
+        self.append(log, 0, 5)
+        reader = eventlog.EventLog.reader(self.dir, 'indexer')
+        self.assertEqual(len(reader.poll(max_records=3)), 3)
+        reader.commit()
+        # Uncommitted progress is lost.
+        reader.poll()
+        reader.close()
+
+        reader = eventlog.EventLog.reader(self.dir, 'indexer')
+        self.assertEqual([e.user_id for _, _, e in reader.poll()], ['usr0003', 'usr0004'])
+        reader.close()
+        with self.assertRaises(ValueError):
+            eventlog.EventLog.reader(self.dir).commit()
+
+    def test_retention_bytes(self):
+        log = self.open(segment_size=RECORD_SIZE * 4, retention_bytes=RECORD_SIZE * 10)
+        self.append(log, 0, 20)
+        # Whole segments are removed, never the current one.
+        self.assertTrue(wait_for(lambda: eventlog.segments(self.dir)[0] == RECORD_SIZE * 12))
+
+        # A consumer which fell behind continues from the oldest event left.
+        reader = eventlog.EventLog.reader(self.dir, offset=0)
+        self.assertEqual([e.user_id for _, _, e in self.read_all(reader)], ['usr%04d' % i for i in range(12, 20)])
+        reader.close()
+
+    def test_retention_age(self):
+        log = self.open(segment_size=RECORD_SIZE * 4, retention=3600)
+        self.append(log, 0, 8)
+        old = time.time() - 7200
+        os.utime(eventlog.segment_path(self.dir, 0), (old, old))
+        # Rolling over to a new segment applies retention.
+        self.append(log, 8, 1)
+        self.assertTrue(wait_for(lambda: eventlog.segments(self.dir)[0] == RECORD_SIZE * 4))
+        self.assertEqual(eventlog.segments(self.dir), [RECORD_SIZE * 4, RECORD_SIZE * 8])
+
+    def test_torn_tail(self):
+        log = self.open()
+        self.append(log, 0, 3)
+        log = self.reopen(log)
+        # The process died in the middle of writing a record.
+        with open(eventlog.segment_path(self.dir, 0), 'ab') as f:
+            f.write(pluginstate.encode_record(0, event(99))[:-2])
+
+        log = self.reopen(log)
+        # The segment is kept as is and the log continues after the last valid record.
+        self.assertEqual(eventlog.segments(self.dir), [0, RECORD_SIZE * 3])
+        self.assertEqual(log.end, RECORD_SIZE * 3)
+        self.append(log, 3, 2)
+        reader = eventlog.EventLog.reader(self.dir)
+        records = self.read_all(reader)
+        self.assertEqual([e.user_id for _, _, e in records], ['usr%04d' % i for i in range(5)])
+        self.assertEqual(records[-1][0], log.end)
+        reader.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+# Tests of tinode_grpc.pluginstate.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from tinode_grpc import model_pb2 as pb
+from tinode_grpc import pluginstate
+
+class Handler(object):
+    """Remembers the IDs of created accounts"""
+    def __init__(self):
+        self.users = []
+
+    def account(self, event):
+        self.users.append(event.user_id)
+
+    def snapshot(self):
+        return list(self.users)
+
+    def restore(self, data):
+        self.users = data
+
+def event(i):
+    return pb.AccountEvent(action=pb.CREATE, user_id='usr%d' % i)
+
+class TestRecords(unittest.TestCase):
+    def test_round_trip(self):
+        data = b''.join(pluginstate.encode_record(0, event(i)) for i in range(3))
+        records = list(pluginstate.decode_records(data))
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[-1][0], len(data))
+        self.assertEqual([pb.AccountEvent.FromString(payload).user_id for _, _, payload in records],
+            ['usr0', 'usr1', 'usr2'])
+
+    def test_stops_at_damage(self):
+        first = pluginstate.encode_record(0, event(0))
+        second = pluginstate.encode_record(0, event(1))
+        # Incomplete record.
+        self.assertEqual(len(list(pluginstate.decode_records(first + second[:-1]))), 1)
+        # Corrupt payload.
+        bad = second[:6] + bytes([second[6] ^ 1]) + second[7:]
+        self.assertEqual(len(list(pluginstate.decode_records(first + bad + first))), 1)
+        # Unknown event type.
+        bad = bytes([len(pluginstate.EVENTS)]) + second[1:]
+        self.assertEqual(len(list(pluginstate.decode_records(first + bad))), 1)
+
+class TestPersistent(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def open(self, **kwargs):
+        handler = Handler()
+        return handler, pluginstate.Persistent(handler, self.dir, **kwargs)
+
+    def test_replay(self):
+        _, state = self.open()
+        for i in range(10):
+            state.account(event(i))
+        state.close()
+        handler, state = self.open()
+        self.assertEqual(handler.users, ['usr%d' % i for i in range(10)])
+        state.close()
+
+    def test_torn_tail(self):
+        _, state = self.open()
+        for i in range(5):
+            state.account(event(i))
+        state.close()
+        log = os.path.join(self.dir, 'log.0')
+        valid = os.path.getsize(log)
+        # The process died in the middle of writing a record.
+        with open(log, 'ab') as f:
+            f.write(pluginstate.encode_record(0, event(5))[:-3])
+
+        handler, state = self.open()
+        self.assertEqual(handler.users, ['usr%d' % i for i in range(5)])
+        self.assertEqual(os.path.getsize(log), valid)
+        # Events logged after the recovery are not lost behind the torn record.
+        state.account(event(6))
+        state.close()
+        handler, state = self.open()
+        self.assertEqual(handler.users, ['usr%d' % i for i in range(5)] + ['usr6'])
+        state.close()
+
+    def test_snapshot(self):
+        _, state = self.open()
+        for i in range(5):
+            state.account(event(i))
+        state.snapshot()
+        state.account(event(5))
+        state.close()
+        self.assertEqual(sorted(os.listdir(self.dir)), ['log.1', 'snapshot'])
+
+        handler, state = self.open()
+        self.assertEqual(handler.users, ['usr%d' % i for i in range(6)])
+        state.close()
+
+    def test_snapshot_every(self):
+        _, state = self.open(snapshot_every=4, durable=True)
+        for i in range(10):
+            state.account(event(i))
+        state.close()
+        handler, state = self.open()
+        self.assertEqual(handler.users, ['usr%d' % i for i in range(10)])
+        state.close()
+
+    def test_crash_before_snapshot_saved(self):
+        # The log was rotated, but the process died before the snapshot was saved.
+        _, state = self.open()
+        for i in range(3):
+            state.account(event(i))
+        with state.lock:
+            # Start the next log and drop the function which saves the snapshot.
+            state._rotate()
+        state.account(event(3))
+        state.close()
+        self.assertEqual(sorted(os.listdir(self.dir)), ['log.0', 'log.1'])
+
+        handler, state = self.open()
+        self.assertEqual(handler.users, ['usr%d' % i for i in range(4)])
+        state.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+# Tests of tinode_grpc.retention.
+
+from concurrent import futures
+import unittest
+
+from tinode_grpc import model_pb2 as pb
+from tinode_grpc import retention
+
+class FakeSession(object):
+    """Topic with messages 1..last, message N sent at N seconds, some deleted"""
+    def __init__(self, last, deleted=()):
+        self.last = last
+        self.deleted = set(deleted)
+        self.requests = []
+
+    def request(self, name, msg, user=None):
+        self.requests.append(name)
+        future = futures.Future()
+        future.set_result((pb.ServerCtrl(code=200), []))
+        return future
+
+    def call(self, name, msg, user=None):
+        self.requests.append(name)
+        if name == 'get' and msg.query.what == 'desc':
+            return [pb.ServerMeta(desc=pb.TopicDesc(seq_id=self.last))]
+        if name == 'get':
+            # Newest messages below before_id, newest first like the server sends them.
+            opts = msg.query.data
+            page = []
+            for seq in range(opts.before_id - 1, 0, -1):
+                if len(page) == opts.limit:
+                    break
+                if seq not in self.deleted:
+                    page.append(pb.ServerData(seq_id=seq, timestamp=seq * 1000))
+            return page
+        if name == 'del':
+            for r in msg.del_seq:
+                self.deleted.update(range(r.low, r.hi))
+            return []
+        raise AssertionError(name)
+
+class TestSeqRanges(unittest.TestCase):
+    def test_collapse(self):
+        self.assertEqual(retention.seq_ranges([]), [])
+        self.assertEqual(retention.seq_ranges([5, 1, 2, 3, 3, 7, 8]), [(1, 4), (5, 6), (7, 9)])
+
+    def test_keep(self):
+        # Missing ids are treated as deleted unless kept.
+        self.assertEqual(retention.seq_ranges([1, 3, 6], keep=[]), [(1, 7)])
+        self.assertEqual(retention.seq_ranges([1, 3, 6], keep=[4]), [(1, 4), (6, 7)])
+        self.assertEqual(retention.seq_ranges([1, 3, 6], keep=[2, 5]), [(1, 2), (3, 4), (6, 7)])
+
+class TestBatchRanges(unittest.TestCase):
+    def test_limit(self):
+        self.assertEqual(retention.batch_ranges([]), [])
+        self.assertEqual(retention.batch_ranges([(1, 3), (4, 6), (7, 9)], limit=4),
+            [[(1, 3), (4, 6)], [(7, 9)]])
+
+    def test_long_range_alone(self):
+        self.assertEqual(retention.batch_ranges([(1, 2), (3, 100), (200, 201)], limit=10),
+            [[(3, 100)], [(1, 2), (200, 201)]])
+
+class TestRetention(unittest.TestCase):
+    def test_process(self):
+        session = FakeSession(1000)
+        count = retention.Retention(session, cutoff=700, rate=0).process('grpA')
+        self.assertEqual(count, 699)
+        self.assertEqual(session.deleted, set(range(1, 700)))
+        # Attached to the topic and left it afterwards.
+        self.assertEqual(session.requests[0], 'sub')
+        self.assertEqual(session.requests[-1], 'leave')
+
+    def test_gaps_in_page(self):
+        # Deleted ids are covered too, messages newer than the cutoff are kept.
+        session = FakeSession(100, deleted=[40, 41, 60])
+        retention.Retention(session, cutoff=50, rate=0).process('grpA')
+        self.assertEqual(sorted(set(range(1, 101)) - session.deleted), list(range(50, 60)) + list(range(61, 101)))
+
+    def test_nothing_old(self):
+        session = FakeSession(100)
+        self.assertEqual(retention.Retention(session, cutoff=0, rate=0).process('grpA'), 0)
+        self.assertNotIn('del', session.requests)
+
+    def test_everything_old(self):
+        session = FakeSession(100)
+        self.assertEqual(retention.Retention(session, cutoff=1000, rate=0).process('grpA'), 100)
+        self.assertEqual(session.deleted, set(range(1, 101)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,229 @@
+"""Archive of published messages in columnar files for analytics.
+
+Archive is a plugin handler (see tinode_grpc.plugin) for Message events. Messages are
+buffered in memory and the call returns immediately. A background thread writes the
+buffer out when it reaches batch_size messages or every flush_interval seconds, one file
+per day and topic:
+
+    <directory>/date=2019-01-31/topic=grpXXXX/part-<time>-<pid>-<N>.parquet
+
+Requires pyarrow. Files are written as Parquet or, with fmt='arrow', as Arrow IPC files.
+Messages which fail to be written are kept and retried. Those still not written when the
+archive is closed are saved to <directory>/unwritten-<time>-<pid>.pickle and written on
+the next start.
+
+Run as a plugin:
+
+    python -m tinode_grpc.archive --listen=0.0.0.0:40054 --directory=archive
+"""
+
+from __future__ import print_function
+
+import argparse
+import datetime
+import itertools
+import os
+import pickle
+import threading
+import time
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+from . import model_pb2 as pb
+from . import plugin
+
+if pyarrow != None:
+    SCHEMA = pyarrow.schema([
+        ('topic', pyarrow.string()),
+        ('from_user_id', pyarrow.string()),
+        ('timestamp', pyarrow.timestamp('ms')),
+        ('seq_id', pyarrow.int32()),
+        ('head', pyarrow.map_(pyarrow.string(), pyarrow.binary())),
+        ('content', pyarrow.binary()),
+    ])
+
+class Archive(object):
+    def __init__(self, directory, fmt='parquet', batch_size=10000, flush_interval=10, max_pending=1000000):
+        if pyarrow == None:
+            raise ImportError("pyarrow is required for the archive, install it with 'pip install pyarrow'")
+        if fmt not in ('parquet', 'arrow'):
+            raise ValueError("unknown format '%s'" % fmt)
+        self.directory = directory
+        self.fmt = fmt
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # Messages are dropped when this many are waiting to be written.
+        self.max_pending = max_pending
+        # Counters: messages written, dropped because too many were pending, and failed
+        # attempts to write.
+        self.written = 0
+        self.dropped = 0
+        self.failures = 0
+
+        self.lock = threading.Lock()
+        self.ready = threading.Condition(self.lock)
+        self.pending = []
+        self.closed = False
+        # Time until which the writer backs off after failed writes.
+        self.retry_at = 0
+        self.counter = itertools.count()
+        self._load_unwritten()
+
+        self.writer = threading.Thread(target=self._write_loop)
+        self.writer.daemon = True
+        self.writer.start()
+
+    def message(self, event):
+        """Plugin.Message handler"""
+        if event.action != pb.CREATE:
+            return
+        msg = event.msg
+        # Servers which predate ServerData.timestamp don't set it. The event is reported as
+        # the message is published, so the time of receipt is close enough.
+        timestamp = msg.timestamp or int(time.time() * 1000)
+        row = (msg.topic, msg.from_user_id, timestamp, msg.seq_id, list(msg.head.items()), msg.content)
+        with self.lock:
+            if len(self.pending) >= self.max_pending:
+                self.dropped += 1
+                return
+            self.pending.append(row)
+            # A full batch doesn't end the backoff of a failing writer.
+            if len(self.pending) >= self.batch_size and time.time() >= self.retry_at:
+                self.ready.notify()
+
+    def stats(self):
+        with self.lock:
+            return {'written': self.written, 'pending': len(self.pending), 'dropped': self.dropped,
+                'failures': self.failures}
+
+    def close(self):
+        """Write out buffered messages and stop"""
+        with self.lock:
+            self.closed = True
+            self.ready.notify()
+        self.writer.join()
+
+    def _write_loop(self):
+        reported = 0
+        # Failed writes in a row.
+        errors = 0
+        while True:
+            with self.lock:
+                if errors:
+                    # Back off while writes fail. Only close() ends it early.
+                    self.retry_at = time.time() + self.flush_interval * min(2 ** errors, 32)
+                    while not self.closed and time.time() < self.retry_at:
+                        self.ready.wait(self.retry_at - time.time())
+                elif not self.closed and len(self.pending) < self.batch_size:
+                    self.ready.wait(self.flush_interval)
+                batch = self.pending
+                self.pending = []
+                closed = self.closed
+                dropped = self.dropped
+            failed = self._write(batch) if batch else []
+            if failed:
+                errors += 1
+                with self.lock:
+                    # Keep the order: failed messages go first.
+                    self.pending = failed + self.pending
+            else:
+                errors = 0
+            if dropped > reported:
+                print("Archive is behind: dropped", dropped - reported, "messages,", dropped, "in total")
+                reported = dropped
+            if closed:
+                if failed:
+                    self._save_unwritten()
+                return
+
+    def _write(self, batch):
+        """Write the batch. Returns messages which failed to be written."""
+        failed = []
+        # Partition by day and topic.
+        partitions = {}
+        for row in batch:
+            day = datetime.datetime.utcfromtimestamp(row[2] / 1000.0).strftime('%Y-%m-%d')
+            partitions.setdefault((day, row[0]), []).append(row)
+
+        stamp = time.strftime('%Y%m%d%H%M%S', time.gmtime())
+        for (day, topic), rows in partitions.items():
+            try:
+                self._write_file(os.path.join(self.directory, 'date=' + day, 'topic=' + topic), stamp, rows)
+            except Exception as err:
+                print("Failed to write", len(rows), "messages of", topic, "to archive:", err)
+                failed.extend(rows)
+        with self.lock:
+            self.written += len(batch) - len(failed)
+            if failed:
+                self.failures += 1
+        return failed
+
+    def _write_file(self, path, stamp, rows):
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        columns = list(zip(*rows))
+        table = pyarrow.Table.from_arrays([pyarrow.array(col, type=field.type)
+            for col, field in zip(columns, SCHEMA)], schema=SCHEMA)
+        name = os.path.join(path, 'part-%s-%d-%d.%s' % (stamp, os.getpid(), next(self.counter), self.fmt))
+        try:
+            if self.fmt == 'parquet':
+                pyarrow.parquet.write_table(table, name)
+            else:
+                with pyarrow.OSFile(name, 'wb') as sink:
+                    with pyarrow.ipc.new_file(sink, SCHEMA) as writer:
+                        writer.write_table(table)
+        except Exception:
+            # Don't leave a partial file behind: the rows are written again.
+            if os.path.exists(name):
+                os.remove(name)
+            raise
+
+    def _save_unwritten(self):
+        with self.lock:
+            rows = self.pending
+            self.pending = []
+        name = os.path.join(self.directory, 'unwritten-%s-%d.pickle' % (
+            time.strftime('%Y%m%d%H%M%S', time.gmtime()), os.getpid()))
+        try:
+            with open(name + '.tmp', 'wb') as f:
+                pickle.dump(rows, f, pickle.HIGHEST_PROTOCOL)
+            os.rename(name + '.tmp', name)
+            print("Saved", len(rows), "unwritten messages to", name)
+        except (IOError, OSError) as err:
+            print("Lost", len(rows), "unwritten messages:", err)
+
+    def _load_unwritten(self):
+        """Queue messages left unwritten by the previous run"""
+        if not os.path.isdir(self.directory):
+            return
+        for name in sorted(os.listdir(self.directory)):
+            if not name.startswith('unwritten-') or not name.endswith('.pickle'):
+                continue
+            path = os.path.join(self.directory, name)
+            with open(path, 'rb') as f:
+                self.pending.extend(pickle.load(f))
+            os.remove(path)
+            print("Loaded unwritten messages from", path)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Tinode plugin which archives published messages.")
+    parser.add_argument('--listen', default='0.0.0.0:40054', help='address to listen on for Plugin API calls')
+    parser.add_argument('--directory', default='archive', help='directory to write files to')
+    parser.add_argument('--format', default='parquet', choices=('parquet', 'arrow'), help='file format')
+    parser.add_argument('--batch-size', type=int, default=10000, help='write files when this many messages are buffered')
+    parser.add_argument('--flush-interval', type=float, default=10, help='write buffered messages at least every N seconds')
+    args = parser.parse_args()
+
+    archive = Archive(args.directory, args.format, args.batch_size, args.flush_interval)
+    server = plugin.serve(args.listen, [archive])
+    print("Archive plugin listening at", args.listen)
+    try:
+        plugin.wait(server)
+    finally:
+        archive.close()
+        print("Archive:", ", ".join("%s %d" % item for item in sorted(archive.stats().items())))
@@ -0,0 +1,138 @@
+"""Publishing the same message to many topics.
+
+broadcast() pipelines {sub}, {pub} and {leave} for every topic over one session (see
+tinode_grpc.session) keeping up to window topics in flight, so the time it takes depends
+on the throughput of the server rather than on the round-trip time. The content is
+serialized once. Publishing to a topic is retried when the server responds with one of
+retry_codes. Only codes which mean that the message was not accepted are retried by
+default: after a timeout or an internal error the message may have been published.
+
+Topics are left after publishing only if this call attached to them: topics the session
+was already subscribed to stay attached.
+
+    session = Session('localhost:6061')
+    session.login('announcer/1.0', 'basic', b'alice:alice123')
+    result = broadcast(session, build, topics, "Maintenance tonight at 22:00 UTC")
+    print(result.succeeded, dict(result.failed), result.retries)
+"""
+
+import collections
+import itertools
+import json
+import threading
+import time
+
+from . import model_pb2 as pb
+
+# Codes of {ctrl} worth retrying: the server is overloaded or unavailable and did not
+# publish the message.
+RETRY_CODES = (429, 503)
+
+class BroadcastResult(object):
+    def __init__(self):
+        # Number of topics the message was published to.
+        self.succeeded = 0
+        # Number of failed topics by {ctrl} code, 0 if the connection was lost.
+        self.failed = collections.Counter()
+        # (topic, code, text) of failures.
+        self.failures = []
+        # Number of requests sent again.
+        self.retries = 0
+
+def broadcast(session, build, topics, content, window=256, attach=True, on_behalf_of=None,
+        retries=2, retry_codes=RETRY_CODES, timeout=60):
+    """Publish content to every topic. content is either JSON-encoded bytes or a value to
+    encode, e.g. a string or a Drafty dict. build is a tinode_grpc.builder.Builder. With
+    attach=False the session must already be subscribed to the topics. Returns
+    BroadcastResult when all topics are done or timeout seconds after the last topic
+    was sent. If no request completes for timeout seconds while the window is full, the
+    remaining topics are not sent. Topics without a response by then are reported as
+    failed with code 0, and responses which arrive later don't change the result."""
+    if not isinstance(content, bytes):
+        content = json.dumps(content).encode('utf-8')
+    result = BroadcastResult()
+    lock = threading.Lock()
+    slots = threading.Semaphore(window)
+    # Topics sent and not done yet, a topic may be listed more than once.
+    outstanding = collections.Counter()
+    # Set once the result is returned.
+    returned = [False]
+    done = threading.Condition(lock)
+
+    def record(topic, code, text):
+        if code == None:
+            result.succeeded += 1
+        else:
+            result.failed[code] += 1
+            result.failures.append((topic, code, text))
+
+    def finish(topic, attached, code=None, text=None):
+        with lock:
+            if not returned[0]:
+                record(topic, code, text)
+                outstanding[topic] -= 1
+                if outstanding[topic] == 0:
+                    del outstanding[topic]
+                done.notify()
+        if attached:
+            session.request('leave', pb.ClientLeave(topic=topic), on_behalf_of)
+        slots.release()
+
+    def response(future):
+        try:
+            ctrl, _ = future.result()
+            return ctrl.code, ctrl.text
+        except Exception as err:
+            return 0, str(err)
+
+    def publish(topic, attached, attempt):
+        future = session.send(build.pub('', topic, content, on_behalf_of, no_echo=True))
+        future.add_done_callback(lambda f: on_published(f, topic, attached, attempt))
+
+    def on_published(future, topic, attached, attempt):
+        code, text = response(future)
+        if code >= 200 and code < 300:
+            finish(topic, attached)
+        elif code in retry_codes and attempt < retries:
+            with lock:
+                if not returned[0]:
+                    result.retries += 1
+            # Back off a little before trying again, off the reading thread.
+            timer = threading.Timer(0.1 * 2 ** attempt, publish, (topic, attached, attempt + 1))
+            timer.daemon = True
+            timer.start()
+        else:
+            finish(topic, attached, code, text)
+
+    def on_attached(future, topic):
+        code, text = response(future)
+        if code >= 200 and code < 400:
+            # 3xx: already subscribed, so the topic is not left afterwards.
+            publish(topic, code < 300, 0)
+        else:
+            finish(topic, False, code, text)
+
+    topics = iter(topics)
+    for topic in topics:
+        if not slots.acquire(timeout=timeout):
+            # The session is stuck: report the rest as not sent.
+            with lock:
+                for topic in itertools.chain([topic], topics):
+                    record(topic, 0, "not sent")
+            break
+        with lock:
+            outstanding[topic] += 1
+        if attach:
+            future = session.request('sub', pb.ClientSub(topic=topic), on_behalf_of)
+            future.add_done_callback(lambda f, topic=topic: on_attached(f, topic))
+        else:
+            publish(topic, False, 0)
+
+    deadline = time.time() + timeout
+    with lock:
+        while outstanding and time.time() < deadline:
+            done.wait(min(0.5, max(0, deadline - time.time())))
+        for topic in outstanding.elements():
+            record(topic, 0, "timed out")
+        returned[0] = True
+    return result
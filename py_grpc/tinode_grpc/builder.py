@@ -0,0 +1,82 @@
+"""Construction of client messages from cached prototypes.
+
+Building nested messages like pb.ClientMsg(pub=pb.ClientPub(...)) field by field is
+slow in Python. Builder keeps a prototype of every kind of message with the fields which
+don't change between messages already set, such as the topic or the user agent, and
+produces new messages by copying the prototype and setting the rest:
+
+    build = Builder("Tino-chatbot", "1.1", lib_version)
+    client_post(build.hi(tid))
+    for tid, text in replies:
+        client_post(build.pub(tid, topic, json.dumps(text).encode('utf-8'), no_echo=True))
+
+Builder is thread-safe.
+"""
+
+import collections
+import platform
+import threading
+
+from . import model_pb2 as pb
+
+_platform = None
+
+def user_agent(app_name, app_version, lib_version):
+    """User agent string as sent in {hi}, e.g. 'Tino-chatbot/1.1 (Linux/4.15); gRPC-python/0.15'"""
+    global _platform
+    if _platform == None:
+        _platform = platform.system() + "/" + platform.release()
+    return app_name + "/" + app_version + " (" + _platform + "); gRPC-python/" + lib_version
+
+class Builder(object):
+    def __init__(self, app_name, app_version, lib_version, lang="EN", cache_size=1024):
+        """cache_size is the number of prototypes of messages to topics to keep"""
+        self.user_agent = user_agent(app_name, app_version, lib_version)
+        self.cache_size = cache_size
+        self.lock = threading.Lock()
+        self.prototypes = collections.OrderedDict()
+        self.hi_prototype = pb.ClientMsg(hi=pb.ClientHi(user_agent=self.user_agent,
+            ver=lib_version, lang=lang))
+
+    def hi(self, id):
+        msg = self._clone(self.hi_prototype)
+        msg.hi.id = id
+        return msg
+
+    def pub(self, id, topic, content, on_behalf_of=None, no_echo=False):
+        """{pub} with content as JSON-encoded bytes"""
+        msg = self._clone(self._prototype(('pub', topic, on_behalf_of, no_echo)))
+        msg.pub.id = id
+        msg.pub.content = content
+        return msg
+
+    def note(self, topic, what, seq, on_behalf_of=None):
+        msg = self._clone(self._prototype(('note', topic, on_behalf_of, what)))
+        if seq:
+            msg.note.seq_id = seq
+        return msg
+
+    def _prototype(self, key):
+        with self.lock:
+            msg = self.prototypes.get(key)
+            if msg != None:
+                # Move to the end: most recently used.
+                self.prototypes[key] = self.prototypes.pop(key)
+                return msg
+        kind, topic, on_behalf_of, arg = key
+        if kind == 'pub':
+            msg = pb.ClientMsg(pub=pb.ClientPub(topic=topic, no_echo=arg), on_behalf_of=on_behalf_of)
+        else:
+            msg = pb.ClientMsg(note=pb.ClientNote(topic=topic, what=arg), on_behalf_of=on_behalf_of)
+        with self.lock:
+            self.prototypes[key] = msg
+            if len(self.prototypes) > self.cache_size:
+                self.prototypes.popitem(last=False)
+        return msg
+
+    @staticmethod
+    def _clone(prototype):
+        # MergeFrom into an empty message is the cheapest copy.
+        msg = pb.ClientMsg()
+        msg.MergeFrom(prototype)
+        return msg
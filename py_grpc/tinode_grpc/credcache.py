@@ -0,0 +1,159 @@
+"""Authentication tokens shared by processes which log in as the same accounts.
+
+Logging in with a token is much cheaper for the server than with a password. CredCache
+keeps the tokens issued at login in one file per machine, so any process can reuse a
+token obtained by another one instead of repeating the password login. A token is reused
+until refresh_margin seconds before it expires. Every token login returns a fresh token
+which is saved back, so tokens in use are refreshed well before they expire.
+
+When there is no usable token, processes which start at the same time would all log in
+with the password. login_lock() lets one process do it while the others wait for the
+token it obtains:
+
+    cache = CredCache()
+    key = account_key(host, 'alice')
+    lock = cache.login_lock(key)
+    token = cache.get(key)
+    if token:
+        lock.release()
+        ... login with token ...
+    else:
+        ... login with password, then cache.put(key, ctrl.params); lock.release()
+
+The file is protected with advisory locks where fcntl is available.
+"""
+
+import base64
+import calendar
+import hashlib
+import json
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.tinode', 'credentials')
+
+# Don't use tokens which expire in less than this many seconds.
+REFRESH_MARGIN = 3600
+
+def account_key(host, login):
+    """Cache key of the account"""
+    return host + '/' + login
+
+def parse_time(value):
+    """Convert RFC 3339 time like 2019-01-31T21:12:53.123Z to seconds since the epoch"""
+    return calendar.timegm(time.strptime(value[:19], '%Y-%m-%dT%H:%M:%S'))
+
+class LoginLock(object):
+    def __init__(self, fd):
+        self.fd = fd
+
+    def release(self):
+        if self.fd != None:
+            if fcntl != None:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+            os.close(self.fd)
+            self.fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+class CredCache(object):
+    def __init__(self, path=DEFAULT_PATH, refresh_margin=REFRESH_MARGIN):
+        self.path = path
+        self.refresh_margin = refresh_margin
+        directory = os.path.dirname(path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+
+    def get(self, key):
+        """Get token for the account as bytes, or None if there is no token or it expires soon"""
+        with self._locked(False):
+            entry = self._read().get(key)
+        if entry == None or entry.get('expires', 0) - time.time() < self.refresh_margin:
+            return None
+        return base64.b64decode(entry['token'].encode('ascii'))
+
+    def put(self, key, params):
+        """Save the token from the params of the {ctrl} response to login: either a dict
+        or a protobuf map of JSON-encoded values"""
+        if params == None or 'token' not in params:
+            return
+        nice = {}
+        for name in ('token', 'expires', 'user'):
+            if name in params:
+                value = params[name]
+                nice[name] = json.loads(value.decode('utf-8')) if isinstance(value, bytes) else value
+        try:
+            expires = parse_time(nice['expires'])
+        except (KeyError, ValueError):
+            return
+        entry = {'token': nice['token'], 'expires': expires, 'user': nice.get('user')}
+
+        with self._locked(True):
+            entries = self._read()
+            now = time.time()
+            # Drop expired tokens.
+            entries = dict((k, v) for k, v in entries.items() if v.get('expires', 0) > now)
+            entries[key] = entry
+            self._write(entries)
+
+    def delete(self, key):
+        """Forget the token, e.g. when the server rejected it"""
+        with self._locked(True):
+            entries = self._read()
+            if entries.pop(key, None) != None:
+                self._write(entries)
+
+    def login_lock(self, key, timeout=30):
+        """Take the exclusive right to log in to the account with a password. Waits up to
+        timeout seconds for another process to release it, then proceeds anyway."""
+        name = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        fd = os.open('%s.%s.lock' % (self.path, name), os.O_RDWR | os.O_CREAT, 0o600)
+        if fcntl != None:
+            deadline = time.time() + timeout
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except (IOError, OSError):
+                    if time.time() >= deadline:
+                        break
+                    time.sleep(0.1)
+        return LoginLock(fd)
+
+    def _write(self, entries):
+        # Called with the lock held. The file is readable by the owner only: the mode is
+        # set on creation, so a left over temporary file is removed first.
+        tmp = self.path + '.tmp'
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(entries, f)
+        os.rename(tmp, self.path)
+
+    def _read(self):
+        try:
+            with open(self.path) as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def _locked(self, exclusive):
+        # Readers and writers of the file synchronize on a separate lock file: the file
+        # itself is replaced on every write.
+        fd = os.open(self.path + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+        if fcntl != None:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        return LoginLock(fd)
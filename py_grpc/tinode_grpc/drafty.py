@@ -0,0 +1,231 @@
+"""Utilities for parsing Drafty-formatted message content and converting it to plain text.
+
+Drafty is described in https://github.com/tinode/chat/blob/master/docs/drafty.md
+"""
+
+import json
+import re
+
+ERR_UNRECOGNIZED = "content unrecognized"
+ERR_INVALID = "invalid format"
+
+# Inline styles: decoration and whether the span is void, i.e. has no text content.
+TAGS = {
+    "ST": ("*", False),
+    "EM": ("_", False),
+    "DL": ("~", False),
+    "CO": ("", False),
+    "BR": ("\n", True),
+    "LN": ("", False),
+    "MN": ("", False),
+    "HT": ("", False),
+    "IM": ("", True),
+    "EX": ("", True),
+}
+
+# JSON string without escapes or control characters.
+_PLAIN_STRING = re.compile(b'"[^"\\\\\x00-\x1f]*"\\Z')
+
+try:
+    _string_types = (str, unicode)
+except NameError:
+    _string_types = (str,)
+
+class Span(object):
+    """Style or entity applied to the [at, end) range of text. Entities are denormalized
+    into spans: tp and data are copied from the entity. Attachments have at < 0."""
+    __slots__ = ('tp', 'at', 'end', 'key', 'data')
+
+    def __init__(self, tp, at, end, key, data):
+        self.tp = tp
+        self.at = at
+        self.end = end
+        self.key = key
+        self.data = data
+
+    def __repr__(self):
+        return "Span(%r, %d, %d, %r)" % (self.tp, self.at, self.end, self.data)
+
+def parse(content):
+    """Decode JSON message content, such as ServerData.content. Returns a string for
+    plain text messages, a dict for Drafty, None for empty content."""
+    if not content:
+        return None
+    if isinstance(content, bytes):
+        content = content.decode('utf-8')
+    return json.loads(content)
+
+def entities(drafty):
+    """Iterate over (tp, data) of entities of a Drafty document"""
+    ent = drafty.get('ent') if isinstance(drafty, dict) else None
+    if not isinstance(ent, list):
+        return
+    for e in ent:
+        if isinstance(e, dict):
+            data = e.get('data')
+            yield e.get('tp') or '', data if isinstance(data, dict) else None
+
+def spans(drafty):
+    """Get spans of a Drafty document sorted by start (asc) then by length (desc).
+    Raises ValueError if the document is malformed."""
+    txt, fmt, ent = _fields(drafty)
+    if fmt == None:
+        return []
+
+    max_len = len(txt) if txt != None else 0
+    result = []
+    for f in fmt:
+        if not isinstance(f, dict):
+            continue
+        tp = f.get('tp') or ''
+        at = _int(f.get('at'))
+        end = at + _int(f.get('len'))
+        if end > max_len or end < at:
+            raise ValueError(ERR_INVALID)
+        key = _int(f.get('key'))
+        data = None
+        # Denormalize entities into spans.
+        if tp == '' and ent != None:
+            if key < 0 or key >= len(ent):
+                raise ValueError(ERR_INVALID)
+            e = ent[key]
+            if not isinstance(e, dict):
+                continue
+            data = e.get('data')
+            if not isinstance(data, dict):
+                data = None
+            tp = e.get('tp') or ''
+        if tp == '' and at == 0 and end == 0 and key == 0:
+            raise ValueError(ERR_UNRECOGNIZED)
+        result.append(Span(tp, at, end, key, data))
+
+    result.sort(key=lambda s: (s.at, -s.end))
+    return result
+
+def to_plain_text(content):
+    """Convert decoded message content to plain text. Strings are returned unchanged.
+    Raises ValueError if content is neither a string nor a valid Drafty document."""
+    if content == None:
+        return ""
+    if isinstance(content, _string_types):
+        return content
+    if not isinstance(content, dict):
+        raise ValueError(ERR_UNRECOGNIZED)
+
+    txt, fmt, ent = _fields(content)
+    if fmt == None:
+        if txt != None:
+            return txt
+        raise ValueError(ERR_UNRECOGNIZED)
+
+    return render(txt or "", spans(content))
+
+def render(txt, spans, formatter=None):
+    """Format text with sorted spans in one pass. The formatter is called as
+    formatter(span, value) for every span, from the innermost to the outermost, where
+    value is the already formatted content of the span. Spans which partially overlap
+    a preceding span are clipped to its end."""
+    formatter = formatter or format_plain
+    # Stack of open spans: [span, end, parts]. The bottom one is the whole text.
+    root = [None, len(txt), []]
+    stack = [root]
+    pos = 0
+    for sp in spans:
+        if sp.at < 0:
+            # Attachment.
+            root[2].append(formatter(sp, ""))
+            continue
+
+        # Close spans which end before the current one starts.
+        while len(stack) > 1 and stack[-1][1] <= sp.at:
+            pos = _close(stack, txt, pos, formatter)
+
+        parent = stack[-1]
+        if parent[0] != None and TAGS.get(parent[0].tp, ("", False))[1]:
+            # Void spans have no content.
+            continue
+
+        # Un-styled text before the span starts.
+        if pos < sp.at:
+            parent[2].append(txt[pos:sp.at])
+            pos = sp.at
+        stack.append([sp, min(sp.end, parent[1]), []])
+
+    while len(stack) > 1:
+        pos = _close(stack, txt, pos, formatter)
+
+    # The last unformatted range.
+    if pos < len(txt):
+        root[2].append(txt[pos:])
+
+    return "".join(root[2])
+
+def format_plain(span, value):
+    """Formatter which converts span to plain text"""
+    tp = span.tp
+    if tp in ("ST", "EM", "DL", "CO"):
+        dec = TAGS[tp][0]
+        return dec + value + dec
+    if tp == "LN":
+        url = span.data.get('url') if span.data else None
+        if url != None and url != value:
+            return "[" + value + "](" + url + ")"
+        return value
+    if tp == "BR":
+        return "\n"
+    if tp == "IM":
+        return "[IMAGE '" + _name(span.data) + "']"
+    if tp == "EX":
+        return "[FILE '" + _name(span.data) + "']"
+    return value
+
+def convert(content, decode=json.JSONDecoder().decode):
+    """Convert raw JSON message content (ServerData.content) to plain text. Returns None
+    if the content is malformed."""
+    if not content:
+        return ""
+    try:
+        if _PLAIN_STRING.match(content):
+            # Plain string without escapes: no need to parse JSON.
+            return content[1:-1].decode('utf-8')
+        return to_plain_text(decode(content.decode('utf-8')))
+    except ValueError:
+        return None
+
+def convert_batch(contents):
+    """Convert an iterable of raw message contents to plain text. Yields results in order,
+    None for malformed content."""
+    for content in contents:
+        yield convert(content)
+
+def _close(stack, txt, pos, formatter):
+    span, end, parts = stack.pop()
+    if TAGS.get(span.tp, ("", False))[1]:
+        value = ""
+    else:
+        if pos < end:
+            parts.append(txt[pos:end])
+        value = "".join(parts)
+    stack[-1][2].append(formatter(span, value))
+    return max(pos, end)
+
+def _fields(drafty):
+    txt = drafty.get('txt')
+    fmt = drafty.get('fmt')
+    ent = drafty.get('ent')
+    txt = txt if isinstance(txt, _string_types) else None
+    fmt = fmt if isinstance(fmt, list) else None
+    ent = ent if isinstance(ent, list) else None
+    if txt == None and fmt == None and ent == None:
+        raise ValueError(ERR_UNRECOGNIZED)
+    return txt, fmt, ent
+
+def _int(val):
+    # JSON numbers may be decoded as float, booleans are not numbers.
+    if isinstance(val, (int, float)) and not isinstance(val, bool):
+        return int(val)
+    return 0
+
+def _name(data):
+    name = data.get('name') if data else None
+    return name if isinstance(name, _string_types) else ""
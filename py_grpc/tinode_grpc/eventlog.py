@@ -0,0 +1,311 @@
+"""Durable local log of plugin events for any number of consumers.
+
+The Tinode server calls one address per plugin. EventLog is a plugin handler (see
+tinode_grpc.plugin) which appends every Account, Topic, Subscription and Message event to
+a log on disk and returns. Consumers read the log at their own pace, in the same or in
+other processes, so a slow consumer never delays the server.
+
+The log is a sequence of segment files named by the offset of their first byte:
+
+    <directory>/00000000000000000000.log
+    <directory>/00000000000067108917.log
+
+Records use the format of tinode_grpc.pluginstate. Offsets are byte positions in the
+log. Segments are rolled over at segment_size bytes and removed when older than
+retention seconds or when the log exceeds retention_bytes, whether or not consumers have
+read them. Consumers which fall behind continue from the oldest segment left. Segments
+are never truncated, since readers may have them mapped: if the process dies in the
+middle of a record, the log continues in a new segment which starts where the valid
+records end.
+
+Offsets of named consumers are saved in <directory>/consumers/<name>:
+
+    reader = EventLog.reader(directory, 'indexer')
+    while True:
+        for offset, name, event in reader.poll(timeout=1):
+            process(name, event)
+        reader.commit()
+
+Run as a plugin:
+
+    python -m tinode_grpc.eventlog --listen=0.0.0.0:40055 --directory=events
+"""
+
+from __future__ import print_function
+
+import argparse
+import functools
+import mmap
+import os
+import threading
+import time
+
+from . import plugin
+from . import pluginstate
+
+SEGMENT_SUFFIX = '.log'
+CONSUMERS_DIR = 'consumers'
+
+def segments(directory):
+    """Sorted list of base offsets of segments in the directory"""
+    bases = []
+    for name in os.listdir(directory):
+        if name.endswith(SEGMENT_SUFFIX) and name[:-len(SEGMENT_SUFFIX)].isdigit():
+            bases.append(int(name[:-len(SEGMENT_SUFFIX)]))
+    bases.sort()
+    return bases
+
+def segment_path(directory, base):
+    return os.path.join(directory, '%020d%s' % (base, SEGMENT_SUFFIX))
+
+class EventLog(object):
+    def __init__(self, directory, segment_size=64 << 20, retention=7 * 24 * 3600,
+            retention_bytes=0, sync_interval=0.1):
+        """Open or create the log. retention_bytes=0 means no size limit."""
+        self.directory = directory
+        self.segment_size = segment_size
+        self.retention = retention
+        self.retention_bytes = retention_bytes
+        self.sync_interval = sync_interval
+
+        self.lock = threading.Lock()
+        self.closed = False
+        self.dirty = False
+        # Segments rolled over, to be synced and closed by the background thread.
+        self.finished = []
+
+        if not os.path.isdir(os.path.join(directory, CONSUMERS_DIR)):
+            os.makedirs(os.path.join(directory, CONSUMERS_DIR))
+
+        bases = segments(directory)
+        self.base = bases[-1] if bases else 0
+        self._open_segment(self.base)
+
+        for idx, (name, _) in enumerate(pluginstate.EVENTS):
+            setattr(self, name, functools.partial(self._append, idx))
+
+        self.syncer = threading.Thread(target=self._sync_loop)
+        self.syncer.daemon = True
+        self.syncer.start()
+
+    @staticmethod
+    def reader(directory, consumer=None, offset=None):
+        """Create a reader for the log in the directory. A named consumer starts at its
+        last committed offset, otherwise at the given offset or the oldest event."""
+        return Reader(directory, consumer, offset)
+
+    @property
+    def end(self):
+        """Offset of the next event to be appended"""
+        with self.lock:
+            return self.base + self.size
+
+    def _append(self, idx, event):
+        record = pluginstate.encode_record(idx, event)
+        with self.lock:
+            if self.size > 0 and self.size + len(record) > self.segment_size:
+                self._roll()
+            self._write(record)
+            self.size += len(record)
+            self.dirty = True
+
+    def _write(self, record):
+        # The file is unbuffered: the record is visible to readers as soon as it's written.
+        # A write may be partial, e.g. when interrupted by a signal.
+        fd = self.file.fileno()
+        view = memoryview(record)
+        while view:
+            view = view[os.write(fd, view):]
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+        self.syncer.join()
+        with self.lock:
+            for f in self.finished + [self.file]:
+                os.fsync(f.fileno())
+                f.close()
+            self.finished = []
+
+    def _open_segment(self, base):
+        path = segment_path(self.directory, base)
+        size = 0
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                data = f.read()
+            for size, _, _ in pluginstate.decode_records(data):
+                pass
+            if size < len(data):
+                # Torn write at the end of the segment. Readers may have it mapped, so
+                # it's not truncated: the log continues in a new segment.
+                if size > 0:
+                    print("Segment", path, "ends with a partial record, starting a new one at", base + size)
+                    self._open_segment(base + size)
+                    return
+                # Nothing valid in it: replace it with an empty file.
+                print("Replacing segment", path, "which has no valid records")
+                open(path + '.tmp', 'wb').close()
+                os.rename(path + '.tmp', path)
+        self.base = base
+        self.size = size
+        self.file = open(path, 'ab', 0)
+
+    def _roll(self):
+        self.finished.append(self.file)
+        self._open_segment(self.base + self.size)
+
+    def _retain(self):
+        """Remove old segments, never the current one. Called from the background thread."""
+        bases = segments(self.directory)[:-1]
+        now = time.time()
+        total = self.size + sum(os.path.getsize(segment_path(self.directory, b)) for b in bases)
+        for base in bases:
+            path = segment_path(self.directory, base)
+            size = os.path.getsize(path)
+            expired = self.retention > 0 and os.path.getmtime(path) < now - self.retention
+            if expired or (self.retention_bytes > 0 and total > self.retention_bytes):
+                os.remove(path)
+                total -= size
+            else:
+                break
+
+    def _sync_loop(self):
+        # Disk work is done without the lock, so events are appended meanwhile.
+        last_retain = time.time()
+        while True:
+            time.sleep(self.sync_interval)
+            with self.lock:
+                if self.closed:
+                    return
+                finished = self.finished
+                self.finished = []
+                fd = None
+                if self.dirty:
+                    fd = os.dup(self.file.fileno())
+                    self.dirty = False
+            for f in finished:
+                os.fsync(f.fileno())
+                f.close()
+            if fd != None:
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            if finished or time.time() - last_retain > 60:
+                self._retain()
+                last_retain = time.time()
+
+class Reader(object):
+    def __init__(self, directory, consumer=None, offset=None):
+        self.directory = directory
+        self.consumer = consumer
+        if offset == None and consumer != None:
+            offset = self._load_offset()
+        self.offset = offset or 0
+        # Memory-mapped current segment.
+        self.base = None
+        self.data = None
+
+    def poll(self, max_records=1000, timeout=0):
+        """Read up to max_records events as (offset, name, event) where offset is the one
+        of the event which follows. Waits up to timeout seconds if there are none."""
+        deadline = time.time() + timeout
+        while True:
+            records = self._read(max_records)
+            if records or time.time() >= deadline:
+                return records
+            time.sleep(min(0.05, max(0, deadline - time.time())))
+
+    def commit(self, offset=None):
+        """Save the offset of the consumer: reading will resume from it"""
+        if self.consumer == None:
+            raise ValueError("offsets can be saved for named consumers only")
+        path = os.path.join(self.directory, CONSUMERS_DIR, self.consumer)
+        with open(path + '.tmp', 'w') as f:
+            f.write(str(self.offset if offset == None else offset))
+        os.rename(path + '.tmp', path)
+
+    def close(self):
+        if self.data != None:
+            self.data.close()
+            self.data = None
+
+    def _read(self, max_records):
+        records = []
+        # The mapping may end with a partially written record: remap and try again.
+        for force in (False, True):
+            if not self._map(force):
+                break
+            pos = self.offset - self.base
+            for end, idx, payload in pluginstate.decode_records(self.data, pos):
+                name, msg_type = pluginstate.EVENTS[idx]
+                self.offset = self.base + end
+                records.append((self.offset, name, msg_type.FromString(payload)))
+                if len(records) >= max_records:
+                    break
+            if records:
+                break
+        return records
+
+    def _map(self, force):
+        """Make sure the segment which contains the offset is mapped. With force, remap
+        the segment if it has grown since it was mapped. Returns False if there is
+        nothing new to read."""
+        if not force and self.data != None and self.offset < self.base + len(self.data):
+            return True
+
+        while True:
+            bases = segments(self.directory)
+            if not bases:
+                return False
+            if self.offset < bases[0]:
+                # Events were removed before the consumer could read them.
+                self.offset = bases[0]
+            base = bases[0]
+            for b in bases:
+                if b <= self.offset:
+                    base = b
+
+            path = segment_path(self.directory, base)
+            try:
+                size = os.path.getsize(path)
+                if size <= self.offset - base:
+                    return False
+                if self.data != None and base == self.base and size == len(self.data):
+                    return False
+                with open(path, 'rb') as f:
+                    data = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+            except (IOError, OSError):
+                if os.path.exists(path):
+                    raise
+                # Removed by retention since it was listed: move on to the next segment.
+                continue
+
+            self.close()
+            self.data = data
+            self.base = base
+            return True
+
+    def _load_offset(self):
+        try:
+            with open(os.path.join(self.directory, CONSUMERS_DIR, self.consumer)) as f:
+                return int(f.read().strip())
+        except (IOError, OSError, ValueError):
+            return None
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Tinode plugin which logs events for other consumers.")
+    parser.add_argument('--listen', default='0.0.0.0:40055', help='address to listen on for Plugin API calls')
+    parser.add_argument('--directory', default='events', help='directory to keep the log in')
+    parser.add_argument('--segment-size', type=int, default=64, help='size of log segments in MB')
+    parser.add_argument('--retention', type=float, default=7 * 24, help='hours to keep events')
+    parser.add_argument('--retention-size', type=int, default=0, help='maximum size of the log in MB, 0 for unlimited')
+    args = parser.parse_args()
+
+    log = EventLog(args.directory, args.segment_size << 20, args.retention * 3600, args.retention_size << 20)
+    server = plugin.serve(args.listen, [log])
+    print("Event log plugin listening at", args.listen)
+    try:
+        plugin.wait(server)
+    finally:
+        log.close()
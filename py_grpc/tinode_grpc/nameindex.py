@@ -0,0 +1,231 @@
+"""Fuzzy search of users by display name which serves Plugin.Find.
+
+Names are taken from the 'fn' of the user's public vcard in Account events, normalized
+(case, accents, punctuation) and split into trigrams. A query scores every name which
+shares trigrams with it; names which start with the query get a bonus. Only the best
+results are kept in a bounded heap.
+
+Only queries prefixed with 'name:', like 'name:alise smith', are answered: everything else
+is a search by tags and is left to other handlers and the server. With rewrite=True the
+plugin does not respond with the users found but replaces the query with the rarest tag
+of each of them, e.g. 'basic:alice,email:bob@example.com', so the server's own search by
+tags produces the result, with the server's access checks.
+
+Account events report only users changed while the plugin runs. Load the existing users
+with load() from an export, one JSON object per line as for tinode_grpc.tagindex.
+
+Run as a plugin:
+
+    python -m tinode_grpc.nameindex --listen=0.0.0.0:40053 --bootstrap=users.ndjson
+"""
+
+from __future__ import print_function
+
+import argparse
+import collections
+import heapq
+import json
+import threading
+import unicodedata
+
+from . import model_pb2 as pb
+from . import plugin
+from . import pluginstate
+
+# Results to return.
+MAX_RESULTS = 32
+# Minimum share of query trigrams a name must contain to be returned.
+MIN_SIMILARITY = 0.3
+# Prefix of queries by name.
+QUERY_PREFIX = 'name:'
+
+def normalize(name):
+    """Lower case, strip accents, replace everything but letters and digits with spaces"""
+    name = unicodedata.normalize('NFKD', name.lower())
+    out = []
+    for ch in name:
+        if unicodedata.combining(ch):
+            continue
+        out.append(ch if ch.isalnum() else ' ')
+    return ' '.join(''.join(out).split())
+
+def trigrams(text):
+    """Trigrams of normalized text. Words are padded so that short words and word starts
+    produce trigrams too."""
+    grams = set()
+    for word in text.split():
+        word = '  ' + word + ' '
+        for i in range(len(word) - 2):
+            grams.add(word[i:i + 3])
+    return grams
+
+class NameIndex(object):
+    def __init__(self, limit=MAX_RESULTS, min_similarity=MIN_SIMILARITY, rewrite=False):
+        self.limit = limit
+        self.min_similarity = min_similarity
+        self.rewrite = rewrite
+        self.lock = threading.RLock()
+        # User ID -> (normalized name, public, tags).
+        self.names = {}
+        # Trigram -> set of user IDs.
+        self.grams = {}
+        # Number of indexed users by tag, to pick the tag which identifies a user best.
+        self.tag_users = collections.Counter()
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, user_id, name, public=None, tags=()):
+        with self.lock:
+            self.remove(user_id)
+            name = normalize(name)
+            if not name:
+                return
+            tags = tuple(tags)
+            self.names[user_id] = (name, public, tags)
+            self.tag_users.update(tags)
+            for gram in trigrams(name):
+                users = self.grams.get(gram)
+                if users == None:
+                    users = set()
+                    self.grams[gram] = users
+                users.add(user_id)
+
+    def remove(self, user_id):
+        with self.lock:
+            entry = self.names.pop(user_id, None)
+            if entry == None:
+                return
+            self.tag_users.subtract(entry[2])
+            for tag in entry[2]:
+                if self.tag_users[tag] <= 0:
+                    del self.tag_users[tag]
+            for gram in trigrams(entry[0]):
+                users = self.grams[gram]
+                users.discard(user_id)
+                if not users:
+                    del self.grams[gram]
+
+    def snapshot(self):
+        """State of the index for tinode_grpc.pluginstate. Entries are immutable, so
+        a copy of the dict will do."""
+        with self.lock:
+            return dict(self.names)
+
+    def restore(self, data):
+        with self.lock:
+            self.names = {}
+            self.grams = {}
+            self.tag_users = collections.Counter()
+            for user_id, entry in data.items():
+                # Snapshots of earlier versions have no tags.
+                self.add(user_id, entry[0], entry[1], entry[2] if len(entry) > 2 else ())
+
+    def load(self, lines):
+        """Add users from lines of JSON like {"id": "usrXXX", "tags": [...], "public": {"fn": ...}}.
+        Returns the number of users with a name."""
+        count = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            public = entry.get('public')
+            name = public.get('fn') if isinstance(public, dict) else None
+            if name:
+                self.add(entry['id'], name, json.dumps(public).encode('utf-8'), entry.get('tags') or ())
+                count += 1
+        return count
+
+    def search(self, query, exclude=None):
+        """Find users with names similar to the query. Returns up to limit of
+        (user ID, public, score) ordered by score"""
+        query = normalize(query)
+        grams = trigrams(query)
+        if not grams:
+            return []
+
+        with self.lock:
+            hits = collections.Counter()
+            for gram in grams:
+                users = self.grams.get(gram)
+                if users:
+                    hits.update(users)
+            hits.pop(exclude, None)
+
+            threshold = self.min_similarity * len(grams)
+            heap = []
+            for user_id, count in hits.items():
+                if count < threshold:
+                    continue
+                name = self.names[user_id][0]
+                # Share of the query found in the name, penalized by unmatched parts of
+                # the name so that closer matches rank higher.
+                score = float(count) / len(grams) - 0.01 * (len(name) - len(query)) ** 2 / (len(name) + 1)
+                if name.startswith(query) or (' ' + query) in name:
+                    score += 1.0
+                if len(heap) < self.limit:
+                    heapq.heappush(heap, (score, user_id))
+                elif score > heap[0][0]:
+                    heapq.heapreplace(heap, (score, user_id))
+
+            heap.sort(reverse=True)
+            return [(user_id, self.names[user_id][1], score) for score, user_id in heap]
+
+    def find(self, query):
+        """Plugin.Find handler"""
+        text = query.query.strip()
+        if not text.startswith(QUERY_PREFIX):
+            return None
+        found = self.search(text[len(QUERY_PREFIX):], query.user_id)
+        if self.rewrite:
+            tags = []
+            with self.lock:
+                for user_id, _, _ in found:
+                    entry = self.names.get(user_id)
+                    if entry and entry[2]:
+                        tags.append(min(entry[2], key=lambda tag: self.tag_users[tag]))
+            if tags:
+                # Comma-separated tags: users with any of them.
+                return pb.SearchFound(status=pb.REPLACE, query=','.join(tags))
+        # Respond even if nothing is found: the server doesn't know the prefix.
+        return pb.SearchFound(status=pb.RESPOND,
+            result=[pb.TopicSub(user_id=user_id, public=public) for user_id, public, _ in found])
+
+    def account(self, event):
+        """Plugin.Account handler"""
+        if event.action == pb.DELETE:
+            self.remove(event.user_id)
+            return
+        if not event.public:
+            return
+        try:
+            public = json.loads(event.public.decode('utf-8'))
+        except ValueError:
+            return
+        name = public.get('fn') if isinstance(public, dict) else None
+        if name:
+            self.add(event.user_id, name, event.public, event.tags)
+        else:
+            self.remove(event.user_id)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Tinode Find plugin serving fuzzy search by user names.")
+    parser.add_argument('--listen', default='0.0.0.0:40053', help='address to listen on for Plugin API calls')
+    parser.add_argument('--state', help='directory to persist the index in, otherwise the index is kept in memory only')
+    parser.add_argument('--limit', type=int, default=MAX_RESULTS, help='maximum number of results')
+    parser.add_argument('--rewrite', action='store_true', help='replace name: queries with the tags of the users found instead of responding')
+    parser.add_argument('--bootstrap', help='file with existing users, one JSON object per line: {"id": "usrXXX", "tags": [...], "public": {"fn": ...}}')
+    args = parser.parse_args()
+
+    names = NameIndex(limit=args.limit, rewrite=args.rewrite)
+    index = names
+    if args.state:
+        index = pluginstate.Persistent(names, args.state)
+    if args.bootstrap:
+        with open(args.bootstrap) as f:
+            print("Loaded", names.load(f), "users")
+        if args.state:
+            index.snapshot()
+    server = plugin.serve(args.listen, [index])
+    print("Find plugin listening at", args.listen)
+    plugin.wait(server)
@@ -0,0 +1,99 @@
+"""Server side of the Tinode plugin API.
+
+Plugin passes calls from the Tinode server to a list of handlers. A handler is any object
+which implements one or more of the following methods:
+
+    fire_hose(req) -> ServerResp or None
+    find(query) -> SearchFound or None
+    account(event)
+    topic(event)
+    subscription(event)
+    message(event)
+
+fire_hose and find are offered to handlers in order until one returns a response,
+otherwise the server is told to continue with the default processing. Events are passed
+to all handlers which implement the respective method.
+"""
+
+from __future__ import print_function
+
+from concurrent import futures
+import signal
+import time
+
+import grpc
+
+from . import model_pb2 as pb
+from . import model_pb2_grpc as pbx
+
+METHODS = ('fire_hose', 'find', 'account', 'topic', 'subscription', 'message')
+
+class Plugin(pbx.PluginServicer):
+    def __init__(self, handlers=None):
+        # Bound handler methods by method name.
+        self.methods = dict((name, []) for name in METHODS)
+        for handler in handlers or []:
+            self.add_handler(handler)
+
+    def add_handler(self, handler):
+        for name in METHODS:
+            method = getattr(handler, name, None)
+            if method != None:
+                self.methods[name].append(method)
+
+    def FireHose(self, req, context):
+        for method in self.methods['fire_hose']:
+            resp = method(req)
+            if resp != None:
+                return resp
+        return pb.ServerResp(status=pb.CONTINUE)
+
+    def Find(self, query, context):
+        for method in self.methods['find']:
+            resp = method(query)
+            if resp != None:
+                return resp
+        return pb.SearchFound(status=pb.CONTINUE)
+
+    def Account(self, event, context):
+        self._notify('account', event)
+        return pb.Unused()
+
+    def Topic(self, event, context):
+        self._notify('topic', event)
+        return pb.Unused()
+
+    def Subscription(self, event, context):
+        self._notify('subscription', event)
+        return pb.Unused()
+
+    def Message(self, event, context):
+        self._notify('message', event)
+        return pb.Unused()
+
+    def _notify(self, name, event):
+        for method in self.methods[name]:
+            # Failure of one handler should not prevent others from getting the event.
+            try:
+                method(event)
+            except Exception as err:
+                print("Plugin handler failed", name, err)
+
+def serve(listen, handlers, workers=16):
+    """Start gRPC server with the plugin listening at the given address"""
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=workers))
+    pbx.add_PluginServicer_to_server(Plugin(handlers), server)
+    server.add_insecure_port(listen)
+    server.start()
+    return server
+
+def wait(server):
+    """Block until the process is terminated by a signal, then stop the server"""
+    def exit_gracefully(signo, stack_frame):
+        server.stop(0)
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGINT, exit_gracefully)
+    signal.signal(signal.SIGTERM, exit_gracefully)
+    while True:
+        time.sleep(3600)
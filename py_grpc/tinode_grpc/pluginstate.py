@@ -0,0 +1,308 @@
+"""Persistence of plugin state: a snapshot plus a write-ahead log of events received since.
+
+The Tinode server does not replay events to plugins, so state built from events is lost
+when the plugin restarts. Persistent wraps a plugin handler (see tinode_grpc.plugin) and
+appends every event to a log before passing it to the handler. The log is flushed and
+fsync'ed in batches by a background thread. Every snapshot_every events the log is started
+anew and the background thread saves the state of the handler as a snapshot. On startup
+the latest snapshot is restored and the logs written since are replayed.
+
+The handler must implement
+
+    snapshot() -> picklable copy of the complete state
+    restore(data) -> replace state with the one returned by snapshot()
+
+snapshot() is called between events and must be quick: the copy is serialized and saved
+on the background thread while events keep coming.
+
+Files in the directory: 'snapshot' and 'log.<N>' where N is the log generation. The
+snapshot records the generation of the log which continues it.
+"""
+
+from __future__ import print_function
+
+import functools
+import os
+import pickle
+import struct
+import threading
+import zlib
+
+from . import model_pb2 as pb
+
+# Events which are logged and their message types.
+EVENTS = (
+    ('account', pb.AccountEvent),
+    ('topic', pb.TopicEvent),
+    ('subscription', pb.SubscriptionEvent),
+    ('message', pb.MessageEvent),
+)
+
+# Log record: event type, length of payload, payload, CRC32 of everything before it.
+RECORD_HEADER = struct.Struct('<BI')
+RECORD_CRC = struct.Struct('<I')
+
+SNAPSHOT_FILE = 'snapshot'
+SNAPSHOT_MAGIC = b'TNPS1'
+
+def encode_record(idx, event):
+    """Serialize event of type EVENTS[idx] into a log record"""
+    payload = event.SerializeToString()
+    header = RECORD_HEADER.pack(idx, len(payload))
+    crc = zlib.crc32(payload, zlib.crc32(header)) & 0xffffffff
+    return header + payload + RECORD_CRC.pack(crc)
+
+def decode_records(data, pos=0, end=None):
+    """Iterate over valid log records in data[pos:end]. Yields (end of record, event type
+    index, payload). Stops at the first incomplete or corrupt record."""
+    if end == None:
+        end = len(data)
+    while pos + RECORD_HEADER.size <= end:
+        idx, length = RECORD_HEADER.unpack_from(data, pos)
+        stop = pos + RECORD_HEADER.size + length
+        if idx >= len(EVENTS) or stop + RECORD_CRC.size > end:
+            return
+        if zlib.crc32(data[pos:stop]) & 0xffffffff != RECORD_CRC.unpack_from(data, stop)[0]:
+            return
+        yield stop + RECORD_CRC.size, idx, data[pos + RECORD_HEADER.size:stop]
+        pos = stop + RECORD_CRC.size
+
+class Persistent(object):
+    def __init__(self, handler, directory, sync_interval=0.05, snapshot_every=100000, durable=False):
+        """Restore the handler's state from the directory and start logging events.
+        If durable is True, event calls return only after the event is fsync'ed."""
+        self.handler = handler
+        self.directory = directory
+        self.sync_interval = sync_interval
+        self.snapshot_every = snapshot_every
+        self.durable = durable
+
+        # Guards the handler and the log.
+        self.lock = threading.Lock()
+        # Signaled when the log is synced.
+        self.synced = threading.Condition(self.lock)
+        # Records written and records known to be on disk.
+        self.written = 0
+        self.flushed = 0
+        self.since_snapshot = 0
+        # A snapshot is requested, in progress, and the number of snapshots saved.
+        self.snapshot_wanted = False
+        self.snapshotting = False
+        self.snapshots = 0
+        self.log = None
+        self.closed = False
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        self.generation = self._restore()
+        self._open_log()
+
+        # Handler methods: events are logged, the rest are passed through.
+        for idx, (name, _) in enumerate(EVENTS):
+            if getattr(handler, name, None) != None:
+                setattr(self, name, functools.partial(self._event, idx))
+        for name in ('find', 'fire_hose'):
+            method = getattr(handler, name, None)
+            if method != None:
+                setattr(self, name, method)
+
+        self.syncer = threading.Thread(target=self._sync_loop)
+        self.syncer.daemon = True
+        self.syncer.start()
+
+    def _event(self, idx, event):
+        record = encode_record(idx, event)
+        with self.lock:
+            self.log.write(record)
+            self.written += 1
+            seq = self.written
+            getattr(self.handler, EVENTS[idx][0])(event)
+
+            self.since_snapshot += 1
+            if self.since_snapshot >= self.snapshot_every and not self.snapshot_wanted:
+                self.snapshot_wanted = True
+                self.synced.notify_all()
+            if self.durable:
+                while self.flushed < seq and not self.closed:
+                    self.synced.wait()
+
+    def snapshot(self):
+        """Save the state now and start a new log. Returns when the snapshot is saved."""
+        with self.lock:
+            # A snapshot in progress may have been taken before the call.
+            target = self.snapshots + (2 if self.snapshotting else 1)
+            self.snapshot_wanted = True
+            self.synced.notify_all()
+            while self.snapshots < target and not self.closed:
+                self.synced.wait()
+
+    def close(self):
+        """Sync the log and stop the background thread"""
+        with self.lock:
+            self.closed = True
+            self.synced.notify_all()
+        self.syncer.join()
+        with self.lock:
+            self.log.flush()
+            os.fsync(self.log.fileno())
+            self.log.close()
+            self.flushed = self.written
+            self.synced.notify_all()
+
+    def _sync_loop(self):
+        # Disk work is done without the lock: event calls only wait for the handler.
+        while True:
+            with self.lock:
+                if not self.snapshot_wanted and not self.closed:
+                    self.synced.wait(self.sync_interval)
+                if self.closed:
+                    return
+                if self.snapshot_wanted:
+                    job = self._rotate()
+                elif self.flushed < self.written:
+                    job = self._flush()
+                else:
+                    continue
+            job()
+
+    def _flush(self):
+        # Called with the lock held. Returns the function which fsyncs the log.
+        self.log.flush()
+        fd = os.dup(self.log.fileno())
+        target = self.written
+        def sync():
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self._mark_flushed(target)
+        return sync
+
+    def _rotate(self):
+        # Called with the lock held: copy the state and start the next log. Returns the
+        # function which saves the snapshot.
+        self.snapshot_wanted = False
+        self.snapshotting = True
+        data = self.handler.snapshot()
+        self.log.flush()
+        old = self.log
+        target = self.written
+        self.generation += 1
+        generation = self.generation
+        self._open_log()
+        self.since_snapshot = 0
+        return lambda: self._save_snapshot(old, target, generation, data)
+
+    def _save_snapshot(self, old, target, generation, data):
+        try:
+            os.fsync(old.fileno())
+            old.close()
+            self._mark_flushed(target)
+
+            path = os.path.join(self.directory, SNAPSHOT_FILE)
+            with open(path + '.tmp', 'wb') as f:
+                f.write(SNAPSHOT_MAGIC + struct.pack('<Q', generation))
+                out = _Compressor(f)
+                pickle.Pickler(out, pickle.HIGHEST_PROTOCOL).dump(data)
+                out.finish()
+                f.flush()
+                os.fsync(f.fileno())
+            os.rename(path + '.tmp', path)
+            _sync_dir(self.directory)
+
+            # Everything before the snapshot is no longer needed.
+            os.remove(self._log_path(generation - 1))
+        except (IOError, OSError) as err:
+            # The logs are kept: they are replayed on startup.
+            print("Failed to save snapshot", err)
+        with self.lock:
+            self.snapshotting = False
+            self.snapshots += 1
+            self.synced.notify_all()
+
+    def _mark_flushed(self, target):
+        with self.lock:
+            self.flushed = max(self.flushed, target)
+            self.synced.notify_all()
+
+    def _restore(self):
+        """Load snapshot and replay the log. Returns the generation of the current log"""
+        generation = 0
+        path = os.path.join(self.directory, SNAPSHOT_FILE)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                data = f.read()
+            if data[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+                raise ValueError("invalid snapshot file " + path)
+            start = len(SNAPSHOT_MAGIC)
+            generation = struct.unpack_from('<Q', data, start)[0]
+            self.handler.restore(pickle.loads(zlib.decompress(data[start + 8:])))
+
+        # Logs of older generations may be left over if the process died right after a snapshot.
+        for name in os.listdir(self.directory):
+            if name.startswith('log.') and name[4:].isdigit() and int(name[4:]) < generation:
+                os.remove(os.path.join(self.directory, name))
+
+        # Logs started after the snapshot was taken but before it was saved are replayed too.
+        count = self._replay(self._log_path(generation))
+        while os.path.exists(self._log_path(generation + 1)):
+            generation += 1
+            count += self._replay(self._log_path(generation))
+        if count > 0:
+            print("Replayed", count, "events")
+        self.since_snapshot = count
+        return generation
+
+    def _replay(self, path):
+        if not os.path.exists(path):
+            return 0
+        count = 0
+        valid = 0
+        with open(path, 'rb') as f:
+            data = f.read()
+        for valid, idx, payload in decode_records(data):
+            name, msg_type = EVENTS[idx]
+            try:
+                getattr(self.handler, name)(msg_type.FromString(payload))
+            except Exception as err:
+                # The handler failed on this event when it was received too.
+                print("Replay of", name, "event failed", err)
+            count += 1
+
+        if valid < len(data):
+            # Torn write at the end of the log: drop it.
+            print("Truncating log", path, "at", valid)
+            with open(path, 'r+b') as f:
+                f.truncate(valid)
+        return count
+
+    def _open_log(self):
+        self.log = open(self._log_path(self.generation), 'ab')
+
+    def _log_path(self, generation):
+        return os.path.join(self.directory, 'log.%d' % generation)
+
+class _Compressor(object):
+    """File-like object which compresses what is written to it. The pickler calls its
+    write() for every frame, which gives event calls a chance to take the GIL."""
+    def __init__(self, f):
+        self.f = f
+        self.compressor = zlib.compressobj()
+
+    def write(self, data):
+        self.f.write(self.compressor.compress(data))
+
+    def finish(self):
+        self.f.write(self.compressor.flush())
+
+def _sync_dir(directory):
+    # Make the rename durable. Not supported on some platforms.
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
@@ -0,0 +1,316 @@
+"""Recording of client sessions and plugin calls, and their replay against a server.
+
+Recorder wraps NodeStub.MessageLoop and writes every ClientMsg sent and every ServerMsg
+received to a file together with the time since the recording started. It's also a
+plugin handler (see tinode_grpc.plugin) which records Account, Topic, Subscription and
+Message events.
+
+    recorder = Recorder('session.rec')
+    stub = recorder.wrap(pbx.NodeStub(channel))
+    stream = stub.MessageLoop(messages)
+    ...
+    recorder.close()
+
+replay() sends the recorded client messages to a server, one stream per recorded
+stream, and plugin events to a plugin, at the recorded pace, N times faster or as fast as
+possible. Recorded server messages are not sent anywhere: replay reports how many of
+them were recorded and how many were received during replay. Records are read from the
+file as they are replayed, so recordings of any size may be replayed.
+
+Secrets are not recorded: the secret of {login} and {acc}, the password reset token of
+{acc} and the token in the response to {login} are saved empty. Replay sends recorded
+logins as they are, so they fail unless replay is given the credentials to use instead.
+
+The file starts with MAGIC followed by records: RECORD_HEADER (kind, stream, time in
+seconds, length of payload) and the serialized message. Kinds are CLIENT, SERVER and
+PLUGIN_EVENT + index of the event in tinode_grpc.pluginstate.EVENTS. Recordings which
+start with MAGIC_V1 have 16-bit stream numbers.
+
+    python -m tinode_grpc.recording replay session.rec --host=localhost:16060 --speed=10 \
+        --login-basic=alice:alice123
+    python -m tinode_grpc.recording dump session.rec
+"""
+
+from __future__ import print_function
+
+import argparse
+import collections
+import functools
+import itertools
+import struct
+import threading
+import time
+
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+import grpc
+
+from . import model_pb2 as pb
+from . import model_pb2_grpc as pbx
+from .pluginstate import EVENTS
+
+MAGIC = b'TNREC2'
+RECORD_HEADER = struct.Struct('<BIdI')
+MAGIC_V1 = b'TNREC1'
+RECORD_HEADER_V1 = struct.Struct('<BHdI')
+
+CLIENT = 0
+SERVER = 1
+PLUGIN_EVENT = 2
+
+# Plugin calls in flight at once during replay.
+PLUGIN_WINDOW = 256
+
+# Monotonic clock: not available in python 2.
+clock = getattr(time, 'monotonic', time.time)
+
+def read_records(file_name, parse=True):
+    """Iterate over records in the file as (kind, stream, time, message). With parse=False
+    the message is not read."""
+    with open(file_name, 'rb') as f:
+        magic = f.read(len(MAGIC))
+        if magic == MAGIC:
+            header_format = RECORD_HEADER
+        elif magic == MAGIC_V1:
+            header_format = RECORD_HEADER_V1
+        else:
+            raise ValueError("not a recording: " + file_name)
+        while True:
+            header = f.read(header_format.size)
+            if len(header) < header_format.size:
+                return
+            kind, stream, at, length = header_format.unpack(header)
+            if not parse:
+                f.seek(length, 1)
+                yield kind, stream, at, None
+                continue
+            payload = f.read(length)
+            if len(payload) < length:
+                # Recording was interrupted.
+                return
+            if kind == CLIENT:
+                msg = pb.ClientMsg.FromString(payload)
+            elif kind == SERVER:
+                msg = pb.ServerMsg.FromString(payload)
+            else:
+                msg = EVENTS[kind - PLUGIN_EVENT][1].FromString(payload)
+            yield kind, stream, at, msg
+
+def redact(kind, msg):
+    """Return msg without secrets, a copy if it has any"""
+    if kind == CLIENT:
+        if msg.HasField('login') and msg.login.secret:
+            msg = _copy(msg)
+            msg.login.secret = b''
+        elif msg.HasField('acc') and (msg.acc.secret or msg.acc.token):
+            msg = _copy(msg)
+            msg.acc.secret = b''
+            msg.acc.token = b''
+    elif kind == SERVER:
+        if msg.HasField('ctrl') and 'token' in msg.ctrl.params:
+            msg = _copy(msg)
+            del msg.ctrl.params['token']
+    return msg
+
+def _copy(msg):
+    copy = type(msg)()
+    copy.CopyFrom(msg)
+    return copy
+
+class Recorder(object):
+    def __init__(self, file_name):
+        self.file = open(file_name, 'wb')
+        self.file.write(MAGIC)
+        self.lock = threading.Lock()
+        self.started = clock()
+        self.streams = itertools.count()
+        for idx, (name, _) in enumerate(EVENTS):
+            setattr(self, name, functools.partial(self.record, PLUGIN_EVENT + idx, 0))
+
+    def record(self, kind, stream, msg):
+        payload = redact(kind, msg).SerializeToString()
+        with self.lock:
+            self.file.write(RECORD_HEADER.pack(kind, stream, clock() - self.started, len(payload)))
+            self.file.write(payload)
+
+    def wrap(self, stub):
+        """Return a stub whose MessageLoop calls are recorded"""
+        return RecordingStub(self, stub)
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+class RecordingStub(object):
+    def __init__(self, recorder, stub):
+        self.recorder = recorder
+        self.stub = stub
+
+    def MessageLoop(self, request_iterator, *args, **kwargs):
+        stream = next(self.recorder.streams)
+        def requests():
+            for msg in request_iterator:
+                self.recorder.record(CLIENT, stream, msg)
+                yield msg
+        return RecordingCall(self.recorder, stream, self.stub.MessageLoop(requests(), *args, **kwargs))
+
+class RecordingCall(object):
+    """Response iterator which records server messages. Other attributes of the call,
+    such as cancel(), are passed through."""
+    def __init__(self, recorder, stream, call):
+        self.recorder = recorder
+        self.stream = stream
+        self.call = call
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        msg = next(self.call)
+        self.recorder.record(SERVER, self.stream, msg)
+        return msg
+
+    next = __next__
+
+    def __getattr__(self, name):
+        return getattr(self.call, name)
+
+def replay(file_name, addr=None, plugin_addr=None, speed=1.0, linger=1.0, login=None,
+        plugin_window=PLUGIN_WINDOW):
+    """Replay the recording. speed=0 sends messages as fast as possible. Streams are
+    closed linger seconds after their last recorded message. login is (scheme, secret)
+    to use in recorded logins, which have no secret. At most plugin_window plugin calls
+    are in flight: replay waits for one to complete before making another. Returns
+    statistics."""
+    stats = collections.Counter()
+    lock = threading.Lock()
+    plugin_slots = threading.BoundedSemaphore(plugin_window)
+
+    def plugin_done(call):
+        if call.exception() != None:
+            with lock:
+                stats['plugin errors'] += 1
+        plugin_slots.release()
+
+    def receive(call):
+        try:
+            for msg in call:
+                with lock:
+                    stats['received'] += 1
+                    if msg.HasField('ctrl'):
+                        stats['ctrl %d' % msg.ctrl.code] += 1
+        except grpc.RpcError as err:
+            if err.code() != grpc.StatusCode.CANCELLED:
+                with lock:
+                    stats['stream errors'] += 1
+
+    def outbox(q):
+        while True:
+            msg = q.get()
+            if msg == None:
+                return
+            yield msg
+
+    # Time of the last client message of every stream.
+    last = {}
+    for kind, stream, at, _ in read_records(file_name, parse=False):
+        if kind == CLIENT:
+            last[stream] = at
+
+    node = pbx.NodeStub(grpc.insecure_channel(addr)) if addr else None
+    plugin = pbx.PluginStub(grpc.insecure_channel(plugin_addr)) if plugin_addr else None
+    streams = {}
+    readers = []
+    calls = []
+    closing = []
+    started = clock()
+    for kind, stream, at, msg in read_records(file_name):
+        if speed > 0:
+            delay = at / speed - (clock() - started)
+            if delay > 0:
+                time.sleep(delay)
+        # Close streams which are done.
+        while closing and closing[0][0] <= clock():
+            closing.pop(0)[1].put(None)
+
+        if kind == SERVER:
+            stats['recorded'] += 1
+        elif kind == CLIENT and node != None:
+            q = streams.get(stream)
+            if q == None:
+                q = queue.Queue()
+                streams[stream] = q
+                call = node.MessageLoop(outbox(q))
+                reader = threading.Thread(target=receive, args=(call,))
+                reader.daemon = True
+                reader.start()
+                readers.append(reader)
+                calls.append(call)
+            if login != None and msg.HasField('login') and not msg.login.secret:
+                msg.login.scheme, msg.login.secret = login
+            q.put(msg)
+            stats['sent'] += 1
+            if at == last[stream]:
+                closing.append((clock() + linger, q))
+        elif kind >= PLUGIN_EVENT and plugin != None:
+            name = EVENTS[kind - PLUGIN_EVENT][0]
+            plugin_slots.acquire()
+            getattr(plugin, name.capitalize()).future(msg).add_done_callback(plugin_done)
+            with lock:
+                stats['plugin calls'] += 1
+
+    for due, q in closing:
+        time.sleep(max(0, due - clock()))
+        q.put(None)
+    for reader in readers:
+        reader.join(linger + 5)
+    for call in calls:
+        call.cancel()
+    # Wait for the plugin calls in flight.
+    deadline = clock() + linger + 5
+    for _ in range(plugin_window):
+        if not plugin_slots.acquire(timeout=max(0, deadline - clock())):
+            break
+    stats['elapsed ms'] = int((clock() - started) * 1000)
+    return stats
+
+def dump(file_name):
+    for kind, stream, at, msg in read_records(file_name):
+        if kind >= PLUGIN_EVENT:
+            label = EVENTS[kind - PLUGIN_EVENT][0]
+        else:
+            label = ('client', 'server')[kind]
+        print("%10.3f %3d %-12s %s" % (at, stream, label, str(msg).replace('\n', ' ')))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Replay recorded Tinode sessions and plugin calls.")
+    commands = parser.add_subparsers(dest='cmd')
+    play = commands.add_parser('replay', help='send recorded messages to a server')
+    play.add_argument('file', help='recording')
+    play.add_argument('--host', help='address of Tinode server gRPC endpoint to send client messages to')
+    play.add_argument('--plugin', help='address of the plugin to send plugin events to')
+    play.add_argument('--speed', type=float, default=1, help='replay N times faster than recorded, 0 for as fast as possible')
+    play.add_argument('--linger', type=float, default=1, help='seconds to wait for responses after the last message of a stream')
+    play.add_argument('--login-basic', help='login:password to use in recorded logins')
+    play.add_argument('--login-token', help='token to use in recorded logins')
+    show = commands.add_parser('dump', help='print recorded messages')
+    show.add_argument('file', help='recording')
+    args = parser.parse_args()
+
+    if args.cmd == 'replay':
+        if not args.host and not args.plugin:
+            parser.error("nothing to replay to, use --host and/or --plugin")
+        login = None
+        if args.login_token:
+            login = ('token', args.login_token.encode('ascii'))
+        elif args.login_basic:
+            login = ('basic', args.login_basic.encode('utf-8'))
+        for name, value in sorted(replay(args.file, args.host, args.plugin, args.speed, args.linger, login).items()):
+            print(name + ":", value)
+    elif args.cmd == 'dump':
+        dump(args.file)
+    else:
+        parser.print_help()
@@ -0,0 +1,257 @@
+"""Deletion of messages older than a cutoff in many topics.
+
+For every topic Retention finds the newest message older than the cutoff by a binary
+search over pages of {get what="data"} and deletes everything up to it with as few
+SeqRanges as possible: seq ids grow with time, so that's usually a single range of any
+length. Ids of already deleted messages are covered by the ranges too. Topics are
+processed concurrently over one session (see tinode_grpc.session) and requests are paced to the given rate.
+Processed topics are appended to a checkpoint file and skipped when the job is restarted.
+
+Run as a tool:
+
+    python -m tinode_grpc.retention --login-basic=alice:alice123 --days=30 --topics=topics.txt
+
+Topics file has one topic per line, optionally followed by the ID of the user to act on
+behalf of when logged in as root. Without it the topics the user is subscribed to are
+processed.
+"""
+
+from __future__ import print_function
+
+import argparse
+import bisect
+from concurrent import futures
+import os
+import sys
+import threading
+import time
+
+from . import model_pb2 as pb
+from .session import RequestError, Session
+
+APP_NAME = "tn-retention/1.0.0"
+
+# The server rejects deletion of more messages than this in one request unless they are
+# a single range.
+MAX_DELETE_COUNT = 1024
+
+# The server limits the number of messages returned by {get}.
+PAGE_SIZE = 32
+
+def attach(session, topic, user=None):
+    """Subscribe to the topic. Returns False if the session was attached already (304),
+    so the caller knows not to leave it."""
+    ctrl, _ = session.request('sub', pb.ClientSub(topic=topic), user).result(30)
+    if ctrl.code >= 400:
+        raise RequestError(ctrl)
+    return ctrl.code < 300
+
+def seq_ranges(ids, keep=None):
+    """Collapse seq ids into a minimal list of half-open ranges (low, hi). If keep is given,
+    ids missing from the list are treated as deleted and covered by ranges too, except the
+    ids in keep."""
+    ids = sorted(set(ids))
+    keep = sorted(keep) if keep != None else None
+    ranges = []
+    for seq in ids:
+        if ranges:
+            low, hi = ranges[-1]
+            if seq == hi or (keep != None and bisect.bisect_left(keep, hi) == bisect.bisect_left(keep, seq)):
+                ranges[-1] = (low, seq + 1)
+                continue
+        ranges.append((seq, seq + 1))
+    return ranges
+
+def batch_ranges(ranges, limit=MAX_DELETE_COUNT):
+    """Split ranges into batches acceptable to the server in one {del} request: at most
+    limit messages in total or a single range of any length"""
+    batches = []
+    batch = []
+    count = 0
+    for low, hi in ranges:
+        if hi - low > limit:
+            batches.append([(low, hi)])
+            continue
+        if count + hi - low > limit:
+            batches.append(batch)
+            batch = []
+            count = 0
+        batch.append((low, hi))
+        count += hi - low
+    if batch:
+        batches.append(batch)
+    return batches
+
+class Pacer(object):
+    """Limits the rate of requests shared by all threads"""
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0
+        self.lock = threading.Lock()
+        self.next = time.time()
+
+    def wait(self):
+        if self.interval == 0:
+            return
+        with self.lock:
+            now = time.time()
+            at = max(now, self.next)
+            self.next = at + self.interval
+        if at > now:
+            time.sleep(at - now)
+
+class Retention(object):
+    def __init__(self, session, cutoff, hard=True, rate=100, checkpoint=None):
+        """Delete messages sent before cutoff, seconds since the epoch. rate is the
+        maximum number of requests per second."""
+        self.session = session
+        self.cutoff = int(cutoff * 1000)
+        self.hard = hard
+        self.pacer = Pacer(rate)
+        self.checkpoint = checkpoint
+
+        self.lock = threading.Lock()
+        self.done = 0
+        self.deleted = 0
+        self.failed = 0
+
+    def run(self, topics, concurrency=16, progress_interval=10):
+        """Process the list of (topic, on_behalf_of) pairs"""
+        skip = set()
+        if self.checkpoint != None and os.path.exists(self.checkpoint):
+            with open(self.checkpoint) as f:
+                skip = set(line.strip() for line in f)
+        topics = [t for t in topics if t[0] not in skip]
+        print("Processing", len(topics), "topics,", len(skip), "done earlier")
+
+        log = open(self.checkpoint, 'a') if self.checkpoint != None else None
+        started = time.time()
+        last_report = started
+        pool = futures.ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            jobs = dict((pool.submit(self.process, topic, user), topic) for topic, user in topics)
+            for job in futures.as_completed(jobs):
+                topic = jobs[job]
+                try:
+                    count = job.result()
+                    with self.lock:
+                        self.deleted += count
+                        self.done += 1
+                    if log != None:
+                        log.write(topic + '\n')
+                        log.flush()
+                except Exception as err:
+                    print("Failed to process", topic, err)
+                    with self.lock:
+                        self.failed += 1
+                if time.time() - last_report >= progress_interval:
+                    last_report = time.time()
+                    self.report(len(topics), last_report - started)
+        finally:
+            pool.shutdown(wait=False)
+            if log != None:
+                log.close()
+        self.report(len(topics), time.time() - started)
+
+    def report(self, total, elapsed):
+        with self.lock:
+            print("Topics %d/%d, failed %d, messages deleted %d, %.0fs" %
+                (self.done, total, self.failed, self.deleted, elapsed))
+
+    def process(self, topic, user=None):
+        """Delete old messages in one topic. Returns the number of seq ids deleted."""
+        self.pacer.wait()
+        attached = attach(self.session, topic, user)
+        try:
+            self.pacer.wait()
+            last = self.session.call('get', pb.ClientGet(topic=topic,
+                query=pb.GetQuery(what='desc')), user)[0].desc.seq_id
+            ranges = self.find_old(topic, last, user) if last > 0 else []
+            for batch in batch_ranges(ranges):
+                self.pacer.wait()
+                self.session.call('del', pb.ClientDel(topic=topic, what=pb.ClientDel.MSG,
+                    del_seq=[pb.SeqRange(low=low, hi=hi) for low, hi in batch], hard=self.hard), user)
+            return sum(hi - low for low, hi in ranges)
+        finally:
+            if attached:
+                self.pacer.wait()
+                self.session.request('leave', pb.ClientLeave(topic=topic), user)
+
+    def find_old(self, topic, last, user=None):
+        """Find ranges of messages older than the cutoff in the topic"""
+        # Messages below lower are old, messages at or above upper are not.
+        lower, upper = 1, last + 1
+        before = upper
+        while lower < upper:
+            page = self.page(topic, before, user)
+            old = [m.seq_id for m in page if m.timestamp < self.cutoff]
+            if not page or len(old) == len(page):
+                lower = before
+            elif not old:
+                upper = page[0].seq_id
+            else:
+                # The page straddles the cutoff: delete everything below it and the old
+                # messages in it.
+                ranges = seq_ranges(old, keep=[m.seq_id for m in page if m.timestamp >= self.cutoff])
+                if ranges[0][0] == page[0].seq_id:
+                    ranges[0] = (1, ranges[0][1])
+                elif page[0].seq_id > 1:
+                    ranges.insert(0, (1, page[0].seq_id))
+                return ranges
+            before = (lower + upper + 1) // 2
+        return [(1, min(lower, upper))] if lower > 1 else []
+
+    def page(self, topic, before, user=None):
+        """Newest messages with seq ids below before, oldest first"""
+        self.pacer.wait()
+        page = self.session.call('get', pb.ClientGet(topic=topic, query=pb.GetQuery(what='data',
+            data=pb.GetOpts(before_id=before, limit=PAGE_SIZE))), user)
+        return sorted(page, key=lambda m: m.seq_id)
+
+def subscribed_topics(session):
+    """Topics the user is subscribed to"""
+    attached = attach(session, 'me')
+    topics = []
+    for meta in session.call('get', pb.ClientGet(topic='me', query=pb.GetQuery(what='sub'))):
+        topics.extend(sub.topic for sub in meta.sub)
+    if attached:
+        session.request('leave', pb.ClientLeave(topic='me'))
+    return topics
+
+def read_topics(file_name):
+    topics = []
+    with open(file_name) as f:
+        for line in f:
+            parts = line.split()
+            if parts:
+                topics.append((parts[0], parts[1] if len(parts) > 1 else None))
+    return topics
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Delete Tinode messages older than the given age.")
+    parser.add_argument('--host', default='localhost:6061', help='address of Tinode server gRPC endpoint')
+    parser.add_argument('--login-basic', help='login using basic authentication username:password')
+    parser.add_argument('--login-token', help='login using token authentication')
+    parser.add_argument('--days', type=float, required=True, help='delete messages older than this many days')
+    parser.add_argument('--topics', help='file with topics to process, one per line, optionally followed by ID of the user to act as; default: topics the user is subscribed to')
+    parser.add_argument('--checkpoint', help='file to record processed topics in and to skip them on restart')
+    parser.add_argument('--soft', action='store_true', help='delete messages for the current user only')
+    parser.add_argument('--concurrency', type=int, default=16, help='number of topics to process at once')
+    parser.add_argument('--rate', type=float, default=100, help='maximum requests per second, 0 for unlimited')
+    args = parser.parse_args()
+
+    if args.login_token:
+        scheme, secret = 'token', args.login_token.encode('ascii')
+    elif args.login_basic:
+        scheme, secret = 'basic', args.login_basic.encode('utf-8')
+    else:
+        print("Error: authentication scheme not defined")
+        sys.exit(1)
+
+    session = Session(args.host)
+    try:
+        session.login(APP_NAME, scheme, secret)
+        topics = read_topics(args.topics) if args.topics else [(t, None) for t in subscribed_topics(session)]
+        job = Retention(session, time.time() - args.days * 86400, not args.soft, args.rate, args.checkpoint)
+        job.run(topics, args.concurrency)
+    finally:
+        session.close()
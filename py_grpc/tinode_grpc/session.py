@@ -0,0 +1,164 @@
+"""Client session for tools which make many requests over one MessageLoop stream.
+
+Session matches responses to requests by ID, so any number of requests may be in flight:
+
+    session = Session('localhost:6061')
+    session.login(APP_NAME, 'basic', b'alice:alice123')
+    session.call('sub', pb.ClientSub(topic='grpXXXX'))
+    messages = session.call('get', pb.ClientGet(topic='grpXXXX', query=...))
+
+{meta} and {data} received in response to a request are returned by call(). Other
+server messages are passed to on_message. The server responds to {get} of anything but
+data with a single {meta} and no {ctrl}, so such a {get} must ask for one thing at a time.
+"""
+
+from __future__ import print_function
+
+from concurrent import futures
+import itertools
+import pkg_resources
+import threading
+
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+import grpc
+
+from . import model_pb2 as pb
+from . import model_pb2_grpc as pbx
+from . import builder
+
+class RequestError(Exception):
+    def __init__(self, ctrl):
+        Exception.__init__(self, "%d %s" % (ctrl.code, ctrl.text))
+        self.code = ctrl.code
+
+class Session(object):
+    def __init__(self, addr, on_message=None, channel=None):
+        """Connect to the server. on_message(msg) is called on the reading thread with
+        server messages which are not responses to requests. Sessions may share a
+        channel: the stream is then opened on the given channel and addr is ignored."""
+        self.own_channel = channel == None
+        self.channel = grpc.insecure_channel(addr) if self.own_channel else channel
+        self.on_message = on_message
+        self.closed = False
+        self.outbox = queue.Queue()
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        # Futures of requests in flight by request ID: resolved with (ctrl, replies).
+        self.pending = {}
+        # {meta} and {data} received ahead of the {ctrl} by request ID.
+        self.replies = {}
+        # {data} has no request ID: IDs of {get} in flight by topic.
+        self.fetching = {}
+        # IDs of {get} requests answered by a {meta} alone.
+        self.meta_only = set()
+        stream = pbx.NodeStub(self.channel).MessageLoop(self._generate())
+        self.reader = threading.Thread(target=self._read, args=(stream,))
+        self.reader.daemon = True
+        self.reader.start()
+
+    def request(self, name, msg, on_behalf_of=None):
+        """Send client message of the given type, e.g. 'sub', and return a future"""
+        return self.send(pb.ClientMsg(on_behalf_of=on_behalf_of, **{name: msg}))
+
+    def send(self, msg):
+        """Send complete ClientMsg, e.g. made by tinode_grpc.builder, and return a future.
+        The request ID is assigned by the session."""
+        name = msg.WhichOneof('Message')
+        inner = getattr(msg, name)
+        future = futures.Future()
+        with self.lock:
+            inner.id = str(next(self.ids))
+            self.pending[inner.id] = future
+            self.replies[inner.id] = []
+            if name == 'get':
+                if inner.query.what.strip() == 'data':
+                    self.fetching[inner.topic] = inner.id
+                else:
+                    self.meta_only.add(inner.id)
+        self.outbox.put(msg)
+        return future
+
+    def post(self, msg):
+        """Send ClientMsg which gets no response, i.e. {note}"""
+        self.outbox.put(msg)
+
+    def call(self, name, msg, on_behalf_of=None, timeout=30):
+        """Send the message and wait for the response. Returns list of {meta} and {data}
+        received in response, raises RequestError if the request failed. Only one {get}
+        of data per topic may be in flight."""
+        ctrl, replies = self.request(name, msg, on_behalf_of).result(timeout)
+        if ctrl != None and ctrl.code >= 300:
+            raise RequestError(ctrl)
+        return replies
+
+    def login(self, app_name, scheme, secret):
+        """Send {hi} and {login}. Returns params of the {ctrl} response to login."""
+        lib_version = pkg_resources.get_distribution("tinode_grpc").version
+        name, _, version = app_name.partition('/')
+        self.call('hi', pb.ClientHi(user_agent=builder.user_agent(name, version, lib_version),
+            ver=lib_version, lang="EN"))
+        ctrl, _ = self.request('login', pb.ClientLogin(scheme=scheme, secret=secret)).result(30)
+        if ctrl.code >= 300:
+            raise RequestError(ctrl)
+        return ctrl.params
+
+    def close(self):
+        self.closed = True
+        self.outbox.put(None)
+        if self.own_channel:
+            self.channel.close()
+
+    def _generate(self):
+        while True:
+            msg = self.outbox.get()
+            if msg == None:
+                return
+            yield msg
+
+    def _read(self, stream):
+        try:
+            for msg in stream:
+                if msg.HasField('ctrl'):
+                    with self.lock:
+                        future = self.pending.pop(msg.ctrl.id, None)
+                        replies = self.replies.pop(msg.ctrl.id, None)
+                        self.meta_only.discard(msg.ctrl.id)
+                        for topic, tid in list(self.fetching.items()):
+                            if tid == msg.ctrl.id:
+                                del self.fetching[topic]
+                    if future != None:
+                        future.set_result((msg.ctrl, replies))
+                        continue
+                elif msg.HasField('meta') and msg.meta.id in self.meta_only:
+                    with self.lock:
+                        self.meta_only.discard(msg.meta.id)
+                        future = self.pending.pop(msg.meta.id, None)
+                        self.replies.pop(msg.meta.id, None)
+                    if future != None:
+                        future.set_result((None, [msg.meta]))
+                        continue
+                elif msg.HasField('meta') or msg.HasField('data'):
+                    with self.lock:
+                        if msg.HasField('meta'):
+                            replies = self.replies.get(msg.meta.id)
+                            reply = msg.meta
+                        else:
+                            replies = self.replies.get(self.fetching.get(msg.data.topic))
+                            reply = msg.data
+                        if replies != None:
+                            replies.append(reply)
+                            continue
+                if self.on_message != None:
+                    self.on_message(msg)
+        except grpc.RpcError as err:
+            if not self.closed:
+                print("Disconnected:", err)
+        with self.lock:
+            pending = list(self.pending.values())
+            self.pending = {}
+        for future in pending:
+            future.set_exception(IOError("connection closed"))
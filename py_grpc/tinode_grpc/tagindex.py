@@ -0,0 +1,287 @@
+"""In-memory inverted index of discovery tags which serves Plugin.Find.
+
+Users and topics are numbered densely and every tag maps to a bitmap of the numbers.
+Queries are answered by intersecting the bitmaps, smallest first. Compressed bitmaps from
+pyroaring are used if the package is installed, otherwise plain sets.
+
+The index learns users from Account events only. Until it has every user, e.g. it was
+loaded from an export of the users with load() or has received events since the database
+was created, queries are passed on to the server.
+
+Run as a plugin:
+
+    python -m tinode_grpc.tagindex --listen=0.0.0.0:40052 --bootstrap=users.ndjson
+"""
+
+from __future__ import print_function
+
+import argparse
+import collections
+import heapq
+import json
+import re
+import threading
+
+try:
+    from pyroaring import BitMap as Bitmap
+except ImportError:
+    Bitmap = set
+
+from . import model_pb2 as pb
+from . import plugin
+from . import pluginstate
+
+# Maximum number of results returned by the server's own search.
+MAX_RESULTS = 1024
+
+_query_tokens = re.compile(r'"([^"]*)"|(,)|([^\s,"]+)')
+
+def parse_query(query):
+    """Split search query into required and optional tags like the server does: terms
+    separated by spaces are required, terms adjacent to a comma are optional, e.g.
+    'travel zurich,basel' requires 'travel' and either 'zurich' or 'basel'."""
+    tokens = []
+    for quoted, comma, word in _query_tokens.findall(query):
+        if comma:
+            tokens.append(None)
+        elif quoted or word:
+            tokens.append(quoted or word)
+
+    req = []
+    opt = []
+    for i, tag in enumerate(tokens):
+        if tag == None:
+            continue
+        if (i > 0 and tokens[i - 1] == None) or (i + 1 < len(tokens) and tokens[i + 1] == None):
+            opt.append(tag)
+        else:
+            req.append(tag)
+    return req, opt
+
+class TagIndex(object):
+    def __init__(self, limit=MAX_RESULTS, masked_namespaces=(), complete=False):
+        """complete: the index is known to have every user, so it can answer queries"""
+        self.limit = limit
+        self.complete = complete
+        # Tags in these namespaces can be searched for only by their owners: a query for
+        # 'email:alice@example.com' is served only if the searcher has the tag too.
+        self.masked = set(masked_namespaces)
+        self.lock = threading.RLock()
+        # ID of user or topic by number.
+        self.ids = []
+        # Number by ID.
+        self.numbers = {}
+        # Numbers of deleted entries for reuse.
+        self.free = []
+        # Tags and public of user or topic by number.
+        self.tags = []
+        self.public = []
+        # Tag -> bitmap of numbers.
+        self.postings = {}
+
+    def __len__(self):
+        return len(self.numbers)
+
+    def add(self, id, tags, public=None):
+        """Add or replace user or topic with the given tags"""
+        with self.lock:
+            num = self.numbers.get(id)
+            if num == None:
+                if self.free:
+                    num = self.free.pop()
+                    self.ids[num] = id
+                else:
+                    num = len(self.ids)
+                    self.ids.append(id)
+                    self.tags.append(None)
+                    self.public.append(None)
+                self.numbers[id] = num
+            else:
+                self._unpost(num)
+
+            tags = frozenset(tags)
+            self.tags[num] = tags
+            if public != None:
+                self.public[num] = public
+            for tag in tags:
+                posting = self.postings.get(tag)
+                if posting == None:
+                    posting = Bitmap()
+                    self.postings[tag] = posting
+                posting.add(num)
+
+    def remove(self, id):
+        with self.lock:
+            num = self.numbers.pop(id, None)
+            if num == None:
+                return
+            self._unpost(num)
+            self.ids[num] = None
+            self.tags[num] = None
+            self.public[num] = None
+            self.free.append(num)
+
+    def get_tags(self, id):
+        with self.lock:
+            num = self.numbers.get(id)
+            return self.tags[num] if num != None else None
+
+    def load(self, lines):
+        """Add users from lines of JSON like {"id": "usrXXX", "tags": [...], "public": {...}}
+        and mark the index complete. Returns the number of users loaded."""
+        count = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            public = entry.get('public')
+            self.add(entry['id'], entry.get('tags') or (),
+                json.dumps(public).encode('utf-8') if public != None else None)
+            count += 1
+        self.complete = True
+        return count
+
+    def snapshot(self):
+        """State of the index for tinode_grpc.pluginstate. Entries are immutable, so
+        copies of the lists will do."""
+        with self.lock:
+            return {'complete': self.complete, 'ids': list(self.ids), 'tags': list(self.tags),
+                'public': list(self.public)}
+
+    def restore(self, data):
+        with self.lock:
+            self.complete = self.complete or data['complete']
+            self.ids = []
+            self.numbers = {}
+            self.free = []
+            self.tags = []
+            self.public = []
+            self.postings = {}
+            for id, tags, public in zip(data['ids'], data['tags'], data['public']):
+                if id != None:
+                    self.add(id, tags, public)
+
+    def search(self, req, opt, exclude=None):
+        """Find entries which have all the required tags and, if there are no required
+        tags, at least one optional tag. Returns up to limit (id, public, matched tags)
+        ordered by the number of matched tags"""
+        with self.lock:
+            skip = self.numbers.get(exclude)
+            postings = self.postings
+            req_maps = [postings.get(tag) for tag in set(req)]
+            if None in req_maps:
+                return []
+            opt_tags = [tag for tag in set(opt) if tag in postings and tag not in req]
+            opt_maps = [postings[tag] for tag in opt_tags]
+
+            if req_maps:
+                req_maps.sort(key=len)
+                found = req_maps[0]
+                for posting in req_maps[1:]:
+                    found = found & posting
+                    if not found:
+                        return []
+            elif opt_maps:
+                found = Bitmap()
+                for posting in opt_maps:
+                    found = found | posting
+            else:
+                return []
+
+            if not opt_maps:
+                # Every match has the same score: take the first ones.
+                best = []
+                for num in found:
+                    if num != skip:
+                        best.append(num)
+                        if len(best) == self.limit:
+                            break
+            else:
+                score = collections.Counter()
+                for posting in opt_maps:
+                    score.update(found & posting)
+                if req_maps:
+                    # Entries which match none of the optional tags.
+                    for num in found:
+                        score.setdefault(num, 0)
+                score.pop(skip, None)
+                best = heapq.nlargest(self.limit, score, key=score.get)
+
+            query = set(req) | set(opt)
+            return [(self.ids[num], self.public[num], sorted(self.tags[num] & query)) for num in best]
+
+    def find(self, query):
+        """Plugin.Find handler"""
+        if not self.complete:
+            # Users the index hasn't seen would be missing from the results.
+            return None
+        req, opt = parse_query(query.query)
+        if not req and not opt:
+            return None
+
+        if self.masked:
+            own = self.get_tags(query.user_id) or ()
+            for tag in req + opt:
+                if ':' in tag and tag.split(':', 1)[0] in self.masked and tag not in own:
+                    # Let the server reject the query.
+                    return None
+
+        result = []
+        for id, public, matched in self.search(req, opt, query.user_id):
+            sub = pb.TopicSub(public=public, private=json.dumps(matched).encode('utf-8'))
+            if id.startswith('usr'):
+                sub.user_id = id
+            else:
+                sub.topic = id
+            result.append(sub)
+        return pb.SearchFound(status=pb.RESPOND, result=result)
+
+    def account(self, event):
+        """Plugin.Account handler"""
+        if event.action == pb.DELETE:
+            self.remove(event.user_id)
+        elif event.action == pb.CREATE or event.tags:
+            self.add(event.user_id, event.tags, event.public or None)
+        elif event.public:
+            # Update which does not change tags.
+            with self.lock:
+                num = self.numbers.get(event.user_id)
+                if num != None:
+                    self.public[num] = event.public
+
+    def topic(self, event):
+        """Plugin.Topic handler. Topic events don't carry tags, so topics can only be
+        removed from the index here."""
+        if event.action == pb.DELETE:
+            self.remove(event.name)
+
+    def _unpost(self, num):
+        for tag in self.tags[num]:
+            posting = self.postings[tag]
+            posting.discard(num)
+            if not posting:
+                del self.postings[tag]
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Tinode Find plugin serving search by tags from memory.")
+    parser.add_argument('--listen', default='0.0.0.0:40052', help='address to listen on for Plugin API calls')
+    parser.add_argument('--state', help='directory to persist the index in, otherwise the index is kept in memory only')
+    parser.add_argument('--masked-tags', default='', help='comma separated list of tag namespaces which can be searched only by their owners')
+    parser.add_argument('--bootstrap', help='file with all users, one JSON object per line: {"id": "usrXXX", "tags": [...], "public": {...}}')
+    parser.add_argument('--complete', action='store_true', help='the plugin has received Account events since the database was created: answer queries without --bootstrap')
+    args = parser.parse_args()
+
+    tags = TagIndex(masked_namespaces=[ns for ns in args.masked_tags.split(',') if ns], complete=args.complete)
+    index = tags
+    if args.state:
+        index = pluginstate.Persistent(tags, args.state)
+    if args.bootstrap:
+        with open(args.bootstrap) as f:
+            print("Loaded", tags.load(f), "users")
+        if args.state:
+            index.snapshot()
+    if not tags.complete:
+        print("The index has no users from before the start: queries are passed to the server, use --bootstrap")
+    server = plugin.serve(args.listen, [index])
+    print("Find plugin listening at", args.listen)
+    plugin.wait(server)
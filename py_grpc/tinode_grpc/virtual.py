@@ -0,0 +1,141 @@
+"""Many users over one connection.
+
+A session authenticated as root may act for any user by setting ClientMsg.on_behalf_of.
+VirtualSessions gives every such user a handle with the same interface as
+tinode_grpc.session.Session, so an integration acting for thousands of users needs one
+MessageLoop stream rather than one per user:
+
+    session = Session('localhost:6061')
+    session.login('bridge/1.0', 'basic', b'root:secret')
+    users = VirtualSessions(session)
+    alice = users.user('usrAlice')
+    alice.call('sub', pb.ClientSub(topic='grpXXXX'))
+    alice.send(build.pub('', 'grpXXXX', content))
+
+Only the request side works per user: responses are matched to requests by ID as in
+Session. The server keeps the subscriptions of a session by topic name, so only one user
+at a time may be attached to a topic over the session: {sub} of another user gets 304
+and does not attach it. {data}, {pres} and {info} of attached topics are sent according
+to the permissions of root, the user of the session, not of the user who subscribed;
+they and other messages which are not responses go to on_message of the session.
+Users who need their own copy of the messages need their own sessions.
+
+Every handle keeps the topics the user has attached, which the server requires for
+{pub} and {note} on behalf of the user.
+"""
+
+import base64
+from concurrent import futures
+import threading
+
+from . import model_pb2 as pb
+from .session import RequestError
+
+def _uid_bytes(user_id):
+    return base64.urlsafe_b64decode((user_id[3:] + '=').encode('ascii'))
+
+def internal_name(user_id, topic):
+    """Name of the topic as the server knows it, e.g. 'me' of user usrXXX is 'usrXXX' and
+    p2p topic 'usrYYY' is 'p2p...'"""
+    if topic == 'me':
+        return user_id
+    if topic == 'fnd':
+        return 'fnd' + user_id[3:]
+    if topic.startswith('usr') and topic != user_id:
+        try:
+            own, peer = _uid_bytes(user_id), _uid_bytes(topic)
+        except (TypeError, ValueError):
+            return topic
+        if len(own) != 8 or len(peer) != 8:
+            return topic
+        # Uids are compared as little-endian integers, lesser first.
+        pair = own + peer if own[::-1] < peer[::-1] else peer + own
+        return 'p2p' + base64.urlsafe_b64encode(pair).decode('ascii').rstrip('=')
+    return topic
+
+class VirtualSession(object):
+    """Handle of one user. Created by VirtualSessions.user()."""
+    def __init__(self, host, user_id):
+        self.host = host
+        self.user_id = user_id
+        # Topics the user is attached to: {name as seen by the user: internal name}.
+        self.topics = {}
+        # For use by the application.
+        self.state = {}
+
+    def request(self, name, msg):
+        return self.send(pb.ClientMsg(**{name: msg}))
+
+    def send(self, msg):
+        """Send ClientMsg on behalf of the user and return a future as Session.send()"""
+        msg.on_behalf_of = self.user_id
+        name = msg.WhichOneof('Message')
+        sent = self.host.session.send(msg)
+        if name != 'sub' and name != 'leave':
+            return sent
+        # The list of topics is updated before the caller sees the response.
+        future = futures.Future()
+        topic = getattr(msg, name).topic
+        def done(f):
+            self.host._attached(self, name, topic, f)
+            if f.exception() != None:
+                future.set_exception(f.exception())
+            else:
+                future.set_result(f.result())
+        sent.add_done_callback(done)
+        return future
+
+    def call(self, name, msg, timeout=30):
+        """Send the message on behalf of the user and wait for the response as Session.call()"""
+        ctrl, replies = self.request(name, msg).result(timeout)
+        if ctrl != None and ctrl.code >= 300:
+            raise RequestError(ctrl)
+        return replies
+
+    def close(self):
+        """Leave all topics and forget the user"""
+        for topic in list(self.topics):
+            self.request('leave', pb.ClientLeave(topic=topic))
+        self.host.remove(self.user_id)
+
+class VirtualSessions(object):
+    def __init__(self, session, on_message=None):
+        """session is a tinode_grpc.session.Session logged in as root. Messages which are
+        not responses go to its on_message as before if on_message is None."""
+        self.session = session
+        self.lock = threading.Lock()
+        self.users = {}
+        if on_message != None:
+            session.on_message = on_message
+
+    def user(self, user_id):
+        """Handle of the user, created on first use"""
+        with self.lock:
+            handle = self.users.get(user_id)
+            if handle == None:
+                handle = VirtualSession(self, user_id)
+                self.users[user_id] = handle
+            return handle
+
+    def remove(self, user_id):
+        with self.lock:
+            handle = self.users.pop(user_id, None)
+            if handle != None:
+                handle.topics = {}
+
+    def _attached(self, handle, name, topic, future):
+        try:
+            ctrl, _ = future.result()
+        except Exception:
+            return
+        # 3xx: the topic is attached already, possibly by another user, and this
+        # request did not change anything.
+        if ctrl == None or ctrl.code >= 300:
+            return
+        with self.lock:
+            if name == 'sub':
+                # 'new' is resolved to the name of the created topic.
+                topic = ctrl.topic or topic
+                handle.topics[topic] = internal_name(handle.user_id, topic)
+            else:
+                handle.topics.pop(topic, None)
@@ -5,16 +5,25 @@ from __future__ import print_function
 
 import argparse
 import base64
+import collections
+import errno
 import grpc
+import importlib
 import json
+import os
 import pkg_resources
-import platform
 try:
     import Queue as queue
 except ImportError:
     import queue
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
 import random
 import shlex
+import signal
+import socket
 import sys
 import threading
 import time
@@ -24,20 +33,40 @@ from google.protobuf import json_format
 # Import generated grpc modules
 from tinode_grpc import pb
 from tinode_grpc import pbx
+from tinode_grpc import drafty
+from tinode_grpc import credcache
+from tinode_grpc import retention
+from tinode_grpc import recording
+from tinode_grpc.builder import Builder
 
 APP_NAME = "tn-cli"
 APP_VERSION = "1.0.0"
 LIB_VERSION = pkg_resources.get_distribution("tinode_grpc").version
 
+# Client messages are built from cached prototypes.
+build = Builder(APP_NAME, APP_VERSION, LIB_VERSION)
+
 # Dictionary wich contains lambdas to be executed when server response is received
 onCompletion = {}
+# Lambdas to be executed when the request fails
+onFailure = {}
+
+# Tokens shared with other processes, the key of the account used at startup in it and
+# the lock held while logging in with the password.
+credCache = None
+credKey = None
+loginLock = None
+# login:password of the account, base64-encoded, to log in with when the cached token
+# is rejected.
+basicSecret = None
 
 # Saved topic: default topic name to make keyboard input easier
 SavedTopic = None
 
-# IO queues and thread for asynchronous input/output
+# Queue and thread for asynchronous input/output. The queue carries commands typed by
+# the user, commands received by the daemon, requests made by the client itself and
+# text to print, all handled in order by gen_message. None ends the session.
 input_queue = queue.Queue()
-output_queue = queue.Queue()
 input_thread = None
 
 # Default values for user and topic
@@ -75,13 +104,20 @@ def parse_cred(cred):
     return result
 
 # Support for asynchronous input-output to/from stdin/stdout
+class Output(str):
+    """Text for gen_message to print"""
+
 def stdout(*args):
     text = ""
     for a in args:
         text = text + str(a) + " "
     text = text.strip(" ")
     if text != "":
-        output_queue.put(text)
+        if daemon != None and daemon.output.capturing():
+            # Output of a command goes back to the client which sent it.
+            sys.stdout.write(text)
+        else:
+            input_queue.put(Output(text))
 
 def stdoutln(*args):
     args = args + ("\n",)
@@ -94,6 +130,269 @@ def stdin(input_queue):
         if cmd == 'exit' or cmd == 'quit':
             return
 
+# Machine-readable output: one JSON object per server message.
+output_ndjson = None
+
+def field_to_json(field, value):
+    if field.type == field.TYPE_MESSAGE:
+        return message_to_json(value)
+    if field.type == field.TYPE_BYTES:
+        # Content, public, private and params are JSON-encoded.
+        try:
+            return json.loads(value.decode('utf-8'))
+        except ValueError:
+            return base64.b64encode(value).decode('ascii')
+    if field.type == field.TYPE_ENUM:
+        return field.enum_type.values_by_number[value].name if value in field.enum_type.values_by_number else value
+    return value
+
+def message_to_json(msg):
+    """Convert protobuf message to dictionary with JSON-encoded bytes decoded. Unlike
+    json_format.MessageToDict it skips default values without looking at them."""
+    result = {}
+    for field, value in msg.ListFields():
+        if field.message_type != None and field.message_type.GetOptions().map_entry:
+            value_field = field.message_type.fields_by_name['value']
+            result[field.name] = dict((k, field_to_json(value_field, v)) for k, v in value.items())
+        elif field.label == field.LABEL_REPEATED:
+            result[field.name] = [field_to_json(field, v) for v in value]
+        else:
+            result[field.name] = field_to_json(field, value)
+    return result
+
+class BufferedWriter(object):
+    """Collects lines and writes them in chunks of up to size bytes or every interval
+    seconds, whichever comes first"""
+    def __init__(self, out, size=65536, interval=0.2):
+        self.out = out
+        self.size = size
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.lines = []
+        self.buffered = 0
+        self.flushed = time.time()
+        # Lines written while the input is idle are flushed in the background.
+        flusher = threading.Thread(target=self._flush_idle)
+        flusher.daemon = True
+        flusher.start()
+
+    def write(self, line):
+        with self.lock:
+            self.lines.append(line)
+            self.buffered += len(line)
+            if self.buffered >= self.size or time.time() - self.flushed >= self.interval:
+                self._flush()
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def _flush(self):
+        if self.lines:
+            self.out.write(''.join(self.lines))
+            self.out.flush()
+            self.lines = []
+            self.buffered = 0
+        self.flushed = time.time()
+
+    def _flush_idle(self):
+        while True:
+            time.sleep(self.interval)
+            with self.lock:
+                if time.time() - self.flushed >= self.interval:
+                    self._flush()
+
+class ThreadOutput(object):
+    """Stream which writes to the stream set with capture() by the current thread, to out
+    if there is none"""
+    def __init__(self, out):
+        self.out = out
+        self.local = threading.local()
+
+    def capture(self, stream):
+        """Write what the current thread writes to stream, or to out again if None"""
+        self.local.stream = stream
+
+    def capturing(self):
+        return getattr(self.local, 'stream', None) != None
+
+    def write(self, text):
+        stream = getattr(self.local, 'stream', None)
+        (stream if stream != None else self.out).write(text)
+
+    def flush(self):
+        stream = getattr(self.local, 'stream', None)
+        (stream if stream != None else self.out).flush()
+
+    def __getattr__(self, name):
+        return getattr(self.out, name)
+
+# Daemon accepting commands over a Unix socket, see --daemon.
+daemon = None
+
+def responses_expected(msg):
+    """Number of {ctrl} and {meta} the server sends in response to the message. {data}
+    sent in response to {get} is followed by a {ctrl}. A {ctrl} with an error may be the
+    only response."""
+    if msg == None:
+        return 0
+    name = msg.WhichOneof('Message')
+    if name == 'note':
+        return 0
+    if name == 'get':
+        # Every kind of data is reported in a {meta} of its own, or {ctrl} if there is none.
+        return max(1, len(msg.get.query.what.split()))
+    if name == 'sub' and msg.sub.HasField('get_query'):
+        return 1 + len(msg.sub.get_query.what.split())
+    return 1
+
+class Daemon(object):
+    """Accepts one command per connection on a Unix socket and writes back the server
+    messages sent in response as NDJSON, then closes the connection. A connection which
+    sends '.events' instead receives all other server messages until it disconnects.
+    Raises socket.error if another daemon is listening on the socket."""
+    def __init__(self, path):
+        self.path = path
+        if os.path.exists(path):
+            # Remove the socket of a daemon which is gone, but not of one which is running.
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(path)
+            except (IOError, OSError):
+                os.unlink(path)
+            else:
+                raise socket.error(errno.EADDRINUSE, "another daemon is listening at '" + path + "'")
+            finally:
+                probe.close()
+        elif os.path.dirname(path) and not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.bind(path)
+        # Commands are sent with the credentials of the daemon: keep other users out.
+        os.chmod(path, 0o600)
+        self.sock.listen(64)
+        self.lock = threading.Lock()
+        # [connection, number of responses still expected] by request ID.
+        self.requests = {}
+        # {data} has no request ID: IDs of {get} in flight by topic.
+        self.fetching = {}
+        self.followers = []
+        # Help and errors printed by the command parser go back to the client which sent
+        # the command.
+        self.output = ThreadOutput(sys.stdout)
+        self.errors = ThreadOutput(sys.stderr)
+        sys.stdout, sys.stderr = self.output, self.errors
+        thread = threading.Thread(target=self._accept)
+        thread.daemon = True
+        thread.start()
+
+    def command(self, item, id):
+        """Convert command received from a connection to pb.ClientMsg. Called by gen_message."""
+        line, conn = item
+        captured = StringIO()
+        self.output.capture(captured)
+        self.errors.capture(captured)
+        msg = None
+        try:
+            cmd = parse_cmd(line)
+            # Lines are not empty: None means the command was not understood.
+            failed = cmd == None
+            if cmd != None:
+                msg = commands[cmd.cmd][1](id, cmd)
+        except Exception as err:
+            # A bad command must not end the session of everyone else.
+            print("Error:", err)
+            failed = True
+        finally:
+            self.output.capture(None)
+            self.errors.capture(None)
+        if captured.getvalue():
+            self._send(conn, {'output': captured.getvalue(), 'error': failed})
+        expected = responses_expected(msg)
+        if expected == 0:
+            conn.close()
+            return msg
+        with self.lock:
+            self.requests[str(id)] = [conn, expected]
+            name = msg.WhichOneof('Message')
+            query = msg.get.query if name == 'get' else msg.sub.get_query if name == 'sub' else None
+            if query != None and 'data' in query.what.split():
+                self.fetching[getattr(msg, name).topic] = str(id)
+        return msg
+
+    def dispatch(self, msg):
+        """Pass server message to the connection which made the request or to followers"""
+        with self.lock:
+            if msg.HasField('ctrl'):
+                id = msg.ctrl.id
+            elif msg.HasField('meta'):
+                id = msg.meta.id
+            elif msg.HasField('data'):
+                id = self.fetching.get(msg.data.topic)
+            else:
+                id = None
+            request = self.requests.get(id) if id else None
+            if request != None and not msg.HasField('data'):
+                request[1] -= 1
+                # The server sends nothing else after an error.
+                if msg.HasField('ctrl') and msg.ctrl.code >= 400:
+                    request[1] = 0
+                if request[1] <= 0:
+                    del self.requests[id]
+                    for topic in [t for t, tid in self.fetching.items() if tid == id]:
+                        del self.fetching[topic]
+            followers = list(self.followers) if request == None else []
+        if request != None:
+            self._send(request[0], message_to_json(msg))
+            if request[1] <= 0:
+                request[0].close()
+            return
+        line = message_to_json(msg)
+        for conn in followers:
+            if not self._send(conn, line):
+                with self.lock:
+                    self.followers.remove(conn)
+                conn.close()
+
+    def close(self):
+        self.sock.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def _send(self, conn, obj):
+        try:
+            conn.sendall((json.dumps(obj) + "\n").encode('utf-8'))
+            return True
+        except (IOError, OSError):
+            return False
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except (IOError, OSError):
+                # Socket closed.
+                return
+            # Clients which don't read their responses must not stall the session.
+            conn.settimeout(5)
+            thread = threading.Thread(target=self._read, args=(conn,))
+            thread.daemon = True
+            thread.start()
+
+    def _read(self, conn):
+        try:
+            line = conn.makefile('rb').readline().decode('utf-8').strip()
+        except (IOError, OSError, UnicodeDecodeError):
+            conn.close()
+            return
+        if line == '.events':
+            with self.lock:
+                self.followers.append(conn)
+        elif line:
+            input_queue.put((line, conn))
+        else:
+            conn.close()
+
 def encode_to_bytes(src):
     if src == None:
         return None
@@ -102,9 +401,7 @@ def encode_to_bytes(src):
 # Constructing individual messages
 def hiMsg(id):
     onCompletion[str(id)] = lambda params: print_server_params(params)
-    return pb.ClientMsg(hi=pb.ClientHi(id=str(id), user_agent=APP_NAME + "/" + APP_VERSION + " (" +
-        platform.system() + "/" + platform.release() + "); gRPC-python/" + LIB_VERSION,
-        ver=LIB_VERSION, lang="EN"))
+    return build.hi(str(id))
 
 def accMsg(id, user, scheme, secret, uname, password, do_login, fn, photo, private, auth, anon, tags, cred):
     if secret == None and uname != None:
@@ -143,7 +440,7 @@ def subMsg(id, topic, fn, photo, private, auth, anon, mode, tags, get_query):
     if not topic:
         topic = default_topic
     if get_query:
-        get_query = pb.GetQuery(what=get_query.split(",").join(" "))
+        get_query = pb.GetQuery(what=" ".join(get_query.split(",")))
     public = encode_to_bytes(make_vcard(fn, photo))
     private = encode_to_bytes(private)
     return pb.ClientMsg(sub=pb.ClientSub(id=str(id), topic=topic,
@@ -160,8 +457,7 @@ def leaveMsg(id, topic, unsub):
 def pubMsg(id, topic, content):
     if not topic:
         topic = default_topic
-    return pb.ClientMsg(pub=pb.ClientPub(id=str(id), topic=topic, no_echo=True,
-                content=encode_to_bytes(content)), on_behalf_of=default_user)
+    return build.pub(str(id), topic, encode_to_bytes(content), default_user, no_echo=True)
 
 def getMsg(id, topic, desc, sub, tags, data):
     if not topic:
@@ -213,9 +509,11 @@ def delMsg(id, topic, what, param, hard):
     if what == 'msg':
         enum_what = pb.ClientDel.MSG
         if param == 'all':
-            seq_list = [pb.DelQuery(range=pb.SeqRange(low=1, hi=0x8FFFFFF))]
+            # The server caps the range at the last message.
+            seq_list = [pb.SeqRange(low=1, hi=0x8FFFFFF)]
         elif param != None:
-            seq_list = [pb.DelQuery(seq_id=int(x.strip())) for x in param.split(',')]
+            seq_list = [pb.SeqRange(low=low, hi=hi) for low, hi in
+                retention.seq_ranges(int(x.strip()) for x in param.split(','))]
         stdoutln(seq_list)
 
     elif what == 'sub':
@@ -256,7 +554,131 @@ def noteMsg(id, topic, what, seq):
     elif what == 'recv':
         enum_what = pb.READ
         seq = int(seq)
-    return pb.ClientMsg(note=pb.ClientNote(topic=topic, what=enum_what, seq_id=seq), on_behalf_of=default_user)
+    return build.note(topic, enum_what, seq, default_user)
+
+def useCmd(id, cmd):
+    global default_user, default_topic
+    if cmd.user != "unchanged":
+        default_user = cmd.user
+        stdoutln("Default user is '" + default_user + "'")
+    if cmd.topic != "unchanged":
+        default_topic = cmd.topic
+        stdoutln("Default topic is '" + default_topic + "'")
+    return None
+
+# Commands by name: (parser, handler, summary). Parsers are built once at startup, not
+# for every line typed. handler(id, args) returns pb.ClientMsg to send or None.
+commands = collections.OrderedDict()
+
+def register_command(name, summary, handler, description=None):
+    """Add a command. Returns its parser to add arguments to."""
+    parser = argparse.ArgumentParser(prog=name, description=description or summary[0].upper() + summary[1:])
+    commands[name] = (parser, handler, summary)
+    return parser
+
+def load_plugin(module_name):
+    """Import module which adds commands: it must define register(cli), where cli is
+    this module, and call cli.register_command()"""
+    importlib.import_module(module_name).register(sys.modules[__name__])
+
+def register_builtin_commands():
+    parser = register_command('.use', 'set default user or topic', useCmd)
+    parser.add_argument('--user', default="unchanged", help='ID of the default user')
+    parser.add_argument('--topic', default="unchanged", help='Name of default topic')
+
+    parser = register_command('acc', 'create account', lambda id, cmd: accMsg(id, cmd.user, cmd.scheme,
+        cmd.secret, cmd.uname, cmd.password, cmd.do_login, cmd.fn, cmd.photo, cmd.private, cmd.auth,
+        cmd.anon, cmd.tags, cmd.cred), 'Create or alter an account')
+    parser.add_argument('--user', default='new', help='ID of the account to update')
+    parser.add_argument('--scheme', default='basic', help='authentication scheme, default=basic')
+    parser.add_argument('--secret', default=None, help='secret for authentication')
+    parser.add_argument('--uname', default=None, help='user name for basic authentication')
+    parser.add_argument('--password', default=None, help='password for basic authentication')
+    parser.add_argument('--do-login', action='store_true', help='login with the newly created account')
+    parser.add_argument('--tags', action=None, help='tags for user discovery, comma separated list without spaces')
+    parser.add_argument('--fn', default=None, help='user\'s human name')
+    parser.add_argument('--photo', default=None, help='avatar file name')
+    parser.add_argument('--private', default=None, help='user\'s private info')
+    parser.add_argument('--auth', default=None, help='default access mode for authenticated users')
+    parser.add_argument('--anon', default=None, help='default access mode for anonymous users')
+    parser.add_argument('--cred', default=None, help='credentials, comma separated list in method:value format, e.g. email:test@example.com,tel:12345')
+
+    parser = register_command('login', 'authenticate', lambda id, cmd: loginMsg(id, cmd.scheme,
+        cmd.secret, cmd.cred, cmd.uname, cmd.password), 'Authenticate current session')
+    parser.add_argument('--scheme', default='basic', help='authentication schema, default=basic')
+    parser.add_argument('secret', nargs='?', default=argparse.SUPPRESS, help='authentication secret')
+    parser.add_argument('--secret', dest='secret', default=None, help='authentication secret')
+    parser.add_argument('--uname', default=None, help='user name in basic authentication scheme')
+    parser.add_argument('--password', default=None, help='password in basic authentication scheme')
+    parser.add_argument('--cred', default=None, help='credentials, comma separated list in method:value format, e.g. email:test@example.com,tel:12345')
+
+    parser = register_command('sub', 'subscribe to topic', lambda id, cmd: subMsg(id, cmd.topic, cmd.fn,
+        cmd.photo, cmd.private, cmd.auth, cmd.anon, cmd.mode, cmd.tags, cmd.get_query))
+    parser.add_argument('topic', nargs='?', default=argparse.SUPPRESS, help='topic to subscribe to')
+    parser.add_argument('--topic', dest='topic', default=None, help='topic to subscribe to')
+    parser.add_argument('--fn', default=None, help='topic\'s user-visible name')
+    parser.add_argument('--photo', default=None, help='avatar file name')
+    parser.add_argument('--private', default=None, help='topic\'s private info')
+    parser.add_argument('--auth', default=None, help='default access mode for authenticated users')
+    parser.add_argument('--anon', default=None, help='default access mode for anonymous users')
+    parser.add_argument('--mode', default=None, help='new value of access mode')
+    parser.add_argument('--tags', default=None, help='tags for topic discovery, comma separated list without spaces')
+    parser.add_argument('--get-query', default=None, help='query for topic metadata or messages, comma separated list without spaces')
+
+    parser = register_command('leave', 'detach or unsubscribe from topic',
+        lambda id, cmd: leaveMsg(id, cmd.topic, cmd.unsub))
+    parser.add_argument('topic', nargs='?', default=argparse.SUPPRESS, help='topic to detach from')
+    parser.add_argument('--topic', dest='topic', default=None, help='topic to detach from')
+    parser.add_argument('--unsub', action='store_true', help='detach and unsubscribe from topic')
+
+    parser = register_command('pub', 'post message to topic', lambda id, cmd: pubMsg(id, cmd.topic,
+        cmd.content), 'Send message to topic')
+    parser.add_argument('topic', nargs='?', default=argparse.SUPPRESS, help='topic to publish to')
+    parser.add_argument('--topic', dest='topic', default=None, help='topic to publish to')
+    parser.add_argument('content', nargs='?', default=argparse.SUPPRESS, help='message to send')
+    parser.add_argument('--content', dest='content', help='message to send')
+
+    parser = register_command('get', 'query topic for metadata or messages', lambda id, cmd: getMsg(id,
+        cmd.topic, cmd.desc, cmd.sub, cmd.tags, cmd.data), 'Query topic for messages or metadata')
+    parser.add_argument('topic', nargs='?', default=argparse.SUPPRESS, help='topic to update')
+    parser.add_argument('--topic', dest='topic', default=None, help='topic to update')
+    parser.add_argument('--desc', action='store_true', help='query topic description')
+    parser.add_argument('--sub', action='store_true', help='query topic subscriptions')
+    parser.add_argument('--tags', action='store_true', help='query topic tags')
+    parser.add_argument('--data', action='store_true', help='query topic messages')
+
+    parser = register_command('set', 'update topic metadata', lambda id, cmd: setMsg(id, cmd.topic,
+        cmd.user, cmd.fn, cmd.photo, cmd.public, cmd.private, cmd.auth, cmd.anon, cmd.mode, cmd.tags))
+    parser.add_argument('topic', help='topic to update')
+    parser.add_argument('--fn', default=None, help='topic\'s name')
+    parser.add_argument('--photo', default=None, help='avatar file name')
+    parser.add_argument('--public', default=None, help='topic\'s public info, alternative to fn+photo')
+    parser.add_argument('--private', default=None, help='topic\'s private info')
+    parser.add_argument('--auth', default=None, help='default access mode for authenticated users')
+    parser.add_argument('--anon', default=None, help='default access mode for anonymous users')
+    parser.add_argument('--user', default=None, help='ID of the account to update')
+    parser.add_argument('--mode', default=None, help='new value of access mode')
+    parser.add_argument('--tags', default=None, help='tags for topic discovery, comma separated list without spaces')
+
+    parser = register_command('del', 'delete message(s), topic or subscription', lambda id, cmd: delMsg(id,
+        cmd.topic, cmd.what, cmd.param, cmd.hard), 'Delete message(s), subscription or topic')
+    parser.add_argument('topic', nargs='?', default=argparse.SUPPRESS, help='topic being affected')
+    parser.add_argument('--topic', dest='topic', default=None, help='topic being affected')
+    parser.add_argument('what', default='msg', choices=('msg', 'sub', 'topic'),
+        help='what to delete')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--user', dest='param', help='delete subscription with the given user id')
+    group.add_argument('--list', dest='param', help='comma separated list of message IDs to delete')
+    parser.add_argument('--hard', action='store_true', help='hard-delete messages')
+
+    parser = register_command('note', 'send notification', lambda id, cmd: noteMsg(id, cmd.topic,
+        cmd.what, cmd.seq), 'Send notification to topic, ex "note kp"')
+    parser.add_argument('topic', help='topic to notify')
+    parser.add_argument('what', nargs='?', default='kp', const='kp', choices=['kp', 'read', 'recv'],
+        help='notification type')
+    parser.add_argument('--seq', help='value being reported')
+
+register_builtin_commands()
 
 def parse_cmd(cmd):
     """Parses command line input into a dictionary"""
@@ -264,111 +686,17 @@ def parse_cmd(cmd):
     if len(parts) == 0:
         return None
 
-    parser = None
-    if parts[0] == ".use":
-        parser = argparse.ArgumentParser(prog=parts[0], description='Set default user or topic')
-        parser.add_argument('--user', default="unchanged", help='ID of the default user')
-        parser.add_argument('--topic', default="unchanged", help='Name of default topic')
-    elif parts[0] == "acc":
-        parser = argparse.ArgumentParser(prog=parts[0], description='Create or alter an account')
-        parser.add_argument('--user', default='new', help='ID of the account to update')
-        parser.add_argument('--scheme', default='basic', help='authentication scheme, default=basic')
-        parser.add_argument('--secret', default=None, help='secret for authentication')
-        parser.add_argument('--uname', default=None, help='user name for basic authentication')
-        parser.add_argument('--password', default=None, help='password for basic authentication')
-        parser.add_argument('--do-login', action='store_true', help='login with the newly created account')
-        parser.add_argument('--tags', action=None, help='tags for user discovery, comma separated list without spaces')
-        parser.add_argument('--fn', default=None, help='user\'s human name')
-        parser.add_argument('--photo', default=None, help='avatar file name')
-        parser.add_argument('--private', default=None, help='user\'s private info')
-        parser.add_argument('--auth', default=None, help='default access mode for authenticated users')
-        parser.add_argument('--anon', default=None, help='default access mode for anonymous users')
-        parser.add_argument('--cred', default=None, help='credentials, comma separated list in method:value format, e.g. email:test@example.com,tel:12345')
-    elif parts[0] == "login":
-        parser = argparse.ArgumentParser(prog=parts[0], description='Authenticate current session')
-        parser.add_argument('--scheme', default='basic', help='authentication schema, default=basic')
-        parser.add_argument('secret', nargs='?', default=argparse.SUPPRESS, help='authentication secret')
-        parser.add_argument('--secret', dest='secret', default=None, help='authentication secret')
-        parser.add_argument('--uname', default=None, help='user name in basic authentication scheme')
-        parser.add_argument('--password', default=None, help='password in basic authentication scheme')
-        parser.add_argument('--cred', default=None, help='credentials, comma separated list in method:value format, e.g. email:test@example.com,tel:12345')
-    elif parts[0] == "sub":
-        parser = argparse.ArgumentParser(prog=parts[0], description='Subscribe to topic')
-        parser.add_argument('topic', nargs='?', default=argparse.SUPPRESS, help='topic to subscribe to')
-        parser.add_argument('--topic', dest='topic', default=None, help='topic to subscribe to')
-        parser.add_argument('--fn', default=None, help='topic\'s user-visible name')
-        parser.add_argument('--photo', default=None, help='avatar file name')
-        parser.add_argument('--private', default=None, help='topic\'s private info')
-        parser.add_argument('--auth', default=None, help='default access mode for authenticated users')
-        parser.add_argument('--anon', default=None, help='default access mode for anonymous users')
-        parser.add_argument('--mode', default=None, help='new value of access mode')
-        parser.add_argument('--tags', default=None, help='tags for topic discovery, comma separated list without spaces')
-        parser.add_argument('--get-query', default=None, help='query for topic metadata or messages, comma separated list without spaces')
-    elif parts[0] == "leave":
-        parser = argparse.ArgumentParser(prog=parts[0], description='Detach or unsubscribe from topic')
-        parser.add_argument('topic', nargs='?', default=argparse.SUPPRESS, help='topic to detach from')
-        parser.add_argument('--topic', dest='topic', default=None, help='topic to detach from')
-        parser.add_argument('--unsub', action='store_true', help='detach and unsubscribe from topic')
-    elif parts[0] == "pub":
-        parser = argparse.ArgumentParser(prog=parts[0], description='Send message to topic')
-        parser.add_argument('topic', nargs='?', default=argparse.SUPPRESS, help='topic to publish to')
-        parser.add_argument('--topic', dest='topic', default=None, help='topic to publish to')
-        parser.add_argument('content', nargs='?', default=argparse.SUPPRESS, help='message to send')
-        parser.add_argument('--content', dest='content', help='message to send')
-    elif parts[0] == "get":
-        parser = argparse.ArgumentParser(prog=parts[0], description='Query topic for messages or metadata')
-        parser.add_argument('topic', nargs='?', default=argparse.SUPPRESS, help='topic to update')
-        parser.add_argument('--topic', dest='topic', default=None, help='topic to update')
-        parser.add_argument('--desc', action='store_true', help='query topic description')
-        parser.add_argument('--sub', action='store_true', help='query topic subscriptions')
-        parser.add_argument('--tags', action='store_true', help='query topic tags')
-        parser.add_argument('--data', action='store_true', help='query topic messages')
-    elif parts[0] == "set":
-        parser = argparse.ArgumentParser(prog=parts[0], description='Update topic metadata')
-        parser.add_argument('topic', help='topic to update')
-        parser.add_argument('--fn', default=None, help='topic\'s name')
-        parser.add_argument('--photo', default=None, help='avatar file name')
-        parser.add_argument('--public', default=None, help='topic\'s public info, alternative to fn+photo')
-        parser.add_argument('--private', default=None, help='topic\'s private info')
-        parser.add_argument('--auth', default=None, help='default access mode for authenticated users')
-        parser.add_argument('--anon', default=None, help='default access mode for anonymous users')
-        parser.add_argument('--user', default=None, help='ID of the account to update')
-        parser.add_argument('--mode', default=None, help='new value of access mode')
-        parser.add_argument('--tags', default=None, help='tags for topic discovery, comma separated list without spaces')
-    elif parts[0] == "del":
-        parser = argparse.ArgumentParser(prog=parts[0], description='Delete message(s), subscription or topic')
-        parser.add_argument('topic', nargs='?', default=argparse.SUPPRESS, help='topic being affected')
-        parser.add_argument('--topic', dest='topic', default=None, help='topic being affected')
-        parser.add_argument('what', default='msg', choices=('msg', 'sub', 'topic'),
-            help='what to delete')
-        group = parser.add_mutually_exclusive_group()
-        group.add_argument('--user', dest='param', help='delete subscription with the given user id')
-        group.add_argument('--list', dest='param', help='comma separated list of message IDs to delete')
-        parser.add_argument('--hard', action='store_true', help='hard-delete messages')
-    elif parts[0] == "note":
-        parser = argparse.ArgumentParser(prog=parts[0], description='Send notification to topic, ex "note kp"')
-        parser.add_argument('topic', help='topic to notify')
-        parser.add_argument('what', nargs='?', default='kp', const='kp', choices=['kp', 'read', 'recv'],
-            help='notification type')
-        parser.add_argument('--seq', help='value being reported')
-    else:
+    command = commands.get(parts[0])
+    if command == None:
         print("Unrecognized:", parts[0])
         print("Possible commands:")
-        print("\t.use\t- set default user or topic")
-        print("\tacc\t- create account")
-        print("\tlogin\t- authenticate")
-        print("\tsub\t- subscribe to topic")
-        print("\tleave\t- detach or unsubscribe from topic")
-        print("\tpub\t- post message to topic")
-        print("\tget\t- query topic for metadata or messages")
-        print("\tset\t- update topic metadata")
-        print("\tdel\t- delete message(s), topic or subscription")
-        print("\tnote\t- send notification")
+        for name, (_, _, summary) in commands.items():
+            print("\t" + name + "\t- " + summary)
         print("\n\tType <command> -h for help")
         return None
 
     try:
-        args = parser.parse_args(parts[1:])
+        args = command[0].parse_args(parts[1:])
         args.cmd = parts[0]
         return args
     except SystemExit:
@@ -382,41 +710,7 @@ def serialize_cmd(string, id):
     if cmd == None:
         return None
 
-    # Process dictionary
-    if cmd.cmd == ".use":
-        if cmd.user != "unchanged":
-            global default_user
-            default_user = cmd.user
-            stdoutln("Default user is '" + default_user + "'")
-        if cmd.topic != "unchanged":
-            global default_topic
-            default_topic = cmd.topic
-            stdoutln("Default topic is '" + default_topic + "'")
-        return None
-    elif cmd.cmd == "acc":
-        return accMsg(id, cmd.user, cmd.scheme, cmd.secret, cmd.uname, cmd.password,
-            cmd.do_login, cmd.fn, cmd.photo, cmd.private, cmd.auth, cmd.anon, cmd.tags, cmd.cred)
-    elif cmd.cmd == "login":
-        return loginMsg(id, cmd.scheme, cmd.secret, cmd.cred, cmd.uname, cmd.password)
-    elif cmd.cmd == "sub":
-        return subMsg(id, cmd.topic, cmd.fn, cmd.photo, cmd.private, cmd.auth, cmd.anon,
-            cmd.mode, cmd.tags, cmd.get_query)
-    elif cmd.cmd == "leave":
-        return leaveMsg(id, cmd.topic, cmd.unsub)
-    elif cmd.cmd == "pub":
-        return pubMsg(id, cmd.topic, cmd.content)
-    elif cmd.cmd == "get":
-        return getMsg(id, cmd.topic, cmd.desc, cmd.sub, cmd.tags, cmd.data)
-    elif cmd.cmd == "set":
-        return setMsg(id, cmd.topic, cmd.user, cmd.fn, cmd.photo, cmd.public, cmd.private,
-            cmd.auth, cmd.anon, cmd.mode, cmd.tags)
-    elif cmd.cmd == "del":
-        return delMsg(id, cmd.topic, cmd.what, cmd.param, cmd.hard)
-    elif cmd.cmd == "note":
-        return noteMsg(id, cmd.topic, cmd.what, cmd.seq)
-    else:
-        stdoutln("Unrecognized: " + cmd.cmd)
-        return None
+    return commands[cmd.cmd][1](id, cmd)
 
 def gen_message(schema, secret):
     """Client message generator: reads user input as string,
@@ -426,46 +720,61 @@ def gen_message(schema, secret):
     random.seed()
     id = random.randint(10000,60000)
 
-    # Asynchronous input-output
-    input_thread = threading.Thread(target=stdin, args=(input_queue,))
-    input_thread.daemon = True
-    input_thread.start()
+    # Asynchronous input-output. The daemon takes input from its socket instead.
+    if daemon == None:
+        input_thread = threading.Thread(target=stdin, args=(input_queue,))
+        input_thread.daemon = True
+        input_thread.start()
 
     yield hiMsg(id)
 
     if schema != None:
         id += 1
-        yield loginMsg(id, schema, secret, None, None, None)
+        msg = loginMsg(id, schema, secret, None, None, None)
+        if credKey != None:
+            onCompletion[str(id)] = lambda params: save_cookie(params, credKey)
+            onFailure[str(id)] = lambda code: on_login_failed(schema, code)
+        yield msg
 
-    print_prompt = True
+    print_prompt = daemon == None
 
     while True:
-        if not input_queue.empty():
-            id += 1
-            inp = input_queue.get()
-            if inp == 'exit' or inp == 'quit':
-                return
-            cmd = serialize_cmd(inp, id)
-            print_prompt = True
-            if cmd != None:
-                yield cmd
-
-        elif not output_queue.empty():
-            sys.stdout.write("\r"+output_queue.get())
+        if print_prompt and output_ndjson == None and input_queue.empty():
+            sys.stdout.write("tn-cli> ")
             sys.stdout.flush()
-            print_prompt = True
-
+            print_prompt = False
+        inp = input_queue.get()
+        if inp == None:
+            # The session is over.
+            return
+        if isinstance(inp, Output):
+            sys.stdout.write("\r"+inp)
+            sys.stdout.flush()
+            print_prompt = daemon == None
+            continue
+        id += 1
+        if inp == 'exit' or inp == 'quit':
+            return
+        if isinstance(inp, tuple):
+            cmd = daemon.command(inp, id)
+        elif callable(inp):
+            # Request made by the client itself, e.g. login after a failed one.
+            cmd = inp(id)
         else:
-            if print_prompt:
-                sys.stdout.write("tn-cli> ")
-                sys.stdout.flush()
-                print_prompt = False
-            time.sleep(0.1)
+            cmd = serialize_cmd(inp, id)
+            print_prompt = True
+        if cmd != None:
+            yield cmd
 
-def run(addr, schema, secret):
+def run(addr, schema, secret, record=None):
+    recorder = None
     try:
         channel = grpc.insecure_channel(addr)
         stub = pbx.NodeStub(channel)
+        if record != None:
+            # Save the session for replay with 'python -m tinode_grpc.recording'.
+            recorder = recording.Recorder(record)
+            stub = recorder.wrap(stub)
         # Call the server
         stream = stub.MessageLoop(gen_message(schema, secret))
 
@@ -473,15 +782,26 @@ def run(addr, schema, secret):
         for msg in stream:
             if msg.HasField("ctrl"):
                 # Run code on command completion
-                func = onCompletion.get(msg.ctrl.id)
-                if func != None:
-                    del onCompletion[msg.ctrl.id]
-                    if msg.ctrl.code >= 200 and msg.ctrl.code < 400:
+                func = onCompletion.pop(msg.ctrl.id, None)
+                on_fail = onFailure.pop(msg.ctrl.id, None)
+                if msg.ctrl.code >= 200 and msg.ctrl.code < 400:
+                    if func != None:
                         func(msg.ctrl.params)
+                elif on_fail != None:
+                    on_fail(msg.ctrl.code)
+
+            if daemon != None:
+                daemon.dispatch(msg)
+            elif output_ndjson != None:
+                output_ndjson.write(json.dumps(message_to_json(msg)) + "\n")
+            elif msg.HasField("ctrl"):
                 stdoutln("\r" + str(msg.ctrl.code) + " " + msg.ctrl.text)
             elif msg.HasField("data"):
                 stdoutln("\rFrom: " + msg.data.from_user_id + ":\n")
-                stdoutln(json.loads(msg.data.content))
+                try:
+                    stdoutln(drafty.to_plain_text(drafty.parse(msg.data.content)))
+                except ValueError:
+                    stdoutln(msg.data.content)
             elif msg.HasField("pres"):
                 pass
             elif msg.HasField("info"):
@@ -496,6 +816,15 @@ def run(addr, schema, secret):
         channel.close()
         if input_thread != None:
             input_thread.join(0.3)
+    finally:
+        # Let gen_message return if it is waiting for input.
+        input_queue.put(None)
+        if recorder != None:
+            recorder.close()
+        if output_ndjson != None:
+            output_ndjson.flush()
+        if daemon != None:
+            daemon.close()
 
 def read_cookie():
     try:
@@ -508,10 +837,14 @@ def read_cookie():
         println("Missing or invalid cookie file '.tn-cli-cookie'", err)
         return None
 
-def save_cookie(params):
+def save_cookie(params, cache_key=None):
     if params == None:
         return
 
+    if cache_key != None:
+        credCache.put(cache_key, params)
+        release_login_lock()
+
     # Protobuf map 'params' is not a python object or dictionary. Convert it.
     nice = {}
     for p in params:
@@ -526,6 +859,41 @@ def save_cookie(params):
     except Exception as err:
         stdoutln("Failed to save authentication cookie", err)
 
+def cached_token(key):
+    """Get token from the shared cache. If there is none, keep other processes from
+    logging in with the password until this one does."""
+    global loginLock
+    loginLock = credCache.login_lock(key)
+    token = credCache.get(key)
+    if token != None:
+        release_login_lock()
+    return token
+
+def release_login_lock():
+    global loginLock
+    if loginLock != None:
+        loginLock.release()
+        loginLock = None
+
+def on_login_failed(schema, code):
+    release_login_lock()
+    if schema == 'token':
+        # Cached token is no longer valid: log in with the password right away.
+        credCache.delete(credKey)
+        if basicSecret != None:
+            input_queue.put(basic_login)
+
+def basic_login(id):
+    """{login} with the password, sent after the cached token was rejected"""
+    global loginLock
+    stdoutln("Cached token rejected, logging in with login:password")
+    # Keep other processes from logging in with the password until this one does.
+    loginLock = credCache.login_lock(credKey)
+    msg = loginMsg(id, 'basic', basicSecret, None, None, None)
+    onCompletion[str(id)] = lambda params: save_cookie(params, credKey)
+    onFailure[str(id)] = lambda code: on_login_failed('basic', code)
+    return msg
+
 def print_server_params(params):
     stdoutln("\rConnected to server:")
     for p in params:
@@ -534,15 +902,40 @@ def print_server_params(params):
 if __name__ == '__main__':
     """Parse command-line arguments. Extract host name and authentication scheme, if one is provided"""
     purpose = "Tinode command line client. Version " + APP_VERSION + "/" + LIB_VERSION + "."
-    print(purpose)
     parser = argparse.ArgumentParser(description=purpose)
     parser.add_argument('--host', default='localhost:6061', help='address of Tinode server')
     parser.add_argument('--login-basic', help='login using basic authentication username:password')
     parser.add_argument('--login-token', help='login using token authentication')
     parser.add_argument('--login-cookie', action='store_true', help='read token from cookie file and use it for authentication')
+    parser.add_argument('--token-cache', default=credcache.DEFAULT_PATH, help='file with authentication tokens shared with other processes, used with --login-basic; empty to disable')
+    parser.add_argument('--record', help='record the session to the file')
+    parser.add_argument('--plugin', action='append', default=[], help='module which adds commands, may be repeated')
+    parser.add_argument('--output', default='text', choices=('text', 'ndjson'), help='output format: text for people or ndjson, one JSON object per server message')
+    parser.add_argument('--daemon', nargs='?', const=os.path.join(os.path.expanduser('~'), '.tinode', 'tn-cli.sock'),
+        help='keep the session open and take commands from tn-ctl.py over this Unix socket, ~/.tinode/tn-cli.sock by default, instead of stdin')
     parser.add_argument('--no-login', action='store_true', help='do not login even if cookie file is present')
     args = parser.parse_args()
 
+    for name in args.plugin:
+        load_plugin(name)
+
+    if args.output == 'ndjson':
+        output_ndjson = BufferedWriter(sys.stdout)
+        # Keep stdout for JSON: everything else goes to stderr.
+        sys.stdout = sys.stderr
+
+    print(purpose)
+
+    if args.daemon:
+        try:
+            daemon = Daemon(args.daemon)
+        except (IOError, OSError) as err:
+            print("Cannot listen for commands:", err)
+            sys.exit(1)
+        # Don't leave the socket behind when stopped.
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        stdoutln("Listening for commands at '" + args.daemon + "'")
+
     stdoutln("Server '" + args.host + "'")
 
     schema = None
@@ -559,7 +952,18 @@ if __name__ == '__main__':
             """Use username:password"""
             schema = 'basic'
             secret = base64.b64encode(args.login_basic.encode('utf-8'))
-            print("Logging in with login:password", args.login_basic)
+            if args.token_cache:
+                credCache = credcache.CredCache(args.token_cache)
+                credKey = credcache.account_key(args.host, args.login_basic.split(':', 1)[0])
+                token = cached_token(credKey)
+                if token != None:
+                    basicSecret = secret
+                    schema = 'token'
+                    secret = base64.b64encode(token)
+            if schema == 'token':
+                print("Logging in with cached token for", credKey)
+            else:
+                print("Logging in with login:password", args.login_basic)
 
         else:
             """Try reading the cookie file"""
@@ -570,4 +974,4 @@ if __name__ == '__main__':
             except Exception as err:
                 print("Failed to read authentication cookie", err)
 
-    run(args.host, schema, secret)
+    run(args.host, schema, secret, args.record)
@@ -0,0 +1,68 @@
+"""Client of tn-cli.py running with --daemon: sends one command over the daemon's Unix
+socket and prints the server's responses as NDJSON. Exits with 1 if the command failed
+or no response came in time.
+Only the standard library is used, so it starts in milliseconds."""
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import socket
+import sys
+
+DEFAULT_SOCKET = os.path.join(os.path.expanduser('~'), '.tinode', 'tn-cli.sock')
+
+def quote(arg):
+    """Quote argument for shlex.split on the other side"""
+    if arg and all(c.isalnum() or c in '-_.,:=@/+' for c in arg):
+        return arg
+    return "'" + arg.replace("'", "'\"'\"'") + "'"
+
+def main():
+    parser = argparse.ArgumentParser(description="Send a command to tn-cli.py --daemon.",
+        usage="%(prog)s [--socket SOCKET] command [args...] | --events")
+    parser.add_argument('--socket', default=os.environ.get('TN_CLI_SOCKET', DEFAULT_SOCKET),
+        help='socket of the daemon, $TN_CLI_SOCKET or ~/.tinode/tn-cli.sock by default')
+    parser.add_argument('--timeout', type=float, default=30, help='seconds to wait for the responses, 0 to wait forever; default 30')
+    parser.add_argument('--events', action='store_true', help='print server messages which are not responses to commands until interrupted')
+    parser.add_argument('command', nargs=argparse.REMAINDER, help='tn-cli command, e.g. pub grpXXX "hello"')
+    args = parser.parse_args()
+    if not args.events and not args.command:
+        parser.error("no command")
+
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(args.socket)
+    except (IOError, OSError) as err:
+        print("Cannot connect to the daemon at", args.socket, err, file=sys.stderr)
+        return 2
+    line = '.events' if args.events else ' '.join(quote(arg) for arg in args.command)
+    conn.sendall((line + "\n").encode('utf-8'))
+    if not args.events and args.timeout > 0:
+        conn.settimeout(args.timeout)
+
+    failed = False
+    try:
+        for line in conn.makefile('rb'):
+            obj = json.loads(line.decode('utf-8'))
+            if 'output' in obj:
+                # Messages of the command, help or errors of the command parser.
+                sys.stderr.write(obj['output'])
+                failed = failed or obj.get('error', False)
+                continue
+            if obj.get('ctrl', {}).get('code', 200) >= 400:
+                failed = True
+            sys.stdout.write(line.decode('utf-8'))
+            sys.stdout.flush()
+    except socket.timeout:
+        print("No response in %g seconds" % args.timeout, file=sys.stderr)
+        failed = True
+    except KeyboardInterrupt:
+        pass
+    finally:
+        conn.close()
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,322 @@
+"""Full-text search over Tinode message history in a local SQLite database.
+
+The indexer fetches the history of the topics with {get what="data"}, keeps indexing new
+messages as they arrive and removes deleted ones. Search runs against the local database.
+
+Topics are indexed under the names the server uses internally, which are the same for
+all users: p2p topics as 'p2p...' rather than by the ID of the peer. The ID of the user
+who indexed the history is saved, so searches may name p2p topics either way.
+"""
+
+from __future__ import print_function
+
+import argparse
+import base64
+from concurrent import futures
+import json
+import sqlite3
+import sys
+import threading
+import time
+
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+from tinode_grpc import pb
+from tinode_grpc import drafty
+from tinode_grpc import plugin
+from tinode_grpc.session import Session
+from tinode_grpc.virtual import internal_name
+
+APP_NAME = "tn-search/1.0.0"
+
+# Number of messages requested with one {get}.
+PAGE_SIZE = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages(
+    id INTEGER PRIMARY KEY,
+    topic TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    from_user TEXT,
+    ts INTEGER,
+    content TEXT,
+    UNIQUE(topic, seq));
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(content, content='messages',
+    content_rowid='id', tokenize='unicode61 remove_diacritics 2');
+CREATE TRIGGER IF NOT EXISTS messages_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts(rowid, content) VALUES (new.id, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_ad AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts(messages_fts, rowid, content) VALUES ('delete', old.id, old.content);
+END;
+CREATE TABLE IF NOT EXISTS topics(
+    topic TEXT PRIMARY KEY,
+    -- Messages up to this seq id are indexed.
+    high INTEGER NOT NULL DEFAULT 0,
+    -- Deletions up to this del id are applied.
+    del_id INTEGER NOT NULL DEFAULT 0);
+CREATE TABLE IF NOT EXISTS settings(
+    name TEXT PRIMARY KEY,
+    value TEXT);
+"""
+
+def open_db(file_name):
+    db = sqlite3.connect(file_name)
+    db.execute('PRAGMA journal_mode=WAL')
+    db.execute('PRAGMA synchronous=NORMAL')
+    db.executescript(SCHEMA)
+    return db
+
+def message_row(topic, data):
+    text = drafty.convert(data.content)
+    if text == None:
+        text = data.content.decode('utf-8', 'replace')
+    return (topic, data.seq_id, data.from_user_id, data.timestamp or None, text)
+
+def peer_of(user_id, topic):
+    """Name of the p2p topic as the user sees it, i.e. the ID of the other party, or None
+    if the user is not a party"""
+    if not user_id or not topic.startswith('p2p'):
+        return None
+    try:
+        pair = base64.urlsafe_b64decode((topic[3:] + '==').encode('ascii'))
+    except (TypeError, ValueError):
+        return None
+    for peer in (pair[:8], pair[8:]):
+        name = 'usr' + base64.urlsafe_b64encode(peer).decode('ascii').rstrip('=')
+        if name != user_id and internal_name(user_id, name) == topic:
+            return name
+    return None
+
+def get_setting(db, name):
+    row = db.execute('SELECT value FROM settings WHERE name=?', (name,)).fetchone()
+    return row[0] if row else None
+
+class Indexer(object):
+    """Owns the database connection. Updates are queued by any thread and written in
+    batched transactions by the thread which calls run()."""
+    def __init__(self, db, batch_size=1000, flush_interval=1):
+        self.db = db
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.updates = queue.Queue()
+        self.indexed = 0
+        # The user whose session fetches history: names of topics it gets are converted
+        # to internal names.
+        self.user_id = None
+
+    def topics(self):
+        """Indexing state as {topic: (high, del_id)}"""
+        return dict((row[0], (row[1], row[2])) for row in self.db.execute('SELECT topic, high, del_id FROM topics'))
+
+    def name(self, topic):
+        """Internal name of the topic"""
+        return internal_name(self.user_id, topic) if self.user_id else topic
+
+    def set_user(self, user_id):
+        self.user_id = user_id
+        self.updates.put(('user', user_id))
+
+    def add(self, data):
+        self.updates.put(('add', message_row(self.name(data.topic), data)))
+
+    def delete(self, topic, del_id, ranges):
+        self.updates.put(('del', (self.name(topic), del_id, [(r.low, r.hi or r.low + 1) for r in ranges])))
+
+    def set_high(self, topic, high):
+        self.updates.put(('high', (self.name(topic), high)))
+
+    def stop(self):
+        self.updates.put(None)
+
+    def run(self):
+        """Write updates until stop() is called"""
+        while True:
+            pending = 0
+            deadline = time.time() + self.flush_interval
+            update = self.updates.get()
+            with self.db:
+                while update != None:
+                    pending += self._apply(update)
+                    if pending >= self.batch_size or time.time() >= deadline:
+                        break
+                    try:
+                        update = self.updates.get(timeout=max(0, deadline - time.time()))
+                    except queue.Empty:
+                        break
+            self.indexed += pending
+            if update == None:
+                return
+
+    def _apply(self, update):
+        kind, args = update
+        if kind == 'user':
+            self.db.execute("INSERT OR REPLACE INTO settings(name, value) VALUES ('user', ?)", (args,))
+            return 0
+        if kind == 'add':
+            self.db.execute('INSERT OR IGNORE INTO messages(topic, seq, from_user, ts, content) VALUES (?, ?, ?, ?, ?)', args)
+            return 1
+        topic = args[0]
+        self.db.execute('INSERT OR IGNORE INTO topics(topic) VALUES (?)', (topic,))
+        if kind == 'high':
+            self.db.execute('UPDATE topics SET high=max(high, ?) WHERE topic=?', (args[1], topic))
+        else:
+            for low, hi in args[2]:
+                self.db.execute('DELETE FROM messages WHERE topic=? AND seq>=? AND seq<?', (topic, low, hi))
+            self.db.execute('UPDATE topics SET del_id=max(del_id, ?) WHERE topic=?', (args[1], topic))
+        return 0
+
+    # Plugin.Message handler. Topics are named by their internal names already.
+    def message(self, event):
+        if event.action == pb.CREATE:
+            self.updates.put(('add', message_row(event.msg.topic, event.msg)))
+
+def on_message(indexer, msg):
+    """Index messages which arrive after the history is fetched"""
+    if msg.HasField('data'):
+        indexer.add(msg.data)
+    elif msg.HasField('pres') and msg.pres.what == pb.ServerPres.DEL:
+        indexer.delete(msg.pres.topic, msg.pres.del_id, msg.pres.del_seq)
+
+def fetch_history(session, indexer, topic, high, del_id):
+    """Subscribe to the topic, index messages newer than high and apply deletions after del_id"""
+    session.call('sub', pb.ClientSub(topic=topic))
+    last = session.call('get', pb.ClientGet(topic=topic, query=pb.GetQuery(what='desc')))[0].desc.seq_id
+    # Pages go from the newest message back to the last one indexed earlier.
+    before = last + 1
+    while before > high + 1:
+        page = session.call('get', pb.ClientGet(topic=topic, query=pb.GetQuery(what='data',
+            data=pb.GetOpts(since_id=high + 1, before_id=before, limit=PAGE_SIZE))))
+        for data in page:
+            indexer.add(data)
+        if not page:
+            break
+        before = min(data.seq_id for data in page)
+    indexer.set_high(topic, last)
+
+    # GetQuery has no options for 'del', so all deleted ranges are returned. They are
+    # applied only if something was deleted since the last run.
+    for meta in session.call('get', pb.ClientGet(topic=topic, query=pb.GetQuery(what='del'))):
+        if meta.HasField('del'):
+            # Field named 'del' conflicts with the keyword 'del'.
+            deleted = getattr(meta, 'del')
+            if deleted.del_id > del_id:
+                indexer.delete(topic, deleted.del_id, deleted.del_seq)
+    return last
+
+def search(db, query, topic=None, limit=20):
+    """Returns (topic, seq, from_user, ts, snippet) of the best matches. topic is the
+    internal name."""
+    sql = "SELECT m.topic, m.seq, m.from_user, m.ts, snippet(messages_fts, 0, '[', ']', '...', 12) " \
+        "FROM messages_fts JOIN messages m ON m.id = messages_fts.rowid WHERE messages_fts MATCH ?"
+    params = [query]
+    if topic != None:
+        sql += " AND m.topic = ?"
+        params.append(topic)
+    sql += " ORDER BY rank LIMIT ?"
+    params.append(limit)
+    return db.execute(sql, params).fetchall()
+
+def subscribed_topics(session):
+    session.call('sub', pb.ClientSub(topic='me'))
+    topics = []
+    for meta in session.call('get', pb.ClientGet(topic='me', query=pb.GetQuery(what='sub'))):
+        topics.extend(sub.topic for sub in meta.sub)
+    return topics
+
+def run_indexer(args):
+    db = open_db(args.db)
+    indexer = Indexer(db, args.batch_size)
+    state = indexer.topics()
+
+    server = None
+    if args.listen:
+        # New messages are reported by the server through the Plugin API.
+        server = plugin.serve(args.listen, [indexer])
+        print("Plugin listening at", args.listen)
+
+    session = None
+    if args.login_basic or args.login_token:
+        session = Session(args.host, lambda msg: on_message(indexer, msg))
+        if args.login_token:
+            params = session.login(APP_NAME, 'token', args.login_token.encode('ascii'))
+        else:
+            params = session.login(APP_NAME, 'basic', args.login_basic.encode('utf-8'))
+        indexer.set_user(json.loads(params['user'].decode('utf-8')))
+        topics = args.topic or subscribed_topics(session)
+
+        def fetch_all():
+            pool = futures.ThreadPoolExecutor(max_workers=args.concurrency)
+            jobs = dict((pool.submit(fetch_history, session, indexer, topic,
+                *state.get(indexer.name(topic), (0, 0))), topic) for topic in topics)
+            for job in futures.as_completed(jobs):
+                try:
+                    job.result()
+                except Exception as err:
+                    print("Failed to fetch", jobs[job], err)
+            pool.shutdown()
+            print("History of", len(topics), "topics fetched, indexed", indexer.indexed, "messages")
+
+        fetcher = threading.Thread(target=fetch_all)
+        fetcher.daemon = True
+        fetcher.start()
+
+    if server == None and session == None:
+        print("Error: nothing to index, use --login-basic, --login-token or --listen")
+        return
+
+    try:
+        indexer.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if session != None:
+            session.close()
+        if server != None:
+            server.stop(0)
+
+def run_search(args):
+    db = open_db(args.db)
+    user_id = get_setting(db, 'user')
+    topic = args.topic
+    if topic != None and user_id:
+        topic = internal_name(user_id, topic)
+    started = time.time()
+    rows = search(db, args.query, topic, args.limit)
+    for topic, seq, from_user, ts, snippet in rows:
+        # Show p2p topics of the user by the ID of the peer.
+        topic = peer_of(user_id, topic) or topic
+        when = time.strftime('%Y-%m-%d %H:%M', time.localtime(ts / 1000.0)) if ts else ''
+        print("%s #%d %s %s: %s" % (topic, seq, when, from_user, snippet))
+    print("%d found in %.1f ms" % (len(rows), (time.time() - started) * 1000))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Full-text search over Tinode message history.")
+    parser.add_argument('--db', default='tn-search.db', help='SQLite database file')
+    commands = parser.add_subparsers(dest='cmd')
+
+    index = commands.add_parser('index', help='fetch history, then keep indexing new messages')
+    index.add_argument('--host', default='localhost:6061', help='address of Tinode server')
+    index.add_argument('--login-basic', help='login using basic authentication username:password')
+    index.add_argument('--login-token', help='login using token authentication')
+    index.add_argument('--topic', action='append', help='topic to index, may be repeated; default: all topics the user is subscribed to')
+    index.add_argument('--listen', help='address to listen on for Plugin.Message calls from the server')
+    index.add_argument('--concurrency', type=int, default=8, help='number of topics to fetch at once')
+    index.add_argument('--batch-size', type=int, default=1000, help='messages per transaction')
+
+    find = commands.add_parser('search', help='search indexed messages')
+    find.add_argument('query', help='FTS5 query, e.g. "hello world" or "hel*"')
+    find.add_argument('--topic', help='search in one topic only')
+    find.add_argument('--limit', type=int, default=20, help='maximum number of results')
+
+    args = parser.parse_args()
+    if args.cmd == 'index':
+        run_indexer(args)
+    elif args.cmd == 'search':
+        run_search(args)
+    else:
+        parser.print_help()
+        sys.exit(1)